@@ -0,0 +1,6 @@
+def __getattr__(name: str):
+    # core.fastpath() lives with the quantity classes, which are only imported on first use
+    if name == 'fastpath':
+        from core.physical_quantities import fastpath
+        return fastpath
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,57 @@
+"""Compiles every conversion_tables/*.json file into a single Python module.
+
+The generated module holds the raw tables together with the unit indices and
+precomputed factor matrices, so short-lived processes can start without
+parsing any JSON. It is only used while it is newer than all JSON sources.
+
+Usage:
+    python -m core.build_conversion_tables [--output PATH] [--tables-directory PATH]
+"""
+import argparse
+import os
+import pprint
+from .conversion_managers import CONVERSION_TABLES_DIRECTORY, COMPILED_TABLES_FILEPATH, compile_conversion_matrix
+from .utilities.json_utilities import json_to_dict
+
+HEADER = '# Generated by core/build_conversion_tables.py from conversion_tables/*.json. Do not edit.\n'
+
+
+def build_compiled_tables(output_filepath: str = COMPILED_TABLES_FILEPATH, tables_directory: str = CONVERSION_TABLES_DIRECTORY) -> str:
+    """Generates the compiled conversion tables module.
+
+    Args:
+        output_filepath (str, optional): Destination of the module. Defaults to COMPILED_TABLES_FILEPATH.
+        tables_directory (str, optional): Directory with the JSON tables. Defaults to CONVERSION_TABLES_DIRECTORY.
+
+    Returns:
+        str: Path of the generated module
+    """
+    conversion_tables = {}
+    conversion_matrices = {}
+    for filename in sorted(os.listdir(tables_directory)):
+        if not filename.endswith('.json'):
+            continue
+        table_name = filename[:-len('.json')]
+        conversion_table = json_to_dict(os.path.join(tables_directory, filename))
+        conversion_tables[table_name] = conversion_table
+        conversion_matrices[table_name] = compile_conversion_matrix(table_name, conversion_table).to_compiled()
+
+    source = (
+        HEADER
+        + f'CONVERSION_TABLES = {pprint.pformat(conversion_tables, sort_dicts=False)}\n\n'
+        + f'CONVERSION_MATRICES = {pprint.pformat(conversion_matrices, sort_dicts=False)}\n'
+    )
+    # Write next to the destination and swap it in, so readers never see a partial file
+    temporary_filepath = f'{output_filepath}.tmp'
+    with open(temporary_filepath, 'w', encoding='utf-8') as file:
+        file.write(source)
+    os.replace(temporary_filepath, output_filepath)
+    return output_filepath
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compile the JSON conversion tables into a single Python module.')
+    parser.add_argument('--output', default=COMPILED_TABLES_FILEPATH, help='Path of the generated module')
+    parser.add_argument('--tables-directory', default=CONVERSION_TABLES_DIRECTORY, help='Directory with the JSON tables')
+    arguments = parser.parse_args()
+    print(f'Compiled conversion tables written to: {build_compiled_tables(arguments.output, arguments.tables_directory)}')
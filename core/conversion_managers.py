@@ -1,7 +1,502 @@
 import os
 import json
-from .utilities.json_utilities import json_to_dict, dict_to_json_string
-from .unit import Unit
+import importlib.util
+import math
+import numbers
+import operator
+import threading
+from fractions import Fraction
+from functools import partial
+from types import MappingProxyType, ModuleType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+from .utilities.json_utilities import json_to_dict
+from .unit import Unit, find_unit_type_by_symbol
+
+CONVERSION_TABLES_DIRECTORY: str = os.path.join(os.path.dirname(__file__), '../conversion_tables')
+# Generated by core.build_conversion_tables; used instead of the JSON files while up to date
+COMPILED_TABLES_FILEPATH: str = os.path.join(os.path.dirname(__file__), '_compiled_conversion_tables.py')
+
+# =========================================================
+# Shared conversion-table registry
+# =========================================================
+# Each table is parsed from disk only the first time it is requested and then
+# shared (read-only) by every conversion manager and quantity in the process.
+
+# Quantity types whose conversion table file has a different name
+_CONVERSION_TABLE_FILENAMES: Dict[str, str] = {
+    'resistance': 'electrical_resistance',
+}
+
+_CONVERSION_TABLES: Dict[str, Mapping[str, Any]] = {}
+_CONVERSION_MATRICES: Dict[str, "ConversionMatrix"] = {}
+_CONVERSION_MANAGERS: Dict[str, "BaseConversionManager"] = {}
+_CONVERSION_TABLES_LOCK = threading.RLock()
+_NOT_LOADED = object()
+_COMPILED_TABLES: Any = _NOT_LOADED
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively wraps dictionaries into read-only mapping proxies."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def load_compiled_tables(filepath: str = COMPILED_TABLES_FILEPATH, tables_directory: str = CONVERSION_TABLES_DIRECTORY) -> Optional[ModuleType]:
+    """Loads the precompiled conversion tables module.
+
+    Args:
+        filepath (str, optional): Path of the generated module. Defaults to COMPILED_TABLES_FILEPATH.
+        tables_directory (str, optional): Directory of the JSON sources. Defaults to CONVERSION_TABLES_DIRECTORY.
+
+    Returns:
+        Optional[ModuleType]: The compiled module, or None if it does not exist or
+        is older than any of the JSON files it was generated from
+    """
+    try:
+        artifact_mtime = os.stat(filepath).st_mtime
+    except FileNotFoundError:
+        return None
+    with os.scandir(tables_directory) as entries:
+        for entry in entries:
+            if entry.name.endswith('.json') and entry.stat().st_mtime > artifact_mtime:
+                return None
+    spec = importlib.util.spec_from_file_location('core._compiled_conversion_tables', filepath)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _get_compiled_tables() -> Optional[ModuleType]:
+    global _COMPILED_TABLES
+    if _COMPILED_TABLES is _NOT_LOADED:
+        with _CONVERSION_TABLES_LOCK:
+            if _COMPILED_TABLES is _NOT_LOADED:
+                _COMPILED_TABLES = load_compiled_tables()
+    return _COMPILED_TABLES
+
+
+def _load_conversion_table(quantity_type: str) -> Mapping[str, Any]:
+    table_name: str = _CONVERSION_TABLE_FILENAMES.get(quantity_type, quantity_type)
+    compiled_tables = _get_compiled_tables()
+    if compiled_tables is not None and table_name in compiled_tables.CONVERSION_TABLES:
+        return _freeze(compiled_tables.CONVERSION_TABLES[table_name])
+    filename: str = f'{table_name}.json'
+    conversions_filepath: str = os.path.join(CONVERSION_TABLES_DIRECTORY, filename)
+    try:
+        conversion_table = json_to_dict(conversions_filepath)
+    except FileNotFoundError:
+        raise Exception(f'File "{conversions_filepath}" does not exist')
+    except json.JSONDecodeError:
+        raise Exception(f'Error decoding JSON from file "{conversions_filepath}"')
+    except Exception as e:
+        raise Exception(f'An error occurred while loading "{filename}": {str(e)}')
+    return _freeze(conversion_table)
+
+
+def get_conversion_table(quantity_type: str) -> Mapping[str, Any]:
+    """Returns the shared conversion table for a quantity type.
+
+    The table is loaded lazily on first use and cached for the lifetime of the
+    process, so subsequent calls cost a single dictionary lookup.
+
+    Args:
+        quantity_type (str): Name of the table (e.g. 'length')
+
+    Returns:
+        Mapping[str, Any]: Read-only view of the conversion table
+    """
+    table = _CONVERSION_TABLES.get(quantity_type)
+    if table is None:
+        with _CONVERSION_TABLES_LOCK:
+            # Another thread may have loaded it while we were waiting
+            table = _CONVERSION_TABLES.get(quantity_type)
+            if table is None:
+                table = _load_conversion_table(quantity_type)
+                _CONVERSION_TABLES[quantity_type] = table
+    return table
+
+
+class AffineTransform:
+    """Conversion of the form y = x * scale + offset.
+
+    Works with plain numbers as well as with any array type that supports
+    scalar multiplication and addition (e.g. NumPy arrays).
+    """
+
+    __slots__ = ('_scale', '_offset')
+
+    def __init__(self, scale: float, offset: float = 0.0) -> None:
+        self._scale = scale
+        self._offset = offset
+
+    def __call__(self, value):
+        return value * self._scale + self._offset
+
+    def __repr__(self) -> str:
+        return f'AffineTransform(scale={self._scale}, offset={self._offset})'
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AffineTransform):
+            return NotImplemented
+        return self._scale == other._scale and self._offset == other._offset
+
+    def __hash__(self) -> int:
+        return hash((self._scale, self._offset))
+
+    @property
+    def scale(self) -> float:
+        return self._scale
+
+    @property
+    def offset(self) -> float:
+        return self._offset
+
+    @property
+    def is_linear(self) -> bool:
+        return self._offset == 0
+
+
+class ConversionMatrix:
+    """Dense from->to factor matrix compiled from a linear conversion table.
+
+    Every unit of the table gets an integer index, and factors[i][j] holds the
+    number that converts a value in unit i to unit j, so a conversion is a
+    single lookup plus a multiplication.
+    """
+
+    __slots__ = ('_quantity_type', '_symbols', '_unit_indices', '_to_base', '_factors')
+
+    def __init__(self, quantity_type: str, conversion_table: Mapping[str, float]) -> None:
+        self._quantity_type = quantity_type
+        self._symbols: Tuple[str, ...] = tuple(conversion_table)
+        self._unit_indices: Mapping[str, int] = MappingProxyType(
+            {symbol: index for index, symbol in enumerate(self._symbols)}
+        )
+        self._to_base: Tuple[float, ...] = tuple(float(conversion_table[symbol]) for symbol in self._symbols)
+        self._factors: Tuple[Tuple[float, ...], ...] = tuple(
+            tuple(from_base / to_base_factor for to_base_factor in self._to_base) for from_base in self._to_base
+        )
+
+    def __contains__(self, unit: Unit) -> bool:
+        return unit.symbol in self._unit_indices
+
+    @classmethod
+    def from_compiled(cls, quantity_type: str, compiled: Tuple) -> "ConversionMatrix":
+        """Rebuilds a matrix from the output of to_compiled() without recomputing any factor."""
+        matrix = cls.__new__(cls)
+        matrix._quantity_type = quantity_type
+        _, matrix._symbols, matrix._to_base, matrix._factors = compiled
+        matrix._unit_indices = MappingProxyType({symbol: index for index, symbol in enumerate(matrix._symbols)})
+        return matrix
+
+    def to_compiled(self) -> Tuple:
+        return ('linear', self._symbols, self._to_base, self._factors)
+
+    def __repr__(self) -> str:
+        return f'ConversionMatrix(quantity_type={self._quantity_type}, units={self._symbols})'
+
+    @property
+    def symbols(self) -> Tuple[str, ...]:
+        return self._symbols
+
+    @property
+    def factors(self) -> Tuple[Tuple[float, ...], ...]:
+        return self._factors
+
+    def index_of(self, unit: Unit) -> int:
+        """Returns the integer index of a unit inside the matrix."""
+        try:
+            return self._unit_indices[unit.symbol]
+        except KeyError:
+            raise ValueError(f'Unknown unit: {unit.symbol}') from None
+
+    def factor_by_index(self, from_index: int, to_index: int) -> float:
+        return self._factors[from_index][to_index]
+
+    def base_factor(self, symbol: str) -> float:
+        """Returns the factor that converts the unit with the given symbol into the base unit of the table."""
+        return self._to_base[self._unit_indices[symbol]]
+
+    def factor(self, from_unit: Unit, to_unit: Unit) -> float:
+        """Returns the multiplicative factor that converts from_unit into to_unit."""
+        indices = self._unit_indices
+        if from_unit.symbol not in indices:
+            raise ValueError(f'Unknown from unit: {from_unit.symbol}')
+        if to_unit.symbol not in indices:
+            raise ValueError(f'Unknown to unit: {to_unit.symbol}')
+        return self._factors[indices[from_unit.symbol]][indices[to_unit.symbol]]
+
+    def transform(self, from_unit: Unit, to_unit: Unit) -> AffineTransform:
+        return AffineTransform(self.factor(from_unit, to_unit))
+
+
+class AffineConversionMatrix:
+    """Precomposed from->to affine transforms compiled from an affine conversion table.
+
+    Each table entry describes how to reach the base unit of the table as an
+    {"offset": o, "scale": s} pair, meaning base = (value + o) * s. Entries are
+    validated when the table is compiled and every unit pair is composed into a
+    single AffineTransform, so a conversion is one multiply-add.
+    """
+
+    __slots__ = ('_quantity_type', '_symbols', '_unit_indices', '_to_base', '_transforms')
+
+    def __init__(self, quantity_type: str, conversion_table: Mapping[str, Mapping[str, float]]) -> None:
+        self._quantity_type = quantity_type
+        self._symbols: Tuple[str, ...] = tuple(conversion_table)
+        self._unit_indices: Mapping[str, int] = MappingProxyType(
+            {symbol: index for index, symbol in enumerate(self._symbols)}
+        )
+        entries = [self._validate_entry(symbol, conversion_table[symbol]) for symbol in self._symbols]
+        self._to_base: Tuple[AffineTransform, ...] = tuple(
+            AffineTransform(float(scale), float(offset * scale)) for offset, scale in entries
+        )
+        self._transforms: Tuple[Tuple[AffineTransform, ...], ...] = tuple(
+            tuple(self._compose(from_entry, to_entry) for to_entry in entries) for from_entry in entries
+        )
+
+    def _validate_entry(self, symbol: str, entry: Any) -> Tuple[Fraction, Fraction]:
+        if not isinstance(entry, Mapping) or set(entry) != {'scale', 'offset'}:
+            raise ValueError(f'Invalid {self._quantity_type} conversion entry for "{symbol}": expected {{"offset", "scale"}}')
+        scale, offset = entry['scale'], entry['offset']
+        for name, number in (('scale', scale), ('offset', offset)):
+            if isinstance(number, bool) or not isinstance(number, numbers.Real) or not math.isfinite(number):
+                raise ValueError(f'Invalid {name} for "{symbol}": {number!r}')
+        if scale == 0:
+            raise ValueError(f'Scale for "{symbol}" must be different from zero (0)')
+        return _to_fraction(offset), _to_fraction(scale)
+
+    @staticmethod
+    def _compose(from_entry: Tuple[Fraction, Fraction], to_entry: Tuple[Fraction, Fraction]) -> AffineTransform:
+        # base = (x + from_offset) * from_scale and y = base / to_scale - to_offset
+        # Composition is done with exact fractions so that round trips such as
+        # 100 °C -> 212 °F do not accumulate floating-point error
+        from_offset, from_scale = from_entry
+        to_offset, to_scale = to_entry
+        scale = from_scale / to_scale
+        return AffineTransform(float(scale), float(from_offset * scale - to_offset))
+
+    def __repr__(self) -> str:
+        return f'AffineConversionMatrix(quantity_type={self._quantity_type}, units={self._symbols})'
+
+    def __contains__(self, unit: Unit) -> bool:
+        return unit.symbol in self._unit_indices
+
+    @classmethod
+    def from_compiled(cls, quantity_type: str, compiled: Tuple) -> "AffineConversionMatrix":
+        """Rebuilds a matrix from the output of to_compiled() without recomputing any transform."""
+        matrix = cls.__new__(cls)
+        matrix._quantity_type = quantity_type
+        _, matrix._symbols, to_base, transforms = compiled
+        matrix._to_base = tuple(AffineTransform(scale, offset) for scale, offset in to_base)
+        matrix._transforms = tuple(tuple(AffineTransform(scale, offset) for scale, offset in row) for row in transforms)
+        matrix._unit_indices = MappingProxyType({symbol: index for index, symbol in enumerate(matrix._symbols)})
+        return matrix
+
+    def to_compiled(self) -> Tuple:
+        return (
+            'affine',
+            self._symbols,
+            tuple((transform.scale, transform.offset) for transform in self._to_base),
+            tuple(tuple((transform.scale, transform.offset) for transform in row) for row in self._transforms),
+        )
+
+    def base_transform(self, symbol: str) -> AffineTransform:
+        """Returns the transform that converts the unit with the given symbol into the base unit of the table."""
+        return self._to_base[self._unit_indices[symbol]]
+
+    @property
+    def symbols(self) -> Tuple[str, ...]:
+        return self._symbols
+
+    def index_of(self, unit: Unit) -> int:
+        """Returns the integer index of a unit inside the matrix."""
+        try:
+            return self._unit_indices[unit.symbol]
+        except KeyError:
+            raise ValueError(f'Unknown unit: {unit.symbol}') from None
+
+    def transform_by_index(self, from_index: int, to_index: int) -> AffineTransform:
+        return self._transforms[from_index][to_index]
+
+    def transform(self, from_unit: Unit, to_unit: Unit) -> AffineTransform:
+        """Returns the affine transform that converts from_unit into to_unit."""
+        indices = self._unit_indices
+        if from_unit.symbol not in indices:
+            raise ValueError(f'Unknown from unit: {from_unit.symbol}')
+        if to_unit.symbol not in indices:
+            raise ValueError(f'Unknown to unit: {to_unit.symbol}')
+        return self._transforms[indices[from_unit.symbol]][indices[to_unit.symbol]]
+
+    def factor(self, from_unit: Unit, to_unit: Unit) -> float:
+        """Returns the conversion factor between two units, if their transform has no offset."""
+        transform = self.transform(from_unit, to_unit)
+        if not transform.is_linear:
+            raise ValueError(f'Conversion from {from_unit.symbol} to {to_unit.symbol} is affine and cannot be expressed as a single factor')
+        return transform.scale
+
+
+def _to_fraction(number: float) -> Fraction:
+    """Converts a table number into the exact fraction it most likely stands for (e.g. 0.5555555555555556 -> 5/9)."""
+    candidate = Fraction(number).limit_denominator(1000000)
+    if float(candidate) == number:
+        return candidate
+    return Fraction(repr(number))
+
+
+def _is_affine_table(conversion_table: Mapping[str, Any]) -> bool:
+    return any(isinstance(entry, Mapping) for entry in conversion_table.values())
+
+
+def compile_conversion_matrix(quantity_type: str, conversion_table: Mapping[str, Any]) -> ConversionMatrix | AffineConversionMatrix:
+    """Compiles a conversion table into the matrix type that matches its entries."""
+    if _is_affine_table(conversion_table):
+        return AffineConversionMatrix(quantity_type, conversion_table)
+    return ConversionMatrix(quantity_type, conversion_table)
+
+
+def get_conversion_matrix(quantity_type: str) -> ConversionMatrix | AffineConversionMatrix:
+    """Returns the shared, precompiled conversion matrix for a quantity type."""
+    matrix = _CONVERSION_MATRICES.get(quantity_type)
+    if matrix is None:
+        with _CONVERSION_TABLES_LOCK:
+            matrix = _CONVERSION_MATRICES.get(quantity_type)
+            if matrix is None:
+                table_name = _CONVERSION_TABLE_FILENAMES.get(quantity_type, quantity_type)
+                compiled_tables = _get_compiled_tables()
+                if compiled_tables is not None and table_name in compiled_tables.CONVERSION_MATRICES:
+                    compiled = compiled_tables.CONVERSION_MATRICES[table_name]
+                    matrix_class = AffineConversionMatrix if compiled[0] == 'affine' else ConversionMatrix
+                    matrix = matrix_class.from_compiled(quantity_type, compiled)
+                else:
+                    matrix = compile_conversion_matrix(quantity_type, get_conversion_table(quantity_type))
+                _CONVERSION_MATRICES[quantity_type] = matrix
+    return matrix
+
+
+# =========================================================
+# Compound units
+# =========================================================
+# Units built with Unit.__mul__, __truediv__ and __pow__ (e.g. kW*hour) are
+# resolved term by term into the base units of each table. The resulting
+# composite factor is cached by the canonical term tuple of the unit.
+
+_COMPOSITE_FACTORS: Dict[Tuple[Tuple[str, Fraction], ...], float] = {}
+
+
+def _term_base_factor(symbol: str, exponent: Fraction, is_single_term: bool) -> float:
+    quantity_type = find_unit_type_by_symbol(symbol)
+    if quantity_type is None:
+        raise ValueError(f'Unknown unit: {symbol}')
+    try:
+        matrix = get_conversion_matrix(quantity_type)
+    except Exception:
+        raise ValueError(f'No conversion table available for unit: {symbol}') from None
+    if isinstance(matrix, AffineConversionMatrix):
+        transform = matrix.base_transform(symbol)
+        # Inside derived units (e.g. W/°C) only the size of the degree matters
+        if is_single_term and exponent == 1 and not transform.is_linear:
+            raise ValueError(f'Unit {symbol} needs an affine conversion and cannot be used as a compound unit')
+        return transform.scale
+    return matrix.base_factor(symbol)
+
+
+def composite_factor(unit: Unit) -> float:
+    """Returns the factor that converts a (possibly compound) unit into the base units of its terms.
+
+    For example kW*hour resolves to 1000 * 3600 = 3.6e6 (joules). The result is
+    cached, so repeated conversions with the same compound unit are O(1).
+
+    Raises:
+        ValueError: If any term of the unit has no conversion table
+    """
+    terms = unit.terms
+    factor = _COMPOSITE_FACTORS.get(terms)
+    if factor is None:
+        factor = 1.0
+        is_single_term = len(terms) == 1
+        for symbol, exponent in terms:
+            base_factor = _term_base_factor(symbol, exponent, is_single_term)
+            factor *= base_factor ** exponent
+        _COMPOSITE_FACTORS[terms] = factor
+    return factor
+
+
+def base_scale(unit: Unit) -> float:
+    """Returns the size of a (possibly compound) unit in the base units of its terms.
+
+    Unlike composite_factor, temperature units resolve to the size of their
+    degree instead of being refused, so K, °C and °C*s all have a scale.
+
+    Raises:
+        ValueError: If any term of the unit has no conversion table
+    """
+    scale = 1.0
+    for symbol, exponent in unit.terms:
+        scale *= _term_base_factor(symbol, exponent, False) ** exponent
+    return scale
+
+
+def base_transform(unit: Unit) -> AffineTransform:
+    """Returns the transform from a (possibly compound) unit into the coherent base units of its dimensions.
+
+    A single temperature unit keeps its offset (°C -> K is x + 273.15); every
+    other unit is a pure scale. Two compatible units therefore map equal
+    quantities onto the same base magnitude. The result is cached on the unit
+    itself, so it lives exactly as long as the (weakly interned) unit.
+
+    Raises:
+        ValueError: If any term of the unit has no conversion table
+    """
+    cached = unit._base_transform
+    if cached is not None:
+        return cached
+    terms = unit.terms
+    if len(terms) == 1 and terms[0][1] == 1:
+        symbol = terms[0][0]
+        quantity_type = find_unit_type_by_symbol(symbol)
+        if quantity_type is None:
+            raise ValueError(f'Unknown unit: {symbol}')
+        try:
+            matrix = get_conversion_matrix(quantity_type)
+        except Exception:
+            raise ValueError(f'No conversion table available for unit: {symbol}') from None
+        if isinstance(matrix, AffineConversionMatrix):
+            transform = matrix.base_transform(symbol)
+        else:
+            transform = AffineTransform(matrix.base_factor(symbol))
+    else:
+        transform = AffineTransform(base_scale(unit))
+    unit._base_transform = transform
+    return transform
+
+
+def compound_factor(from_unit: Unit, to_unit: Unit) -> float:
+    """Returns the factor that converts between two dimensionally compatible (possibly compound) units."""
+    if not from_unit.is_compatible_with(to_unit):
+        raise ValueError(f'Cannot convert between incompatible units: {from_unit} and {to_unit}')
+    return composite_factor(from_unit) / composite_factor(to_unit)
+
+
+def get_conversion_manager(quantity_type: str) -> "BaseConversionManager":
+    """Returns a shared conversion manager for a quantity type.
+
+    Managers are stateless once built, so a single instance per quantity type
+    can be reused by every quantity object.
+    """
+    manager = _CONVERSION_MANAGERS.get(quantity_type)
+    if manager is None:
+        with _CONVERSION_TABLES_LOCK:
+            manager = _CONVERSION_MANAGERS.get(quantity_type)
+            if manager is None:
+                if quantity_type == 'temperature':
+                    manager = TemperatureConversionManager()
+                else:
+                    manager = BaseConversionManager(quantity_type)
+                _CONVERSION_MANAGERS[quantity_type] = manager
+    return manager
+
 
 class BaseConversionManager:
     
@@ -14,41 +509,75 @@ class BaseConversionManager:
     
     def __init__(self, quantity_type: str):
         self._quantity_type = quantity_type
-        filename: str = f'../conversion_tables/{self._quantity_type}.json'
-        conversions_filepath: str = os.path.join(os.path.dirname(__file__), filename)
-        try: 
-            self._conversion_table = json_to_dict(conversions_filepath)
-        except FileNotFoundError:
-            raise Exception(f'File "{conversions_filepath}" does not exist')
-        except json.JSONDecodeError:
-            raise Exception(f'Error decoding JSON from file "{conversions_filepath}"')
-        except Exception as e:
-            raise Exception(f'An error occurred while loading "{filename}": {str(e)}')
+        self._conversion_table = get_conversion_table(quantity_type)
+
+    @property
+    def conversion_matrix(self) -> ConversionMatrix | AffineConversionMatrix:
+        return get_conversion_matrix(self._quantity_type)
+
+    def factor(self, from_unit: Unit, to_unit: Unit) -> float:
+        """Returns the multiplicative factor that converts from_unit into to_unit.
+
+        Units outside the conversion table (e.g. compound units such as
+        km/hour) are resolved through their registered terms.
+
+        Raises:
+            ValueError: If the units are incompatible or cannot be resolved
+        """
+        matrix = get_conversion_matrix(self._quantity_type)
+        if from_unit in matrix and to_unit in matrix:
+            return matrix.factor(from_unit, to_unit)
+        return compound_factor(from_unit, to_unit)
             
+    def transform(self, from_unit: Unit, to_unit: Unit) -> AffineTransform:
+        """Returns the conversion from from_unit into to_unit as an AffineTransform."""
+        matrix = get_conversion_matrix(self._quantity_type)
+        if from_unit in matrix and to_unit in matrix:
+            return matrix.transform(from_unit, to_unit)
+        return AffineTransform(compound_factor(from_unit, to_unit))
+
     def convert(self, value: float, from_unit: Unit, to_unit: Unit) -> float :
-        if from_unit.symbol not in self._conversion_table:
-            raise ValueError(f'Unknown from unit: {from_unit.symbol}')
-        if to_unit.symbol not in self._conversion_table:
-            raise ValueError(f'Unknown to unit: {to_unit.symbol}')
-    
-        # Convert to base unit (assumed to be defined in JSON with factor 1)
-        value_in_base = value * self._conversion_table[from_unit.symbol]
-        # Convert from base unit to target unit
-        return value_in_base / self._conversion_table[to_unit.symbol]
+        return value * self.factor(from_unit, to_unit)
+
+    def compile_converter(self, from_unit: Unit, to_unit: Unit) -> Callable[[float], float]:
+        """Resolves a conversion once and returns a plain callable that applies it.
+
+        Unit lookup and the dimensional check happen here, so the returned
+        callable does no validation at all and can be used in hot loops.
+        It also accepts NumPy arrays.
+
+        Raises:
+            ValueError: If the units are incompatible or not part of the conversion table
+        """
+        if not from_unit.is_compatible_with(to_unit):
+            raise ValueError(f'Cannot convert between incompatible units: {from_unit} and {to_unit}')
+        transform = self.transform(from_unit, to_unit)
+        if transform.is_linear:
+            return partial(operator.mul, transform.scale)
+        return transform
 
 
 class TemperatureConversionManager(BaseConversionManager):
     def __init__(self):
         super().__init__('temperature')
-    
+
     def convert(self, value: float, from_unit: Unit, to_unit: Unit) -> float:
-        if from_unit.symbol not in self._conversion_table.keys():
-            raise ValueError(f'Unknown from unit: {from_unit.symbol}')
-        if to_unit.symbol not in self._conversion_table.keys():
-            raise ValueError(f'Unknown to unit: {to_unit.symbol}')
+        # Temperature scales have different zeros, so a conversion is a multiply-add
+        return self.transform(from_unit, to_unit)(value)
+
+
+def compile_converter(from_unit: Unit, to_unit: Unit) -> Callable[[float], float]:
+    """Returns a fast callable converting values from from_unit into to_unit.
+
+    The conversion manager is chosen from the quantity type of from_unit;
+    compound units are resolved through their composite factors.
 
-        # Handle temperature conversion using lambdas
-        to_base = eval(self._conversion_table[from_unit.symbol]['to_base'])
-        from_base = eval(self._conversion_table[to_unit.symbol]['from_base'])
-        value_in_base = to_base(value)
-        return from_base(value_in_base)
+    Raises:
+        ValueError: If the units are incompatible or cannot be resolved
+    """
+    if not from_unit.is_compatible_with(to_unit):
+        raise ValueError(f'Cannot convert between incompatible units: {from_unit} and {to_unit}')
+    quantity_type = find_unit_type_by_symbol(from_unit.symbol)
+    if quantity_type is None:
+        return partial(operator.mul, compound_factor(from_unit, to_unit))
+    return get_conversion_manager(quantity_type).compile_converter(from_unit, to_unit)
@@ -1,25 +1,29 @@
 from .physical_quantities import ElectricCurrentQuantity, VoltageQuantity, FrequencyQuantity, AngleQuantity, BaseConversionManager
+from .unit import AngleUnits
 from math import isclose, sqrt, pi
 
 ABS_TOLERANCE_FROM_ZERO: float = 1e-6
 SQRT_2: float = 1.4142135623730950488
 
 
-def normalize_phase(phase_angle: AngleQuantity):
+def normalize_phase(phase_angle: AngleQuantity) -> AngleQuantity:
     """
     Normalize phase angle to be in the -180 to 180 degrees range
     Args:
         phase_angle (Angle): _description_
+    Returns:
+        AngleQuantity: New angle in the same unit (quantities are immutable)
     """
-    original_unit: str = phase_angle.unit
+    original_unit = phase_angle.unit
+    radian = AngleUnits.RADIAN.value
     conversion_manager = BaseConversionManager('angle')
-    phase_angle_rad = conversion_manager.convert(phase_angle.value, original_unit, 'rad')
+    phase_angle_rad = conversion_manager.convert(phase_angle.value, original_unit, radian)
     # Normalize phase to be within the range of -pi to pi radians
     while(phase_angle_rad <= -pi):
         phase_angle_rad += 2*pi
     while(phase_angle_rad > pi):
         phase_angle_rad -= 2*pi
-    phase_angle.value = conversion_manager.convert(phase_angle_rad, 'rad', original_unit)
+    return AngleQuantity(conversion_manager.convert(phase_angle_rad, radian, original_unit), original_unit)
     
 class AC_Voltage():
     def __init__(self, rms_value: VoltageQuantity, frequency: FrequencyQuantity, phase_angle: AngleQuantity = 0) -> None:
@@ -37,8 +41,7 @@ class AC_Voltage():
         self._rms_value = rms_value
         self._amplitude: VoltageQuantity = VoltageQuantity(rms_value.value * SQRT_2, rms_value.unit)
         self._frequency = frequency
-        normalize_phase(phase_angle)
-        self._phase_angle = phase_angle
+        self._phase_angle = normalize_phase(phase_angle)
         
     def __str__(self) -> str:
         return f'{self._rms_value} RMS @ {self._frequency} ϕ = {self._phase_angle}'
\ No newline at end of file
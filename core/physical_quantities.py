@@ -1,13 +1,45 @@
-import os
-import json
+import contextvars
+import math
+import numbers
+import operator
+from typing import Iterable, List, Tuple
 
 from core.utilities.json_utilities import json_string_to_dict, dict_to_json_string
-from core.conversion_managers import BaseConversionManager, TemperatureConversionManager
-from core.unit import *
+from core.conversion_managers import BaseConversionManager, base_transform, get_conversion_manager
+import core.unit as _units
+from core.unit import Dimensions, Unit, find_dimensions_by_unit_type, parse_unit
+from contextlib import contextmanager
 from functools import total_ordering
 
+__all__ = [
+    'BaseQuantity', 'LengthQuantity', 'MassQuantity', 'TemperatureQuantity', 'TimeQuantity',
+    'PowerQuantity', 'FrequencyQuantity', 'ForceQuantity', 'EnergyQuantity',
+    'ElectricChargeQuantity', 'VoltageQuantity', 'ElectricCurrentQuantity',
+    'ResistanceQuantity', 'AngleQuantity', 'VolumeQuantity', 'MassFlowRateQuantity',
+    'QuantityArray', 'PRECISION_TIERS', 'max_relative_error', 'QUANTITY_CLASS_BY_TYPE', 'find_quantity_class_by_dimensions', 'fastpath',
+]
+
+# True inside fastpath(): the operands were validated once, so add, sub and
+# comparisons skip their per-operation type and unit checks.
+_FASTPATH = contextvars.ContextVar('fastpath', default=False)
+
 @total_ordering
 class BaseQuantity:
+    """A value with an (interned) unit.
+
+    Instances only store those two fields in __slots__, plus the lazily
+    computed magnitude in coherent base units used by comparisons, hashing
+    and mixed-unit arithmetic. Quantities are immutable (value and unit are
+    read-only), so that hash stays valid; operations return new quantities.
+    The value and unit setters were removed for that reason: code that
+    assigned them must build a new quantity (or use convert_to) instead.
+    Conversions go through the conversion manager shared by every quantity
+    of the same quantity_type, which each subclass declares as a class
+    attribute.
+    """
+
+    __slots__ = ('_value', '_unit', '_base_value')
+    quantity_type: str = ''
     
     def __abs__(self) -> "BaseQuantity":
         return type(self)(abs(self._value), self._unit)
@@ -28,19 +60,33 @@ class BaseQuantity:
         if not self.unit.is_compatible_with(other.unit):
             raise ValueError(f'Cannot operate on incompatible units: {self.unit} and {other.unit}')
     
+    def _value_in_own_unit(self, other: "BaseQuantity") -> float:
+        # Value of other expressed in self's unit, taken from its cached base magnitude
+        if other._unit is self._unit:
+            return other._value
+        transform = base_transform(self._unit)
+        return (other.base_value - transform.offset) / transform.scale
+
     def __add__(self, other: "BaseQuantity") -> "BaseQuantity":
-        self._assert_compatible(other)
-        # Convert the other value to the same unit as self
-        other_converted = other.convert_to(self.unit)
-        new_value = self.value + other_converted.value
-        return type(self)(new_value, self.unit)
+        if not isinstance(other, BaseQuantity):
+            return NotImplemented
+        if not _FASTPATH.get():
+            self._assert_compatible(other)
+        # The result keeps the unit of self
+        return type(self)(self._value + self._value_in_own_unit(other), self._unit)
     
+    def __radd__(self, other) -> "BaseQuantity":
+        # Lets the builtin sum() start from 0; BaseQuantity.sum is faster for long iterables
+        if isinstance(other, numbers.Number) and other == 0:
+            return type(self)(self._value, self._unit)
+        return NotImplemented
+
     def __sub__(self, other: "BaseQuantity") -> "BaseQuantity":
-        self._assert_compatible(other)
-        # Convert the other value to the same unit as self
-        other_converted = other.convert_to(self.unit)
-        new_value = self.value - other_converted.value
-        return type(self)(new_value, self.unit)
+        if not isinstance(other, BaseQuantity):
+            return NotImplemented
+        if not _FASTPATH.get():
+            self._assert_compatible(other)
+        return type(self)(self._value - self._value_in_own_unit(other), self._unit)
     
     def __truediv__(self, other: "BaseQuantity"):
         if not isinstance(other, BaseQuantity):
@@ -50,8 +96,8 @@ class BaseQuantity:
         new_unit = self.unit / other.unit
         new_value = self.value / other.value
         
-        # Return a new instance of the appropriate type
-        return type(self)(new_value, new_unit)
+        # Return a new instance of the quantity class matching the new dimensions
+        return _quantity_class_for(new_unit, type(self))(new_value, new_unit)
     
     def __mul__(self, other: "BaseQuantity"):
         if not isinstance(other, BaseQuantity):
@@ -61,37 +107,72 @@ class BaseQuantity:
         new_unit = self.unit * other.unit
         new_value = self.value * other.value
         
-        # Return a new instance of the appropriate type
-        return type(self)(new_value, new_unit)
+        # Return a new instance of the quantity class matching the new dimensions
+        return _quantity_class_for(new_unit, type(self))(new_value, new_unit)
     
     def _compare(self,other: "BaseQuantity",method):
         if not isinstance(other, BaseQuantity):
             return NotImplemented
+        if _FASTPATH.get():
+            # The operands were validated on entry to fastpath()
+            if self._unit is other._unit:
+                return method(self._value, other._value)
+            return method(self.base_value, other.base_value)
         if type(self) is not type(other):
             raise TypeError(f'Cannot compare different quantity types: {type(self)} and {type(other)}')
-        try:
-            other_value_in_self_unit = other.convert_to(self.unit).value
-        except ValueError:
+        if self._unit is other._unit:
+            return method(self._value, other._value)
+        if not self._unit.is_compatible_with(other._unit):
             raise ValueError(f'Cannot compare incompatible units: {self.unit} and {other.unit}')
-
-        return method(self.value, other_value_in_self_unit)
+        try:
+            return method(self.base_value, other.base_value)
+        except ValueError as error:
+            raise ValueError(f'Cannot compare {self.unit} and {other.unit}: {error}') from None
     
     def __eq__(self, other):
-        return self._compare(other, lambda x, y: x == y)
-        
+        return self._compare(other, operator.eq)
+
+    def __hash__(self) -> int:
+        # Equal quantities share their base magnitude, whatever their unit
+        try:
+            return hash((self._unit.dimensions, self.base_value))
+        except ValueError:
+            return hash((self._unit, self._value))
+
     
     def __lt__(self, other) -> bool:
-        return self._compare(other, lambda x, y: x < y)
+        return self._compare(other, operator.lt)
     
     def __gt__(self, other) -> bool:
-        return self._compare(other, lambda x, y: x > y)
+        return self._compare(other, operator.gt)
     
-    def __init__(self, value: float, unit: Unit, quantity_type: str) -> None:
+    def __init__(self, value: float, unit: Unit) -> None:
         if type(self) is BaseQuantity:
             raise TypeError('BaseQuantity cannot be instantiated directly.')
         self._value = value
         self._unit = unit
-        self.__conversion_manager = BaseConversionManager(quantity_type)
+        self._base_value = None
+
+    @property
+    def base_value(self) -> float:
+        """The value in the coherent base units of its dimensions (e.g. 1.5 kW -> 1500.0), cached.
+
+        The cache never goes stale because quantities are immutable.
+        """
+        base_value = self._base_value
+        if base_value is None:
+            base_value = self._base_value = base_transform(self._unit)(self._value)
+        return base_value
+
+    def lazy(self):
+        """Returns this quantity as the start of a lazy expression (see core.quantity_expressions)."""
+        from core.quantity_expressions import lazy
+        return lazy(self)
+
+    @property
+    def conversion_manager(self) -> BaseConversionManager:
+        """The conversion manager shared by all quantities of this type."""
+        return get_conversion_manager(self.quantity_type)
         
     def __str__(self) -> str:
         return f'{self._value} [{self._unit}]'
@@ -116,108 +197,895 @@ class BaseQuantity:
         data = json_string_to_dict(json_string)  # Convierte JSON string a un diccionario
         value: float = data['value']
         unit_symbol: str = data['unit']
-        unit = find_unit_by_symbol(unit_symbol)  # Encuentra la unidad a partir del símbolo
-        unit_type = find_unit_type_by_symbol(unit_symbol)  # Encuentra el tipo de unidad
-        
+        unit = parse_unit(unit_symbol)  # Interpreta el símbolo (registrado o compuesto)
+
         return cls(value, unit)
         
     @property
     def value(self) -> float:
         return self._value
     
-    @value.setter
-    def value(self, new_value: float) -> None:
-        self._value = new_value
-    
     @property
     def unit(self) -> Unit:
         return self._unit
     
-    @unit.setter
-    def unit(self, new_unit: Unit) -> None:
-        self._unit = new_unit
-    
+    def conversion_factor(self, target_unit: Unit) -> float:
+        """Returns the factor that converts this quantity's unit into target_unit."""
+        return self.conversion_manager.factor(self.unit, target_unit)
+
     def convert_to(self, target_unit: Unit) -> "BaseQuantity":
         # Check if the units are the same
         if self.unit == target_unit:
-            return type(self)(self.value, self.unit)  # Create a new instance of the same class
+            return type(self)(self.value, target_unit)  # Create a new instance of the same class
         # Check if the units are compatible
         if not self.unit.is_compatible_with(target_unit):
             raise ValueError(f'Cannot convert between incompatible units: {self.unit} and {target_unit}')
 
-        # Perform the conversion using the conversion manager
-        converted_value = self.__conversion_manager.convert(self.value, self.unit, target_unit)
+        # Perform the conversion using the precompiled tables of the conversion manager
+        converted_value = self.conversion_manager.convert(self.value, self.unit, target_unit)
 
         # Return a new instance of the same class with the converted value and unit
         return type(self)(converted_value, target_unit)
 
+    # ------------------------------------------------------------------
+    # Reductions
+    # ------------------------------------------------------------------
+    # The values are grouped by unit in a single pass, so each distinct unit is
+    # validated and converted once, and the result is a single new quantity.
+
+    @classmethod
+    def _group_by_unit(cls, quantities: Iterable["BaseQuantity"]) -> Tuple[type, List[Tuple[Unit, List[float]]]]:
+        quantity_class = None if cls is BaseQuantity else cls
+        groups = {}
+        for quantity in quantities:
+            if type(quantity) is not quantity_class:
+                if quantity_class is None and isinstance(quantity, BaseQuantity):
+                    quantity_class = type(quantity)
+                elif isinstance(quantity, BaseQuantity):
+                    raise TypeError(f'Cannot operate on different quantity types: {quantity_class} and {type(quantity)}')
+                else:
+                    raise TypeError('Can only operate on another BaseQuantity.')
+            unit = quantity._unit
+            group = groups.get(id(unit))
+            if group is None:
+                group = groups[id(unit)] = (unit, [])
+            group[1].append(quantity._value)
+        if not groups:
+            raise ValueError('Cannot reduce an empty sequence of quantities.')
+        groups = list(groups.values())
+        first_unit = groups[0][0]
+        for unit, _ in groups[1:]:
+            if not unit.is_compatible_with(first_unit):
+                raise ValueError(f'Cannot operate on incompatible units: {first_unit} and {unit}')
+        return quantity_class, groups
+
+    @classmethod
+    def _total(cls, quantities: Iterable["BaseQuantity"], unit: Unit = None, affine: bool = True) -> Tuple[type, float, int, Unit]:
+        quantity_class, groups = cls._group_by_unit(quantities)
+        target_unit = unit or groups[0][0]
+        if not affine:
+            _refuse_affine_sum([group_unit for group_unit, _ in groups] + [target_unit])
+        manager = get_conversion_manager(quantity_class.quantity_type)
+        partial_totals = []
+        count = 0
+        for group_unit, values in groups:
+            # Compensated (exactly rounded) sum per unit, then one conversion per unit
+            total = math.fsum(values)
+            if group_unit is not target_unit:
+                transform = manager.transform(group_unit, target_unit)
+                total = total * transform.scale + len(values) * transform.offset
+            partial_totals.append(total)
+            count += len(values)
+        return quantity_class, math.fsum(partial_totals), count, target_unit
+
+    @classmethod
+    def sum(cls, quantities: Iterable["BaseQuantity"], unit: Unit = None) -> "BaseQuantity":
+        """Adds up an iterable of quantities of the same type.
+
+        :param quantities: Quantities, possibly in different (compatible) units.
+        :param unit: Unit of the result; defaults to the unit of the first quantity.
+        :return: A single quantity with the total.
+        :raises ValueError: If a quantity or the result is in an affine unit (°C, °F):
+            their sum depends on the zero of the unit. mean() accepts them.
+        """
+        quantity_class, total, _, target_unit = cls._total(quantities, unit, affine=False)
+        return quantity_class(total, target_unit)
+
+    @classmethod
+    def mean(cls, quantities: Iterable["BaseQuantity"], unit: Unit = None) -> "BaseQuantity":
+        """Returns the arithmetic mean of an iterable of quantities (see sum)."""
+        quantity_class, total, count, target_unit = cls._total(quantities, unit)
+        return quantity_class(total / count, target_unit)
+
+    @classmethod
+    def _extreme(cls, quantities: Iterable["BaseQuantity"], choose) -> "BaseQuantity":
+        quantity_class, groups = cls._group_by_unit(quantities)
+        best_value, best_unit, best_base = None, None, None
+        for group_unit, values in groups:
+            # Unit conversions are increasing, so each unit only contributes its own extreme
+            value = choose(values)
+            base = value if len(groups) == 1 else base_transform(group_unit)(value)
+            if best_base is None or choose(base, best_base) != best_base:
+                best_value, best_unit, best_base = value, group_unit, base
+        return quantity_class(best_value, best_unit)
+
+    @classmethod
+    def min(cls, quantities: Iterable["BaseQuantity"]) -> "BaseQuantity":
+        """Returns the smallest of an iterable of quantities, in its own unit."""
+        return cls._extreme(quantities, min)
+
+    @classmethod
+    def max(cls, quantities: Iterable["BaseQuantity"]) -> "BaseQuantity":
+        """Returns the largest of an iterable of quantities, in its own unit."""
+        return cls._extreme(quantities, max)
+
 class LengthQuantity(BaseQuantity):
-    def __init__(self, value: float, unit: Unit = LengthUnits.METER.value) -> None:
-        super().__init__(value, unit,'length')
+    __slots__ = ()
+    quantity_type = 'length'
+
+    def __init__(self, value: float, unit: Unit = None) -> None:
+        super().__init__(value, unit or _units.LengthUnits.METER.value)
 
 class MassQuantity(BaseQuantity):
+    __slots__ = ()
+    quantity_type = 'mass'
 
-    def __init__(self, value: float,unit: Unit = MassUnits.KILOGRAM.value) -> None:
-        super().__init__(value, unit,'mass')
+    def __init__(self, value: float, unit: Unit = None) -> None:
+        super().__init__(value, unit or _units.MassUnits.KILOGRAM.value)
     
 class TemperatureQuantity(BaseQuantity):
-    def __init__(self, value: float,unit: Unit = LengthUnits.METER.value) -> None:
-        super().__init__(value, unit,'temperature')
-        self._conversion_manager = TemperatureConversionManager()
-    
-    def convert_to(self, target_unit: Unit):
-        if(self.unit == target_unit):
-            return TemperatureQuantity(self.value,self.unit)
-        converted_value = self.conversion_manager.convert(self.value, self.unit, target_unit)
-        return TemperatureQuantity(value=converted_value, unit=target_unit)
+    __slots__ = ()
+    quantity_type = 'temperature'
+
+    def __init__(self, value: float, unit: Unit = None) -> None:
+        super().__init__(value, unit or _units.TemperatureUnits.KELVIN.value)
     
 class TimeQuantity(BaseQuantity):
-    def __init__(self, value: float,unit: Unit = TimeUnits.SECOND.value) -> None:
-        super().__init__(value, unit,'time')
+    __slots__ = ()
+    quantity_type = 'time'
+
+    def __init__(self, value: float, unit: Unit = None) -> None:
+        super().__init__(value, unit or _units.TimeUnits.SECOND.value)
     
 class PowerQuantity(BaseQuantity):
-    def __init__(self, value: float,unit: Unit = PowerUnits.WATT.value) -> None:
-        super().__init__(value, unit,'power')
+    __slots__ = ()
+    quantity_type = 'power'
+
+    def __init__(self, value: float, unit: Unit = None) -> None:
+        super().__init__(value, unit or _units.PowerUnits.WATT.value)
 
 class FrequencyQuantity(BaseQuantity):
-    def __init__(self, value: float,unit: Unit = FrequencyUnits.HERTZ.value) -> None:
-        super().__init__(value, unit,'frequency')
+    __slots__ = ()
+    quantity_type = 'frequency'
+
+    def __init__(self, value: float, unit: Unit = None) -> None:
+        super().__init__(value, unit or _units.FrequencyUnits.HERTZ.value)
 
 class ForceQuantity(BaseQuantity):
-    def __init__(self, value: float,unit: Unit = ForceUnits.NEWTON.value) -> None:
-        super().__init__(value, unit,'force')
+    __slots__ = ()
+    quantity_type = 'force'
+
+    def __init__(self, value: float, unit: Unit = None) -> None:
+        super().__init__(value, unit or _units.ForceUnits.NEWTON.value)
     
 class EnergyQuantity(BaseQuantity):
-    def __init__(self, value: float ,unit: Unit = EnergyUnits.JOULE.value) -> None:
-        super().__init__(value, unit,'energy')
+    __slots__ = ()
+    quantity_type = 'energy'
+
+    def __init__(self, value: float, unit: Unit = None) -> None:
+        super().__init__(value, unit or _units.EnergyUnits.JOULE.value)
 
     
 class ElectricChargeQuantity(BaseQuantity):
-    def __init__(self, value: float ,unit: Unit = ElectricChargeUnits.COULOMB.value) -> None:
-        super().__init__(value, unit,'electric_charge')
+    __slots__ = ()
+    quantity_type = 'electric_charge'
+
+    def __init__(self, value: float, unit: Unit = None) -> None:
+        super().__init__(value, unit or _units.ElectricChargeUnits.COULOMB.value)
     
 class VoltageQuantity(BaseQuantity):
-    def __init__(self, value: float,unit: Unit = VoltageUnits.VOLT.value) -> None:
-        super().__init__(value, unit, 'voltage')
+    __slots__ = ()
+    quantity_type = 'voltage'
+
+    def __init__(self, value: float, unit: Unit = None) -> None:
+        super().__init__(value, unit or _units.VoltageUnits.VOLT.value)
 
 class ElectricCurrentQuantity(BaseQuantity):
-    def __init__(self, value: float,unit: Unit = ElectricCurrentUnits.AMPERE.value) -> None:
-        super().__init__(value, unit, 'electric_current')
+    __slots__ = ()
+    quantity_type = 'electric_current'
+
+    def __init__(self, value: float, unit: Unit = None) -> None:
+        super().__init__(value, unit or _units.ElectricCurrentUnits.AMPERE.value)
 
     
 class ResistanceQuantity(BaseQuantity):
-    def __init__(self, value: float,unit: Unit = ResistanceUnits.OHM.value) -> None:
-        super().__init__(value, unit,'resistance')
+    __slots__ = ()
+    quantity_type = 'resistance'
+
+    def __init__(self, value: float, unit: Unit = None) -> None:
+        super().__init__(value, unit or _units.ResistanceUnits.OHM.value)
 
 class AngleQuantity(BaseQuantity):
-    def __init__(self, value: float,unit: Unit = AngleUnits.DEGREE.value) -> None:
-        super().__init__(value, unit,'angle')
+    __slots__ = ()
+    quantity_type = 'angle'
+
+    def __init__(self, value: float, unit: Unit = None) -> None:
+        super().__init__(value, unit or _units.AngleUnits.DEGREE.value)
 
 
 class VolumeQuantity(BaseQuantity):
-    def __init__(self, value: float,unit: Unit = VolumeUnits.CUBIC_METER.value) -> None:
-        super().__init__(value, unit, 'volume')
+    __slots__ = ()
+    quantity_type = 'volume'
+
+    def __init__(self, value: float, unit: Unit = None) -> None:
+        super().__init__(value, unit or _units.VolumeUnits.CUBIC_METER.value)
 
 class MassFlowRateQuantity(BaseQuantity):
-    def __init__(self, value: float, unit: Unit = MassFlowRateUnits.KILOGRAM_PER_SECOND.value) -> None:
-        super().__init__(value, unit, 'mass_flow_rate')
\ No newline at end of file
+    __slots__ = ()
+    quantity_type = 'mass_flow_rate'
+
+    def __init__(self, value: float, unit: Unit = None) -> None:
+        super().__init__(value, unit or _units.MassFlowRateUnits.KILOGRAM_PER_SECOND.value)
+
+
+# Quantity class of each quantity type, and an index from (interned) dimensions
+# to quantity class so arithmetic results are wrapped in the right class in O(1).
+QUANTITY_CLASS_BY_TYPE = {
+    'length': LengthQuantity,
+    'mass': MassQuantity,
+    'temperature': TemperatureQuantity,
+    'time': TimeQuantity,
+    'power': PowerQuantity,
+    'frequency': FrequencyQuantity,
+    'force': ForceQuantity,
+    'energy': EnergyQuantity,
+    'electric_charge': ElectricChargeQuantity,
+    'voltage': VoltageQuantity,
+    'electric_current': ElectricCurrentQuantity,
+    'resistance': ResistanceQuantity,
+    'angle': AngleQuantity,
+    'volume': VolumeQuantity,
+    'mass_flow_rate': MassFlowRateQuantity,
+}
+
+_QUANTITY_CLASS_BY_DIMENSIONS = {
+    find_dimensions_by_unit_type(quantity_type): quantity_class
+    for quantity_type, quantity_class in QUANTITY_CLASS_BY_TYPE.items()
+}
+
+
+@contextmanager
+def fastpath(*operands):
+    """Skips the per-operation validation of quantity arithmetic and comparisons.
+
+    Inside the block, +, - and comparisons between quantities trust their
+    operands: the quantity type and unit compatibility checks are not run,
+    so mixing incompatible quantities gives undefined results instead of an
+    error (non-quantity operands are still refused). The operands given here
+    (quantities or iterables of quantities) are validated once on entry
+    instead; iterators are consumed by that check, so the block receives the
+    operands as a tuple with every iterator turned into a list.
+
+    The saving is largest when the operands share a unit. Mixed-unit
+    arithmetic spends most of its time converting, which fastpath does not
+    skip, so it gains little (~5% in other-tests/fastpath_benchmark.py).
+
+    Example:
+        >>> with fastpath(currents):
+        ...     peak = max(currents)
+        >>> with fastpath(read_currents()) as (currents,):
+        ...     total = sum(currents)
+
+    Raises:
+        TypeError: If the operands are not quantities of a single type
+        ValueError: If their units are not compatible
+    """
+    operands = _validate_operands(operands)
+    token = _FASTPATH.set(True)
+    try:
+        yield operands
+    finally:
+        _FASTPATH.reset(token)
+
+
+_get_unit = operator.attrgetter('_unit')
+_get_dimensions = operator.attrgetter('_dimensions')
+
+
+def _validate_operands(operands) -> tuple:
+    # Iterators are materialized first, so the caller can still use their items
+    operands = tuple(operand if isinstance(operand, (BaseQuantity, list, tuple)) else list(operand) for operand in operands)
+    # Distinct classes and dimensions (interned, so compared by id) are collected with C-level loops
+    classes = set()
+    dimension_ids = set()
+    for operand in operands:
+        quantities = (operand,) if isinstance(operand, BaseQuantity) else operand
+        classes.update(map(type, quantities))
+        try:
+            unit_ids = list(map(id, map(_get_unit, quantities)))
+        except AttributeError:
+            raise TypeError('Can only operate on another BaseQuantity.') from None
+        if unit_ids and unit_ids.count(unit_ids[0]) == len(unit_ids):
+            # Common case, a single unit (ids are compared, never Unit.__eq__)
+            dimension_ids.add(id(quantities[0]._unit._dimensions))
+        else:
+            dimension_ids.update(map(id, map(_get_dimensions, map(_get_unit, quantities))))
+    if not classes:
+        return operands
+    quantity_class = classes.pop()
+    if classes:
+        raise TypeError(f'Cannot operate on different quantity types: {quantity_class} and {classes.pop()}')
+    if not issubclass(quantity_class, BaseQuantity):
+        raise TypeError('Can only operate on another BaseQuantity.')
+    if len(dimension_ids) > 1:
+        # Error path only: find a pair of incompatible units for the message
+        quantities = [quantity for operand in operands for quantity in ((operand,) if isinstance(operand, BaseQuantity) else operand)]
+        first_unit = quantities[0]._unit
+        for quantity in quantities:
+            if not quantity._unit.is_compatible_with(first_unit):
+                raise ValueError(f'Cannot operate on incompatible units: {first_unit} and {quantity._unit}')
+    return operands
+
+
+def _refuse_affine_sum(units: Iterable[Unit]) -> None:
+    # A sum of absolute temperatures depends on the zero of the unit it is expressed in
+    for unit in units:
+        try:
+            affine = not base_transform(unit).is_linear
+        except ValueError:
+            # Without a conversion table the unit cannot be converted anyway
+            continue
+        if affine:
+            raise ValueError(f'Cannot sum quantities in the affine unit {unit}: the result depends on its zero. '
+                             'Convert them to an absolute unit (e.g. K) or use mean().')
+
+
+def find_quantity_class_by_dimensions(dimensions: Dimensions) -> type | None:
+    """Returns the quantity class for some dimensions (e.g. M*L^2*T^-3 -> PowerQuantity)."""
+    return _QUANTITY_CLASS_BY_DIMENSIONS.get(dimensions)
+
+
+def _quantity_class_for(unit: Unit, default: type) -> type:
+    # Results without a dedicated class (e.g. V*s) keep the class of the left operand
+    return _QUANTITY_CLASS_BY_DIMENSIONS.get(unit.dimensions, default)
+
+
+# =========================================================
+# Quantity arrays
+# =========================================================
+# NumPy is optional: it is only imported, on first use, by QuantityArray.
+
+_np = None
+_get_value = operator.attrgetter('_value')
+
+
+def _numpy():
+    global _np
+    if _np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError('QuantityArray requires NumPy (pip install numpy).') from None
+        _np = numpy
+    return _np
+
+
+# Storage precisions of quantity arrays, with the largest relative error of
+# rounding a float64 value (within the normal range of the type) into each.
+PRECISION_TIERS = {
+    'float64': 2.0**-53,
+    'float32': 2.0**-24,
+    'float16': 2.0**-11,
+}
+
+
+def max_relative_error(dtype) -> float:
+    """Returns the worst-case relative error of storing a value in one of the PRECISION_TIERS.
+
+    The bound holds for values within the normal range of the type (up to
+    ~3.4e38 and down to ~1.2e-38 for float32, 65504 and ~6.1e-5 for float16);
+    QuantityArray.relative_error measures the actual error for given values.
+    """
+    name = _storage_dtype(dtype).name
+    return PRECISION_TIERS[name]
+
+
+def _storage_dtype(dtype):
+    dtype = _numpy().dtype(dtype)
+    if dtype.name not in PRECISION_TIERS:
+        raise ValueError(f'Unsupported storage precision {dtype}; use one of {tuple(PRECISION_TIERS)}')
+    return dtype
+
+
+def _apply_transform(transform, values):
+    # Factors are applied in float64 and the result stored back in the precision of values
+    np = _np
+    wide = values.astype(np.float64, copy=False) if isinstance(values, np.ndarray) else values
+    if transform.is_linear:
+        converted = wide * transform.scale
+    else:
+        converted = wide * transform.scale + transform.offset
+    if wide is values:
+        return converted
+    return converted.astype(values.dtype, copy=False)
+
+
+def _convert_coded(values, codes, units: List[Unit], target_unit: Unit, quantity_type: str):
+    """Converts rows whose unit is units[codes[i]] into target_unit.
+
+    Each distinct unit is resolved once; the per-row factors (and offsets,
+    for affine units) are then gathered by code, so the conversion itself is
+    one vectorized multiply(-add).
+    """
+    manager = get_conversion_manager(quantity_type)
+    np = _numpy()
+    transforms = []
+    for unit in units:
+        if not unit.is_compatible_with(target_unit):
+            raise ValueError(f'Cannot convert between incompatible units: {unit} and {target_unit}')
+        transforms.append(manager.transform(unit, target_unit))
+    if len(transforms) == 1:
+        return _apply_transform(transforms[0], values)
+    scales = np.array([transform.scale for transform in transforms], dtype=np.float64)
+    converted = values.astype(np.float64, copy=False) * scales[codes]
+    if not all(transform.is_linear for transform in transforms):
+        offsets = np.array([transform.offset for transform in transforms], dtype=np.float64)
+        converted += offsets[codes]
+    return converted.astype(values.dtype, copy=False)
+
+
+def _absolute_unit(quantity_type: str) -> Unit:
+    # Unit whose base transform is the identity (e.g. K for temperatures), used for deltas
+    matrix = get_conversion_manager(quantity_type).conversion_matrix
+    for symbol in matrix.symbols:
+        transform = base_transform(_units.find_unit_by_symbol(symbol))
+        if transform.is_linear and transform.scale == 1:
+            return _units.find_unit_by_symbol(symbol)
+    raise ValueError(f'No absolute unit available for {quantity_type}')
+
+
+def _encode_symbols(symbols) -> Tuple[object, List[str]]:
+    """Returns (codes, distinct symbols) such that symbols[i] == distinct[codes[i]]."""
+    np = _numpy()
+    if isinstance(symbols, np.ndarray):
+        distinct, codes = np.unique(symbols, return_inverse=True)
+        return codes.reshape(-1), [str(symbol) for symbol in distinct]
+    # Python sequences: dict.fromkeys and map keep the per-row work in C
+    codes_by_symbol = {symbol: code for code, symbol in enumerate(dict.fromkeys(symbols))}
+    codes = np.fromiter(map(codes_by_symbol.__getitem__, symbols), dtype=np.intp, count=len(symbols))
+    return codes, list(codes_by_symbol)
+
+
+class QuantityArray:
+    """A contiguous NumPy array of values sharing a single unit.
+
+    Arithmetic, conversions and comparisons work on the whole array at once:
+    the unit algebra and the dimensional checks run once per operation, not
+    once per element. Slicing returns views of the same buffer, and indexing
+    a single element returns a scalar quantity of quantity_class.
+
+    Values can be stored in float64, float32 or float16 (see PRECISION_TIERS)
+    to halve or quarter memory. Unit conversions always apply their factors
+    in float64 and only round the result into the storage precision.
+
+    Args:
+        values: Anything numpy.asarray accepts. Non floating-point input is stored as float64.
+        unit: Unit shared by all the values.
+        quantity_class: Class of the scalar quantities (e.g. ElectricCurrentQuantity).
+            Defaults to the class matching the dimensions of the unit.
+        dtype: Storage precision ('float64', 'float32' or 'float16'); defaults to
+            the precision of values (float64 for non floating-point input).
+    """
+
+    __slots__ = ('_values', '_unit', '_quantity_class')
+    # Makes NumPy defer to the reflected operators (array * quantity_array)
+    __array_ufunc__ = None
+
+    def __init__(self, values, unit: Unit, quantity_class: type = None, dtype=None) -> None:
+        np = _numpy()
+        values = np.ascontiguousarray(values)
+        if values.dtype.kind != 'f':
+            values = values.astype(np.float64)
+        if dtype is not None:
+            values = values.astype(_storage_dtype(dtype), copy=False)
+        elif values.dtype.name not in PRECISION_TIERS:
+            values = values.astype(np.float64)
+        quantity_class = quantity_class or find_quantity_class_by_dimensions(unit.dimensions)
+        if quantity_class is None:
+            raise ValueError(f'No quantity class for unit {unit}; pass quantity_class explicitly.')
+        if not (isinstance(quantity_class, type) and issubclass(quantity_class, BaseQuantity)):
+            raise TypeError('quantity_class must be a BaseQuantity subclass.')
+        self._values = values
+        self._unit = unit
+        self._quantity_class = quantity_class
+
+    @classmethod
+    def _wrap(cls, values, unit: Unit, quantity_class: type) -> "QuantityArray":
+        # Internal constructor: no validation and no copy, so views stay views
+        array = object.__new__(cls)
+        array._values = values
+        array._unit = unit
+        array._quantity_class = quantity_class
+        return array
+
+    @classmethod
+    def from_quantities(cls, quantities: Iterable[BaseQuantity], unit: Unit = None, dtype='float64') -> "QuantityArray":
+        """Packs scalar quantities of a single type into an array.
+
+        :param quantities: Quantities, possibly in different (compatible) units.
+        :param unit: Unit of the array; defaults to the unit of the first quantity.
+        :param dtype: Storage precision; conversions are done in float64 first.
+        """
+        dtype = _storage_dtype(dtype)
+        quantities = list(quantities)
+        if not quantities:
+            raise ValueError('Cannot build a QuantityArray from an empty sequence of quantities.')
+        _validate_operands((quantities,))
+        np = _numpy()
+        values = np.fromiter(map(_get_value, quantities), dtype=np.float64, count=len(quantities))
+        units = list(map(_get_unit, quantities))
+        quantity_class = type(quantities[0])
+        target_unit = unit or units[0]
+        if not (units[0] is target_unit and units.count(target_unit) == len(units)):
+            codes_by_unit = {}
+            codes = np.fromiter((codes_by_unit.setdefault(id(unit), len(codes_by_unit)) for unit in units), dtype=np.intp, count=len(units))
+            distinct_units = list({id(unit): unit for unit in units}.values())
+            values = _convert_coded(values, codes, distinct_units, target_unit, quantity_class.quantity_type)
+        return cls._wrap(values.astype(dtype, copy=False), target_unit, quantity_class)
+
+    @classmethod
+    def from_columns(cls, values, symbols, unit: Unit = None, quantity_class: type = None, dtype='float64') -> "QuantityArray":
+        """Builds an array from parallel value and unit-symbol columns (e.g. a CSV export).
+
+        The distinct symbols are resolved once, the rows are encoded as small
+        integer codes, and all rows are converted to a common unit with a
+        single multiply by the per-unit factors gathered by code.
+
+        Example:
+            >>> print(QuantityArray.from_columns([12, 0.5, 300], ['mA', 'A', 'μA']))
+            [1.2e+01 5.0e+02 3.0e-01] [mA]
+
+        :param values: Numeric column.
+        :param symbols: Unit symbol of each row (registered or compound, e.g. 'kg/h').
+        :param unit: Unit of the array; defaults to the unit of the first row.
+        :param quantity_class: Class of the scalar quantities; defaults to the one matching the unit.
+        :param dtype: Storage precision; conversions are done in float64 first.
+        :raises ValueError: If a symbol is unknown, the units are incompatible or the columns differ in length.
+        """
+        np = _numpy()
+        dtype = _storage_dtype(dtype)
+        values = np.asarray(values, dtype=np.float64).reshape(-1)
+        if len(symbols) != len(values):
+            raise ValueError(f'Got {len(values)} values but {len(symbols)} unit symbols.')
+        codes, distinct_symbols = _encode_symbols(symbols)
+        units = [parse_unit(symbol.strip()) for symbol in distinct_symbols]
+        if unit is None:
+            if not units:
+                raise ValueError('The unit of an empty QuantityArray must be given.')
+            unit = units[codes[0]]
+        array = cls(values[:0], unit, quantity_class, dtype)
+        if units:
+            array._values = _convert_coded(values, codes, units, unit, array._quantity_class.quantity_type).astype(dtype, copy=False)
+        return array
+
+    def to_quantities(self) -> List[BaseQuantity]:
+        """Returns the values as a list of scalar quantities (in flat order)."""
+        quantity_class, unit = self._quantity_class, self._unit
+        return [quantity_class(value, unit) for value in self._values.ravel().tolist()]
+
+    @property
+    def values(self):
+        """The underlying NumPy array (not a copy)."""
+        return self._values
+
+    @property
+    def unit(self) -> Unit:
+        return self._unit
+
+    @property
+    def quantity_class(self) -> type:
+        return self._quantity_class
+
+    @property
+    def conversion_manager(self) -> BaseConversionManager:
+        return get_conversion_manager(self._quantity_class.quantity_type)
+
+    @property
+    def dtype(self):
+        return self._values.dtype
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self._values.shape
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self.to_quantities())
+
+    def __getitem__(self, key):
+        values = self._values[key]
+        if isinstance(values, _np.ndarray):
+            return self._wrap(values, self._unit, self._quantity_class)
+        return self._quantity_class(values.item(), self._unit)
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None or dtype == self._values.dtype:
+            return self._values.copy() if copy else self._values
+        return self._values.astype(dtype)
+
+    def __repr__(self) -> str:
+        return f'QuantityArray({self._values!r}, unit={self._unit!r}, quantity_class={self._quantity_class.__name__})'
+
+    def __str__(self) -> str:
+        return f'{self._values} [{self._unit}]'
+
+    def copy(self) -> "QuantityArray":
+        return self._wrap(self._values.copy(), self._unit, self._quantity_class)
+
+    def astype(self, dtype, max_error: float = None) -> "QuantityArray":
+        """Returns a copy stored in another precision (see PRECISION_TIERS).
+
+        :param dtype: 'float64', 'float32' or 'float16'.
+        :param max_error: If given, the largest acceptable relative error; narrowing
+            that loses more (e.g. float16 overflow above 65504) raises ValueError.
+        """
+        dtype = _storage_dtype(dtype)
+        if max_error is not None:
+            error = self.relative_error(dtype)
+            if error > max_error:
+                raise ValueError(f'Storing {self._unit} values as {dtype} has a relative error of {error:.3g} (> {max_error:.3g}); convert to a better scaled unit or use a wider type.')
+        return self._wrap(self._values.astype(dtype), self._unit, self._quantity_class)
+
+    def relative_error(self, dtype) -> float:
+        """Returns the largest relative error that storing these values in dtype introduces.
+
+        Unlike max_relative_error(dtype), this is measured on the actual values,
+        so it accounts for overflow (inf) and for values too small for the type.
+        Only finite, non-zero values are measured: zeros are exact, and NaN or
+        infinite values stay NaN or infinite in any precision.
+        """
+        np = _np
+        dtype = _storage_dtype(dtype)
+        exact = self._values.astype(np.float64, copy=False)
+        measured = np.isfinite(exact) & (exact != 0)
+        if not measured.any():
+            return 0.0
+        exact = exact[measured]
+        with np.errstate(over='ignore'):
+            stored = exact.astype(dtype).astype(np.float64)
+        if not np.isfinite(stored).all():
+            # A finite value that overflows the type is lost entirely
+            return float('inf')
+        return float((np.abs(stored - exact) / np.abs(exact)).max())
+
+    def convert_to(self, target_unit: Unit) -> "QuantityArray":
+        """Returns a new array in target_unit (one vector multiply, or multiply-add for affine units)."""
+        if target_unit is self._unit:
+            return self.copy()
+        if not self._unit.is_compatible_with(target_unit):
+            raise ValueError(f'Cannot convert between incompatible units: {self._unit} and {target_unit}')
+        transform = self.conversion_manager.transform(self._unit, target_unit)
+        return self._wrap(_apply_transform(transform, self._values), target_unit, self._quantity_class)
+
+    # ------------------------------------------------------------------
+    # Arithmetic
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _operand(other):
+        # (values, unit, quantity class) of another quantity or quantity array
+        if isinstance(other, QuantityArray):
+            return other._values, other._unit, other._quantity_class
+        if isinstance(other, BaseQuantity):
+            return other._value, other._unit, type(other)
+        return None
+
+    @staticmethod
+    def _is_dimensionless_factor(other) -> bool:
+        return isinstance(other, numbers.Number) or isinstance(other, _np.ndarray)
+
+    def _in_unit(self, values, unit: Unit, quantity_class: type, target_unit: Unit):
+        # Values of a compatible operand expressed in target_unit
+        if quantity_class is not self._quantity_class:
+            raise TypeError(f'Cannot operate on different quantity types: {self._quantity_class} and {quantity_class}')
+        if unit is target_unit:
+            return values
+        if not unit.is_compatible_with(target_unit):
+            raise ValueError(f'Cannot operate on incompatible units: {target_unit} and {unit}')
+        return _apply_transform(self.conversion_manager.transform(unit, target_unit), values)
+
+    def __add__(self, other) -> "QuantityArray":
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        return self._wrap(self._values + self._in_unit(*operand, self._unit), self._unit, self._quantity_class)
+
+    def __radd__(self, other) -> "QuantityArray":
+        # Lets the builtin sum() start from 0; a scalar quantity on the left keeps its unit
+        if isinstance(other, numbers.Number) and other == 0:
+            return self
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        unit = operand[1]
+        return self._wrap(operand[0] + self._in_unit(self._values, self._unit, operand[2], unit), unit, self._quantity_class)
+
+    def __sub__(self, other) -> "QuantityArray":
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        return self._wrap(self._values - self._in_unit(*operand, self._unit), self._unit, self._quantity_class)
+
+    def __rsub__(self, other) -> "QuantityArray":
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        unit = operand[1]
+        return self._wrap(operand[0] - self._in_unit(self._values, self._unit, operand[2], unit), unit, self._quantity_class)
+
+    def __mul__(self, other) -> "QuantityArray":
+        operand = self._operand(other)
+        if operand is None:
+            if self._is_dimensionless_factor(other):
+                return self._wrap(self._values * other, self._unit, self._quantity_class)
+            return NotImplemented
+        new_unit = self._unit * operand[1]
+        return self._wrap(self._values * operand[0], new_unit, _quantity_class_for(new_unit, self._quantity_class))
+
+    def __rmul__(self, other) -> "QuantityArray":
+        operand = self._operand(other)
+        if operand is None:
+            if self._is_dimensionless_factor(other):
+                return self._wrap(other * self._values, self._unit, self._quantity_class)
+            return NotImplemented
+        new_unit = operand[1] * self._unit
+        return self._wrap(operand[0] * self._values, new_unit, _quantity_class_for(new_unit, operand[2]))
+
+    def __truediv__(self, other) -> "QuantityArray":
+        operand = self._operand(other)
+        if operand is None:
+            if self._is_dimensionless_factor(other):
+                return self._wrap(self._values / other, self._unit, self._quantity_class)
+            return NotImplemented
+        new_unit = self._unit / operand[1]
+        return self._wrap(self._values / operand[0], new_unit, _quantity_class_for(new_unit, self._quantity_class))
+
+    def __rtruediv__(self, other) -> "QuantityArray":
+        operand = self._operand(other)
+        if operand is None:
+            if self._is_dimensionless_factor(other):
+                new_unit = self._unit ** -1
+                return self._wrap(other / self._values, new_unit, _quantity_class_for(new_unit, self._quantity_class))
+            return NotImplemented
+        new_unit = operand[1] / self._unit
+        return self._wrap(operand[0] / self._values, new_unit, _quantity_class_for(new_unit, operand[2]))
+
+    def __neg__(self) -> "QuantityArray":
+        return self._wrap(-self._values, self._unit, self._quantity_class)
+
+    def __abs__(self) -> "QuantityArray":
+        return self._wrap(abs(self._values), self._unit, self._quantity_class)
+
+    # ------------------------------------------------------------------
+    # Element-wise comparisons (return boolean NumPy arrays)
+    # ------------------------------------------------------------------
+
+    def _compare(self, other, method):
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        return method(self._values, self._in_unit(*operand, self._unit))
+
+    def __eq__(self, other):
+        return self._compare(other, operator.eq)
+
+    def __ne__(self, other):
+        return self._compare(other, operator.ne)
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
+
+    __hash__ = None
+
+    # ------------------------------------------------------------------
+    # Reductions and statistics
+    # ------------------------------------------------------------------
+    # Every reduction runs in NumPy (accumulating in float64) and returns a
+    # single scalar quantity of quantity_class. Statistics that are
+    # differences between values (std, ptp) are deltas: for affine units such
+    # as °C or °F they are returned in the absolute unit of the conversion
+    # table (K), since a delta has no zero offset.
+
+    def _scalar(self, value, unit: Unit = None) -> BaseQuantity:
+        quantity = self._quantity_class(float(value), self._unit)
+        return quantity.convert_to(unit) if unit is not None else quantity
+
+    def _non_empty_values(self):
+        if self._values.size == 0:
+            raise ValueError('Cannot reduce an empty QuantityArray.')
+        return self._values
+
+    def _delta(self, value, unit: Unit = None) -> BaseQuantity:
+        transform = base_transform(self._unit)
+        if unit is None:
+            if transform.is_linear:
+                return self._quantity_class(float(value), self._unit)
+            unit = _absolute_unit(self._quantity_class.quantity_type)
+        elif not unit.is_compatible_with(self._unit):
+            raise ValueError(f'Cannot convert between incompatible units: {self._unit} and {unit}')
+        # A delta only scales: the offset between the zeros of two units does not apply
+        return self._quantity_class(float(value) * transform.scale / base_transform(unit).scale, unit)
+
+    def sum(self, unit: Unit = None) -> BaseQuantity:
+        """Returns the sum of all values as a scalar quantity (in unit, if given).
+
+        Like BaseQuantity.sum, refuses affine units (°C, °F); use mean() or an absolute unit.
+        """
+        _refuse_affine_sum((self._unit,) if unit is None else (self._unit, unit))
+        return self._scalar(_np.sum(self._values, dtype=_np.float64), unit)
+
+    def mean(self, unit: Unit = None) -> BaseQuantity:
+        """Returns the mean of all values; for affine units the mean stays in the same unit (°C -> °C)."""
+        return self._scalar(_np.mean(self._non_empty_values(), dtype=_np.float64), unit)
+
+    def min(self, unit: Unit = None) -> BaseQuantity:
+        return self._scalar(_np.min(self._non_empty_values()), unit)
+
+    def max(self, unit: Unit = None) -> BaseQuantity:
+        return self._scalar(_np.max(self._non_empty_values()), unit)
+
+    def std(self, ddof: int = 0, unit: Unit = None) -> BaseQuantity:
+        """Returns the standard deviation of the values, as a delta (see above)."""
+        return self._delta(_np.std(self._non_empty_values(), dtype=_np.float64, ddof=ddof), unit)
+
+    def ptp(self, unit: Unit = None) -> BaseQuantity:
+        """Returns the peak-to-peak range (max - min), as a delta (see above)."""
+        values = self._non_empty_values()
+        return self._delta(_np.max(values).astype(_np.float64) - _np.min(values), unit)
+
+    def percentile(self, q, unit: Unit = None):
+        """Returns the q-th percentile(s) of the values.
+
+        :param q: Percentile in [0, 100], or a sequence of them.
+        :return: A scalar quantity for a single q, a QuantityArray otherwise.
+        """
+        result = _np.percentile(self._non_empty_values().astype(_np.float64, copy=False), q)
+        if _np.ndim(result) == 0:
+            return self._scalar(result, unit)
+        percentiles = self._wrap(_np.asarray(result, dtype=_np.float64), self._unit, self._quantity_class)
+        return percentiles.convert_to(unit) if unit is not None else percentiles
+
+    def median(self, unit: Unit = None) -> BaseQuantity:
+        return self.percentile(50, unit)
+
+    def histogram(self, bins=10, range: Tuple[BaseQuantity, BaseQuantity] = None):
+        """Counts the values in bins, like numpy.histogram.
+
+        :param bins: Number of bins, or the bin edges as a QuantityArray.
+        :param range: (lower, upper) quantities; defaults to (min, max).
+        :return: (counts, edges) where counts is an integer array and edges a QuantityArray in this unit.
+        """
+        if isinstance(bins, QuantityArray):
+            bins = self._in_unit(bins._values, bins._unit, bins._quantity_class, self._unit)
+        if range is not None:
+            range = tuple(float(self._in_unit(bound._value, bound._unit, type(bound), self._unit)) for bound in range)
+        counts, edges = _np.histogram(self._values, bins=bins, range=range)
+        return counts, self._wrap(edges, self._unit, self._quantity_class)
+
+
+def __getattr__(name: str):
+    # Unit names (LengthUnits, ...) stay reachable from this module, built on first use
+    if name in _units.__all__:
+        return getattr(_units, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,11 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import List
+from .conversion_managers import base_transform
 from .physical_quantities import ElectricCurrentQuantity, PowerQuantity, VoltageQuantity, TimeQuantity, EnergyQuantity, ElectricChargeQuantity
 from .utilities.json_utilities import json_to_dict
 from .unit import ElectricCurrentUnits, PowerUnits, VoltageUnits, TimeUnits, EnergyUnits, ElectricChargeUnits
+import math
 import os
 
 
@@ -44,16 +46,16 @@ class Component:
         
         
     def energy_consumption(self, t: TimeQuantity) -> EnergyQuantity:
-        return EnergyQuantity( self.power.convert_to(PowerUnits.WATT.value).value * t.convert_to(TimeUnits.SECOND.value).value )
+        return (self.power * t).convert_to(EnergyUnits.JOULE.value)
     
     def compute_power(self):
-        self.power =  PowerQuantity(self.voltage.convert_to(VoltageUnits.VOLT.value).value * self.current.convert_to(ElectricCurrentUnits.AMPERE.value).value )
+        self.power = (self.voltage * self.current).convert_to(PowerUnits.WATT.value)
     
     def compute_current(self):
-        self.current = ElectricCurrentQuantity(self.power.convert_to(PowerUnits.WATT.value).value / self.voltage.convert_to(VoltageUnits.VOLT.value).value)
+        self.current = (self.power / self.voltage).convert_to(ElectricCurrentUnits.AMPERE.value)
         
     def compute_voltage(self):
-        self.voltage = VoltageQuantity(self.power.convert_to(PowerUnits.WATT.value).value / self.current.convert_to(ElectricCurrentUnits.AMPERE.value).value)
+        self.voltage = (self.power / self.current).convert_to(VoltageUnits.VOLT.value)
     
     @property
     def name(self) -> str:
@@ -108,16 +110,31 @@ class Component:
     def __str__(self) -> str:
         return f'Component name: {self.name} V={self.voltage} I={self.current} P={self.power}'
     
+def _from_base_value(base_value: float, unit) -> float:
+    # Inverse of the (cached) transform of unit into its SI base unit
+    transform = base_transform(unit)
+    return (base_value - transform.offset) / transform.scale
+
+
 class BasePowerSupply(ABC):
+    # The totals are kept as running sums in amperes (SI) and updated by deltas;
+    # every RECOMPUTE_INTERVAL updates they are recomputed exactly to cancel drift.
+    RECOMPUTE_INTERVAL: int = 1024
     
     def __init__(self, name: str, nominal_voltage: VoltageQuantity, max_output_current: ElectricCurrentQuantity) -> None:
         self._name = name
         self._nominal_voltage = nominal_voltage
         self._max_output_current = max_output_current
         self._components: List[List[Component,int]] = []
-        self._total_current: ElectricCurrentQuantity = ElectricCurrentQuantity(0.0,'mA')
-        self._total_power: PowerQuantity = PowerQuantity(0.0,'mW')
+        self._total_current: ElectricCurrentQuantity = ElectricCurrentQuantity(0.0,ElectricCurrentUnits.MILLIAMPERE.value)
+        self._total_power: PowerQuantity = PowerQuantity(0.0,PowerUnits.MILLIWATT.value)
         self._total_components: int = 0
+        self._current_sum: float = 0.0
+        # Rounding error lost by _current_sum (Neumaier compensated summation)
+        self._current_compensation: float = 0.0
+        self._pending_updates: int = 0
+        # Current (A) of one unit of each entry of _components, as counted in _current_sum
+        self._contributions: List[float] = []
     
     @property
     def name(self) -> str:
@@ -145,6 +162,7 @@ class BasePowerSupply(ABC):
     @nominal_voltage.setter
     def nominal_voltage(self,new_nominal_voltage: VoltageQuantity):
         self._nominal_voltage = new_nominal_voltage
+        self._publish_totals()
     
     @property
     def max_output_current(self):
@@ -155,13 +173,20 @@ class BasePowerSupply(ABC):
         self._max_output_current = new_max_output_current
     
     def add_component(self, component: Component, quantity: int = 1):
+        contribution = component.current.base_value
         self._components.append((component,quantity))
-        self.compute_power_budget()
+        self._contributions.append(contribution)
+        self._update_totals(contribution * quantity)
     
     def remove_component(self,index: int):
         if(len(self.components) > 0):
-            self.components.pop(index)
-            self.compute_power_budget()
+            _, quantity = self.components.pop(index)
+            contribution = self._contributions.pop(index)
+            if not self.components:
+                # Nothing left: restart from an exact zero
+                self.compute_power_budget()
+            else:
+                self._update_totals(-contribution * quantity)
         else:
             raise ValueError('Component index not found')
     
@@ -172,29 +197,46 @@ class BasePowerSupply(ABC):
                 self.remove_component(index)
             else:
                 # Update the quantity in the tuple
-                component, _ = self.components[index]
+                component, old_qty = self.components[index]
                 self.components[index] = (component, new_qty)
-            self.compute_power_budget()
+                self._update_totals(self._contributions[index] * (new_qty - old_qty))
         else:
             raise IndexError("Component index out of range.")
+    
+    def _update_totals(self, current_delta: float):
+        # current_delta in amperes; O(1) except for the periodic exact recompute
+        self._pending_updates += 1
+        if self._pending_updates >= self.RECOMPUTE_INTERVAL:
+            self.compute_power_budget()
+        else:
+            total = self._current_sum + current_delta
+            if abs(self._current_sum) >= abs(current_delta):
+                self._current_compensation += (self._current_sum - total) + current_delta
+            else:
+                self._current_compensation += (current_delta - total) + self._current_sum
+            self._current_sum = total
+            self._publish_totals()
         
     def compute_power_budget(self):
-        normalized_current: float = 0
-        normalized_power: float = 0
-        normalized_voltage = VoltageQuantity.convert_to(self.nominal_voltage,'V').value
-        for component_type in self.components:
-            component: Component = component_type[0]
-            component_qty: int = component_type[1]
-            component_current_value: float = ElectricCurrentQuantity.convert_to(component.current,'mA').value
-            normalized_current += component_current_value * component_qty
-        
-        normalized_power = normalized_current * normalized_voltage
-        self._total_current.unit = 'mA'
-        self._total_current.value = normalized_current
-        self._total_power.unit = 'mW'
-        self._total_power.value = normalized_power 
-        
-        
+        """Recomputes the totals exactly from the present current of the components.
+
+        The current counted for each entry is taken again, so the totals also
+        reflect components whose current changed after being added.
+        """
+        self._contributions = [component.current.base_value for component, _ in self.components]
+        self._current_sum = math.fsum(contribution * component_qty for contribution, (_, component_qty) in zip(self._contributions, self.components))
+        self._current_compensation = 0.0
+        self._pending_updates = 0
+        self._publish_totals()
+    
+    def _publish_totals(self):
+        # The running sum is in A and A * V = W; the totals are reported in mA and mW
+        current_unit = ElectricCurrentUnits.MILLIAMPERE.value
+        power_unit = PowerUnits.MILLIWATT.value
+        current_sum = self._current_sum + self._current_compensation
+        power_sum = current_sum * self.nominal_voltage.base_value
+        self._total_current = ElectricCurrentQuantity(_from_base_value(current_sum, current_unit), current_unit)
+        self._total_power = PowerQuantity(_from_base_value(power_sum, power_unit), power_unit)
         
     @property
     def total_current(self) -> ElectricCurrentQuantity:
@@ -1,6 +1,5 @@
 from core.power_budget import *
 from core.baseDAO import BaseDAO
-from core.unit import *
 from core.utilities.json_utilities import *
 from core.dao_db_schema import (
     POWER_SUPPLIES_TABLE_NAME,
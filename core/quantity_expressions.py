@@ -0,0 +1,249 @@
+import numbers
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from core.conversion_managers import base_transform
+from core.physical_quantities import BaseQuantity, _quantity_class_for
+from core.unit import Dimensions, Unit
+
+__all__ = ['LazyExpression', 'lazy']
+
+_DIMENSIONLESS = Dimensions()
+
+
+class LazyExpression(ABC):
+    """A deferred arithmetic expression over quantities.
+
+    Operators on a LazyExpression build a small tree instead of intermediate
+    quantities; dimensions are checked once per node while the tree is built.
+    evaluate() folds every unit factor of the tree into a single constant and
+    computes the numeric part in one traversal, so the same expression works
+    with scalar values and with NumPy arrays.
+
+    Example:
+        >>> budget = (lazy(voltage) * current) / efficiency + static_power
+        >>> budget.evaluate(PowerUnits.WATT.value)
+    """
+
+    __slots__ = ('_dimensions', '_scale')
+    # Makes NumPy defer to the reflected operators (array * expression)
+    __array_ufunc__ = None
+
+    def __init__(self, dimensions: Dimensions) -> None:
+        self._dimensions = dimensions
+        self._scale = None
+
+    @property
+    def dimensions(self) -> Dimensions:
+        return self._dimensions
+
+    @property
+    def scale(self) -> float:
+        """Factor that converts the numeric part of the expression into coherent base units."""
+        scale = self._scale
+        if scale is None:
+            scale = self._scale = self._fold()
+        return scale
+
+    @abstractmethod
+    def _fold(self) -> float:
+        """Returns the product of the unit factors of the node (see scale)."""
+
+    @abstractmethod
+    def _numeric(self):
+        """Returns the numeric part of the node, in the units of its leaves."""
+
+    @abstractmethod
+    def _result_unit(self) -> Optional[Unit]:
+        """Returns the unit evaluate() reports in by default, if the node has one."""
+
+    @abstractmethod
+    def _quantity_class(self) -> Optional[type]:
+        """Returns the quantity class of the result, if the node has one."""
+
+    def __add__(self, other) -> "LazyExpression":
+        return _Sum(self, _as_expression(other), 1.0)
+
+    def __radd__(self, other) -> "LazyExpression":
+        # Lets the builtin sum() start from 0
+        if isinstance(other, numbers.Number) and other == 0:
+            return self
+        return _Sum(_as_expression(other), self, 1.0)
+
+    def __sub__(self, other) -> "LazyExpression":
+        return _Sum(self, _as_expression(other), -1.0)
+
+    def __rsub__(self, other) -> "LazyExpression":
+        return _Sum(_as_expression(other), self, -1.0)
+
+    def __mul__(self, other) -> "LazyExpression":
+        return _Product(self, _as_expression(other), False)
+
+    def __rmul__(self, other) -> "LazyExpression":
+        return _Product(_as_expression(other), self, False)
+
+    def __truediv__(self, other) -> "LazyExpression":
+        return _Product(self, _as_expression(other), True)
+
+    def __rtruediv__(self, other) -> "LazyExpression":
+        return _Product(_as_expression(other), self, True)
+
+    def __neg__(self) -> "LazyExpression":
+        return _Product(_Constant(-1.0), self, False)
+
+    def evaluate(self, unit: Unit = None):
+        """Materializes the expression.
+
+        :param unit: Unit of the result; defaults to the unit eager arithmetic would produce.
+        :return: A quantity of the class matching the result dimensions, or a plain
+            number (or array) when the expression is dimensionless and no unit is given.
+        """
+        # Folding the unit factors first also resolves the ratios used by the sums
+        scale = self.scale
+        target_unit = unit or self._result_unit()
+        if target_unit is None:
+            return self._numeric() * scale
+        if target_unit.dimensions is not self._dimensions:
+            raise ValueError(f'Cannot convert an expression with dimensions {self._dimensions} into {target_unit}')
+        transform = base_transform(target_unit)
+        if transform.is_linear:
+            value = self._numeric() * (scale / transform.scale)
+        else:
+            value = (self._numeric() * scale - transform.offset) / transform.scale
+        return _quantity_class_for(target_unit, self._quantity_class())(value, target_unit)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(dimensions={self._dimensions})'
+
+
+class _Leaf(LazyExpression):
+    __slots__ = ('_value', '_unit', '_class')
+
+    def __init__(self, quantity: BaseQuantity) -> None:
+        unit = quantity.unit
+        LazyExpression.__init__(self, unit.dimensions)
+        self._value = quantity.value
+        self._unit = unit
+        self._class = type(quantity)
+
+    def _fold(self) -> float:
+        transform = base_transform(self._unit)
+        if not transform.is_linear:
+            raise ValueError(f'Unit {self._unit} needs an affine conversion and cannot be used in a lazy expression')
+        return transform.scale
+
+    def _numeric(self):
+        return self._value
+
+    def _result_unit(self) -> Optional[Unit]:
+        return self._unit
+
+    def _quantity_class(self) -> Optional[type]:
+        return self._class
+
+
+class _Constant(LazyExpression):
+    __slots__ = ('_value',)
+
+    def __init__(self, value) -> None:
+        super().__init__(_DIMENSIONLESS)
+        self._value = value
+
+    def _fold(self) -> float:
+        return 1.0
+
+    def _numeric(self):
+        return self._value
+
+    def _result_unit(self) -> Optional[Unit]:
+        return None
+
+    def _quantity_class(self) -> Optional[type]:
+        return None
+
+
+class _Sum(LazyExpression):
+    __slots__ = ('_left', '_right', '_sign', '_ratio')
+
+    def __init__(self, left: LazyExpression, right: LazyExpression, sign: float) -> None:
+        if left.dimensions is not right.dimensions:
+            raise ValueError(f'Cannot operate on incompatible dimensions: {left.dimensions} and {right.dimensions}')
+        super().__init__(left.dimensions)
+        self._left = left
+        self._right = right
+        self._sign = sign
+        self._ratio = None
+
+    def _fold(self) -> float:
+        # The right operand is brought to the scale of the left one
+        left_scale = self._left.scale
+        self._ratio = self._sign * self._right.scale / left_scale
+        return left_scale
+
+    def _numeric(self):
+        left = self._left._numeric()
+        right = self._right._numeric()
+        if self._ratio == 1.0:
+            return left + right
+        if self._ratio == -1.0:
+            return left - right
+        return left + right * self._ratio
+
+    def _result_unit(self) -> Optional[Unit]:
+        return self._left._result_unit() or self._right._result_unit()
+
+    def _quantity_class(self) -> Optional[type]:
+        return self._left._quantity_class() or self._right._quantity_class()
+
+
+class _Product(LazyExpression):
+    __slots__ = ('_left', '_right', '_divide')
+
+    def __init__(self, left: LazyExpression, right: LazyExpression, divide: bool) -> None:
+        if divide:
+            super().__init__(left.dimensions / right.dimensions)
+        else:
+            super().__init__(left.dimensions * right.dimensions)
+        self._left = left
+        self._right = right
+        self._divide = divide
+
+    def _fold(self) -> float:
+        if self._divide:
+            return self._left.scale / self._right.scale
+        return self._left.scale * self._right.scale
+
+    def _numeric(self):
+        if self._divide:
+            return self._left._numeric() / self._right._numeric()
+        return self._left._numeric() * self._right._numeric()
+
+    def _result_unit(self) -> Optional[Unit]:
+        left_unit = self._left._result_unit()
+        right_unit = self._right._result_unit()
+        if right_unit is None:
+            return left_unit
+        if left_unit is None:
+            return right_unit ** -1 if self._divide else right_unit
+        return left_unit / right_unit if self._divide else left_unit * right_unit
+
+    def _quantity_class(self) -> Optional[type]:
+        return self._left._quantity_class() or self._right._quantity_class()
+
+
+def _as_expression(operand) -> LazyExpression:
+    if isinstance(operand, LazyExpression):
+        return operand
+    if isinstance(operand, BaseQuantity):
+        return _Leaf(operand)
+    if isinstance(operand, numbers.Number) or hasattr(operand, '__array__'):
+        # Plain numbers and arrays are dimensionless factors
+        return _Constant(operand)
+    raise TypeError(f'Cannot use {type(operand).__name__} in a quantity expression.')
+
+
+def lazy(quantity: BaseQuantity) -> LazyExpression:
+    """Starts a lazy expression from a quantity (its value may be a number or a NumPy array)."""
+    if not isinstance(quantity, BaseQuantity):
+        raise TypeError('Can only build a lazy expression from a BaseQuantity.')
+    return _Leaf(quantity)
@@ -0,0 +1,286 @@
+"""Memory-mapped, append-only time series of quantities.
+
+File layout (little-endian):
+
+    offset  size  field
+    0       8     magic b'PQSERIES'
+    8       4     format version
+    12      4     header size, i.e. offset of the first sample (multiple of 64)
+    16      8     number of samples written (updated after each append)
+    24      ...   JSON metadata (unit symbol, quantity type, dtype, timestamps),
+                  padded with spaces up to the header size
+    header  ...   raw samples (float64, float32 or float16), contiguous
+
+Sample i was taken at ``start + i * interval`` (seconds since the epoch).
+Appending writes the new samples first and only then bumps the sample count,
+so readers that have the file open never see a partially written sample;
+they pick up new samples on their next read of the count.
+"""
+import json
+import os
+import struct
+import threading
+import time
+from typing import Optional
+
+from core.physical_quantities import QUANTITY_CLASS_BY_TYPE, BaseQuantity, QuantityArray, _numpy, find_quantity_class_by_dimensions
+from core.unit import Unit, find_dimensions_by_unit_type, find_unit_type_by_symbol, parse_unit
+
+__all__ = ['QuantitySeries', 'SERIES_DTYPES']
+
+MAGIC = b'PQSERIES'
+FORMAT_VERSION = 1
+_PREFIX = struct.Struct('<8sIIQ')
+_COUNT_OFFSET = 16
+_HEADER_ALIGNMENT = 64
+_MIN_HEADER_SIZE = 256
+
+# Storage types accepted for the samples
+SERIES_DTYPES = ('<f8', '<f4', '<f2')
+
+
+def _quantity_class_of(quantity_type: Optional[str], unit: Unit) -> type:
+    if quantity_type is not None and find_dimensions_by_unit_type(quantity_type) not in (None, unit.dimensions):
+        raise ValueError(f'Unit {unit} is not a {quantity_type} unit')
+    quantity_class = QUANTITY_CLASS_BY_TYPE.get(quantity_type) or find_quantity_class_by_dimensions(unit.dimensions)
+    if quantity_class is None:
+        raise ValueError(f'No quantity class for {quantity_type or unit}; a series needs one of {sorted(QUANTITY_CLASS_BY_TYPE)}')
+    return quantity_class
+
+
+class QuantitySeries:
+    """A time series of quantities of one unit, backed by a memory-mapped file.
+
+    Use QuantitySeries.create() to start a new file and QuantitySeries.open()
+    to read (or keep appending to) an existing one. Reading returns
+    QuantityArray views over the mapped file, so slices and reductions only
+    touch the pages they need instead of loading the whole history.
+
+    Example:
+        >>> with QuantitySeries.create('rail_3v3.pqs', ElectricCurrentUnits.MILLIAMPERE.value, interval=0.01) as series:
+        ...     series.append(samples)
+        >>> with QuantitySeries.open('rail_3v3.pqs') as series:
+        ...     series[-1000:].mean()
+    """
+
+    def __init__(self, path: str, mode: str = 'r') -> None:
+        if mode not in ('r', 'r+'):
+            raise ValueError("mode must be 'r' (read-only) or 'r+' (read and append)")
+        self._path = path
+        self._writable = mode == 'r+'
+        # Unbuffered, so the sample count is always read from the file, never from a stale buffer
+        self._file = open(path, 'r+b' if self._writable else 'rb', buffering=0)
+        self._lock = threading.Lock()
+        self._mapped = None
+        self._mapped_count = 0
+        try:
+            self._read_header()
+        except Exception:
+            self._file.close()
+            raise
+
+    @classmethod
+    def create(cls, path: str, unit: Unit, quantity_type: str = None, dtype: str = '<f8',
+               start: float = None, interval: float = 1.0, overwrite: bool = False) -> "QuantitySeries":
+        """Creates an empty series file and returns it opened for appending.
+
+        :param path: File to create.
+        :param unit: Unit of every sample.
+        :param quantity_type: Quantity type (e.g. 'electric_current'); defaults to the type of the unit.
+        :param dtype: Sample storage type, '<f8' (float64), '<f4' (float32) or '<f2' (float16);
+            see max_relative_error() for the rounding each one introduces.
+        :param start: Timestamp of the first sample in seconds since the epoch; defaults to now.
+        :param interval: Seconds between consecutive samples.
+        :param overwrite: Replace the file if it already exists.
+        """
+        np = _numpy()
+        dtype = np.dtype(dtype).newbyteorder('<').str
+        if dtype not in SERIES_DTYPES:
+            raise ValueError(f'Unsupported sample type {dtype}; use one of {SERIES_DTYPES}')
+        if interval <= 0:
+            raise ValueError('interval must be positive.')
+        if quantity_type is None:
+            quantity_type = _quantity_class_of(find_unit_type_by_symbol(unit.symbol), unit).quantity_type
+        else:
+            _quantity_class_of(quantity_type, unit)
+        created = time.time()
+        metadata = {
+            'unit': unit.symbol,
+            'quantity_type': quantity_type,
+            'dtype': dtype,
+            'start': created if start is None else float(start),
+            'interval': float(interval),
+            'created': created,
+        }
+        encoded = json.dumps(metadata, ensure_ascii=False).encode('utf-8')
+        header_size = max(_MIN_HEADER_SIZE, _PREFIX.size + len(encoded))
+        header_size = -(-header_size // _HEADER_ALIGNMENT) * _HEADER_ALIGNMENT
+        header = _PREFIX.pack(MAGIC, FORMAT_VERSION, header_size, 0) + encoded
+        with open(path, 'wb' if overwrite else 'xb') as file:
+            file.write(header.ljust(header_size, b' '))
+        return cls(path, 'r+')
+
+    @classmethod
+    def open(cls, path: str, mode: str = 'r') -> "QuantitySeries":
+        """Opens an existing series, read-only ('r') or for appending ('r+')."""
+        return cls(path, mode)
+
+    def _read_header(self) -> None:
+        prefix = self._file.read(_PREFIX.size)
+        if len(prefix) < _PREFIX.size:
+            raise ValueError(f'{self._path} is not a quantity series file (truncated header)')
+        magic, version, header_size, _ = _PREFIX.unpack(prefix)
+        if magic != MAGIC:
+            raise ValueError(f'{self._path} is not a quantity series file')
+        if version != FORMAT_VERSION:
+            raise ValueError(f'Unsupported quantity series format version {version}')
+        metadata = json.loads(self._file.read(header_size - _PREFIX.size).decode('utf-8'))
+        np = _numpy()
+        self._header_size = header_size
+        self._metadata = metadata
+        self._dtype = np.dtype(metadata['dtype'])
+        self._unit = parse_unit(metadata['unit'])
+        self._quantity_class = _quantity_class_of(metadata['quantity_type'], self._unit)
+
+    # ------------------------------------------------------------------
+    # Metadata
+    # ------------------------------------------------------------------
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def unit(self) -> Unit:
+        return self._unit
+
+    @property
+    def quantity_type(self) -> str:
+        return self._metadata['quantity_type']
+
+    @property
+    def quantity_class(self) -> type:
+        return self._quantity_class
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def start(self) -> float:
+        """Timestamp of the first sample, in seconds since the epoch."""
+        return self._metadata['start']
+
+    @property
+    def interval(self) -> float:
+        """Seconds between consecutive samples."""
+        return self._metadata['interval']
+
+    @property
+    def created(self) -> float:
+        return self._metadata['created']
+
+    def __repr__(self) -> str:
+        return f'QuantitySeries({self._path!r}, unit={self._unit.symbol}, dtype={self._dtype.str}, samples={len(self)})'
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _read_count(self) -> int:
+        with self._lock:
+            self._file.seek(_COUNT_OFFSET)
+            return struct.unpack('<Q', self._file.read(8))[0]
+
+    def __len__(self) -> int:
+        return self._read_count()
+
+    def _samples(self):
+        # Maps the samples written so far; the mapping is renewed only when the series grew
+        count = self._read_count()
+        if self._mapped is None or count != self._mapped_count:
+            np = _numpy()
+            if count == 0:
+                self._mapped = np.empty(0, dtype=self._dtype)
+            else:
+                self._mapped = np.memmap(self._path, dtype=self._dtype, mode='r', offset=self._header_size, shape=(count,))
+            self._mapped_count = count
+        return self._mapped
+
+    def array(self) -> QuantityArray:
+        """Returns all the samples as a zero-copy, read-only QuantityArray view of the file."""
+        return QuantityArray._wrap(self._samples(), self._unit, self._quantity_class)
+
+    def __getitem__(self, key):
+        return self.array()[key]
+
+    def timestamps(self, start: int = None, stop: int = None):
+        """Returns the timestamps (seconds since the epoch) of samples start..stop as a NumPy array."""
+        np = _numpy()
+        first, last, _ = slice(start, stop).indices(len(self))
+        return self.start + np.arange(first, max(first, last), dtype=np.float64) * self.interval
+
+    def index_at(self, timestamp: float) -> int:
+        """Returns the index of the sample taken at (or just before) timestamp."""
+        return int((timestamp - self.start) // self.interval)
+
+    # ------------------------------------------------------------------
+    # Appending
+    # ------------------------------------------------------------------
+
+    def append(self, samples) -> int:
+        """Appends samples and returns the new number of samples.
+
+        :param samples: A QuantityArray, a quantity, a sequence of quantities, or plain
+            numbers (taken to be in the unit of the series). Quantities are converted
+            to the unit of the series (in float64) before being stored in its dtype.
+        """
+        if not self._writable:
+            raise ValueError('The series was opened read-only.')
+        np = _numpy()
+        if isinstance(samples, BaseQuantity):
+            samples = [samples]
+        if isinstance(samples, (list, tuple)) and samples and isinstance(samples[0], BaseQuantity):
+            samples = QuantityArray.from_quantities(samples, self._unit)
+        if isinstance(samples, QuantityArray):
+            if samples.quantity_class is not self._quantity_class:
+                raise TypeError(f'Cannot append {samples.quantity_class} samples to a {self._quantity_class} series')
+            samples = samples.convert_to(self._unit).values if samples.unit is not self._unit else samples.values
+        data = np.ascontiguousarray(samples, dtype=self._dtype).reshape(-1)
+        with self._lock:
+            self._file.seek(_COUNT_OFFSET)
+            count = struct.unpack('<Q', self._file.read(8))[0]
+            # Samples first, then the count: readers never see a partial append
+            self._file.seek(self._header_size + count * self._dtype.itemsize)
+            self._write_all(memoryview(data).cast('B'))
+            count += len(data)
+            self._file.seek(_COUNT_OFFSET)
+            self._write_all(struct.pack('<Q', count))
+        return count
+
+    def _write_all(self, buffer) -> None:
+        # The file is unbuffered, so a single write may be partial
+        view = memoryview(buffer)
+        while view:
+            view = view[self._file.write(view):]
+
+    def flush(self) -> None:
+        """Forces the appended samples to disk."""
+        with self._lock:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    # ------------------------------------------------------------------
+    # Lifetime
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        # Views returned earlier keep their own mapping and stay valid
+        self._mapped = None
+        self._file.close()
+
+    def __enter__(self) -> "QuantitySeries":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -1,15 +1,110 @@
-from typing import Dict, Optional, Union, Mapping
+from typing import Dict, Optional, Tuple, Union, Mapping
+from collections import OrderedDict
 from enum import Enum
 from fractions import Fraction
+from functools import lru_cache
 import numbers
+import re
+import threading
+import weakref
 
 Numeric = Union[int, float, Fraction]
 
+__all__ = [
+    "Numeric", "Dimensions", "Unit",
+    # Dimensions
+    "LENGTH_DIMENSIONS", "TIME_DIMENSIONS", "MASS_DIMENSIONS", "TEMPERATURE_DIMENSIONS",
+    "ELECTRIC_CURRENT_DIMENSIONS", "AMOUNT_SUBSTANCE_DIMENSIONS",
+    "LUMINOUS_INTENSITY_DIMENSIONS", "FORCE_DIMENSIONS", "PRESSURE_DIMENSIONS",
+    "ENERGY_DIMENSIONS", "POWER_DIMENSIONS", "VOLTAGE_DIMENSIONS",
+    "FREQUENCY_DIMENSIONS", "ANGULAR_VELOCITY_DIMENSIONS", "ELECTRIC_CHARGE_DIMENSIONS",
+    "MAGNETIC_FLUX_DIMENSIONS", "MAGNETIC_FIELD_DIMENSIONS", "INDUCTANCE_DIMENSIONS",
+    "CAPACITANCE_DIMENSIONS", "RESISTANCE_DIMENSIONS", "CONDUCTANCE_DIMENSIONS",
+    "ILLUMINATION_DIMENSIONS", "ANGLE_DIMENSIONS", "AREA_DIMENSIONS",
+    "VOLUME_DIMENSIONS", "FLOW_RATE_DIMENSIONS", "MASS_FLOW_RATE_DIMENSIONS",
+    "SPEED_DIMENSIONS", "ACCELERATION_DIMENSIONS", "THERMAL_CONDUCTIVITY_DIMENSIONS",
+    "THERMAL_RESISTANCE_DIMENSIONS", "ALL_DIMENSIONS",
+    # Unit algebra
+    "BASE_UNIT_SYMBOLS", "CANONICAL_SCALE_DIGITS", "UNIT_ALGEBRA_CACHE_SIZE",
+    "clear_unit_algebra_cache",
+    # Unit catalogue (built lazily, one Enum per quantity family)
+    "LengthUnits", "TimeUnits", "MassUnits", "TemperatureUnits", "ElectricCurrentUnits",
+    "AmountSubstanceUnits", "LuminousIntensityUnits", "ForceUnits", "PressureUnits",
+    "EnergyUnits", "PowerUnits", "VoltageUnits", "FrequencyUnits",
+    "ElectricChargeUnits", "MagneticFluxUnits", "MagneticFieldUnits", "InductanceUnits",
+    "CapacitanceUnits", "ResistanceUnits", "ConductanceUnits", "IlluminationUnits",
+    "AngleUnits", "AreaUnits", "VolumeUnits", "FlowRateUnits", "MassFlowRateUnits",
+    "SpeedUnits", "AccelerationUnits", "ThermalConductivityUnits",
+    "ThermalResistanceUnits", "MockUnits", "UNIT_ENUM_BY_QUANTITY",
+    # Lookups and parsing
+    "find_unit_by_symbol", "find_unit_by_name", "find_name_by_symbol",
+    "find_name_by_unit", "find_unit_type_by_symbol", "find_unit_type_by_name",
+    "find_dimensions_by_unit_type",
+    "UNIT_PARSER_CACHE_SIZE", "parse_unit",
+]
+
+
+# Codificación compacta de dimensiones: las bases SI más el ángulo ("") ocupan
+# un campo fijo de un entero empaquetado. Cada campo guarda el exponente
+# multiplicado por _EXPONENT_SCALE (admite semienteros) más un sesgo, de modo
+# que multiplicar o dividir dimensiones es una suma o resta de enteros.
+_PACKED_BASES: Tuple[str, ...] = ("M", "L", "T", "I", "Θ", "N", "J", "")
+_PACKED_BASE_INDEX: Dict[str, int] = {base: i for i, base in enumerate(_PACKED_BASES)}
+_EXPONENT_SCALE = 2
+_FIELD_BITS = 16
+_FIELD_MASK = (1 << _FIELD_BITS) - 1
+_FIELD_BIAS = 1 << (_FIELD_BITS - 1)
+# Límite de los exponentes escalados: la suma o resta de dos valores válidos
+# nunca desborda su campo, así que no hay acarreos entre campos.
+_FIELD_LIMIT = 1 << (_FIELD_BITS - 3)
+_PACKED_BIAS = sum(_FIELD_BIAS << (_FIELD_BITS * i) for i in range(len(_PACKED_BASES)))
+
+
+def _pack_exponents(dimensions_dict: Mapping[str, Fraction]) -> Optional[int]:
+    """Encode normalized exponents as a packed integer, or None if they don't fit."""
+    packed = _PACKED_BIAS
+    for dim, exponent in dimensions_dict.items():
+        index = _PACKED_BASE_INDEX.get(dim)
+        if index is None:
+            return None
+        scaled = exponent * _EXPONENT_SCALE
+        if scaled.denominator != 1 or abs(scaled.numerator) > _FIELD_LIMIT:
+            return None
+        packed += scaled.numerator << (_FIELD_BITS * index)
+    return packed
+
+
+def _unpack_exponents(packed: int) -> Dict[str, Fraction]:
+    """Decode a packed integer back into a dimensions dictionary."""
+    dimensions_dict = {}
+    for index, base in enumerate(_PACKED_BASES):
+        scaled = ((packed >> (_FIELD_BITS * index)) & _FIELD_MASK) - _FIELD_BIAS
+        if scaled:
+            dimensions_dict[base] = Fraction(scaled, _EXPONENT_SCALE)
+    return dimensions_dict
+
 
 class Dimensions:
+    """Immutable set of dimension exponents (e.g. {"M": 1, "L": 2, "T": -3}).
+
+    Instances are interned: building the same exponent set twice returns the
+    very same object, so equality is an identity check and dimensions can be
+    used as dictionary keys or set members.
+
+    Dimensions made only of the SI bases and angle with integer or
+    half-integer exponents also carry a packed integer encoding; products and
+    quotients between them are computed on that integer. Any other exponent
+    set falls back to Fraction arithmetic.
+    """
+
+    __slots__ = ("__dimensions_dict", "_key", "_hash", "_packed", "__weakref__")
+
+    _INTERNED: "weakref.WeakValueDictionary[Tuple[Tuple[str, Fraction], ...], Dimensions]" = weakref.WeakValueDictionary()
+    _INTERNED_BY_PACKED: "weakref.WeakValueDictionary[int, Dimensions]" = weakref.WeakValueDictionary()
+    _INTERN_LOCK = threading.Lock()
 
-    def __init__(self, dimensions_dict: Optional[Mapping[str, Numeric]] = None) -> None:
-        self.__dimensions_dict: Dict[str, Fraction] = {}
+    def __new__(cls, dimensions_dict: Optional[Mapping[str, Numeric]] = None) -> "Dimensions":
+        normalized_dict: Dict[str, Fraction] = {}
         if dimensions_dict:
             for dim, exponent in dimensions_dict.items():
                 # 1. Validación: Debe ser un número
@@ -22,7 +117,52 @@ class Dimensions:
 
                 # 3. Normalización: Guardamos solo si no es cero
                 if frac_exponent != 0:
-                    self.__dimensions_dict[dim] = frac_exponent
+                    normalized_dict[dim] = frac_exponent
+
+        # 4. Interning: una sola instancia por conjunto de exponentes
+        key = tuple(sorted(normalized_dict.items()))
+        instance = cls._INTERNED.get(key)
+        if instance is None:
+            with cls._INTERN_LOCK:
+                instance = cls._INTERNED.get(key)
+                if instance is None:
+                    instance = super().__new__(cls)
+                    object.__setattr__(instance, "_Dimensions__dimensions_dict", normalized_dict)
+                    object.__setattr__(instance, "_key", key)
+                    object.__setattr__(instance, "_hash", hash(key))
+                    packed = _pack_exponents(normalized_dict)
+                    object.__setattr__(instance, "_packed", packed)
+                    cls._INTERNED[key] = instance
+                    if packed is not None:
+                        cls._INTERNED_BY_PACKED[packed] = instance
+        return instance
+
+    @classmethod
+    def _from_packed(cls, packed: int) -> "Dimensions":
+        """Return the interned instance for a packed encoding."""
+        instance = cls._INTERNED_BY_PACKED.get(packed)
+        if instance is None:
+            instance = cls(_unpack_exponents(packed))
+        return instance
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("Dimensions objects are immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Dimensions objects are immutable.")
+
+    def __reduce__(self):
+        # Unpickling goes through __new__ again, so the result is interned too
+        return (Dimensions, (self.__dimensions_dict,))
+
+    def __copy__(self) -> "Dimensions":
+        return self
+
+    def __deepcopy__(self, memo) -> "Dimensions":
+        return self
+
+    def __hash__(self) -> int:
+        return self._hash
 
     @property
     def is_dimensionless(self) -> bool:
@@ -30,9 +170,8 @@ class Dimensions:
         return not bool(self.__dimensions_dict)
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Dimensions):
-            return False
-        return self.__dimensions_dict == other.__dimensions_dict
+        # Interned instances: same exponents <=> same object
+        return self is other
 
     def __pow__(self, exponent: Numeric) -> "Dimensions":
         """Raise each dimension's exponent to the power of a constant exponent."""
@@ -94,6 +233,9 @@ class Dimensions:
         if not isinstance(other, Dimensions):
             raise TypeError("Can only multiply with another Dimensions instance.")
 
+        if self._packed is not None and other._packed is not None:
+            return Dimensions._from_packed(self._packed + other._packed - _PACKED_BIAS)
+
         new_dimensions = (
             self.__dimensions_dict.copy()
         )  # Start with the current dimensions
@@ -109,6 +251,9 @@ class Dimensions:
         if not isinstance(other, Dimensions):
             raise TypeError("Can only divide with another Dimensions instance.")
 
+        if self._packed is not None and other._packed is not None:
+            return Dimensions._from_packed(self._packed - other._packed + _PACKED_BIAS)
+
         new_dimensions = (
             self.__dimensions_dict.copy()
         )  # Start with the current dimensions
@@ -198,40 +343,107 @@ ALL_DIMENSIONS = (
 )
 
 
+# SI base unit of each dimension, used to spell out canonical forms.
+# Angle conversion tables are based on the degree.
+BASE_UNIT_SYMBOLS: Dict[str, str] = {
+    "M": "kg",
+    "L": "m",
+    "T": "s",
+    "I": "A",
+    "Θ": "K",
+    "N": "mol",
+    "J": "cd",
+    "": "°",
+}
+CANONICAL_SCALE_DIGITS = 12
+_UNRESOLVED_SCALE = object()
+
+
 class Unit:
 
-    # Mapping of equivalent unit symbols
-    EQUIVALENT_UNITS = {
-        "N": "kg*m/s²",  # Newton is equivalent to kilogram meter per square second
-        "kg*m/s²": "N",
-        "Pa": "N/m²",  # Pascal is equivalent to Newton per square meter
-        "N/m²": "Pa",
-        "J": "N*m",  # Joule is equivalent to Newton meter
-        "N*m": "J",
-        "W": "J/s",  # Watt is equivalent to Joule per second
-        "J/s": "W",
-        "C": "A*s",  # Coulomb is equivalent to Ampere second
-        "A*s": "C",
-        "V": "W/A",  # Volt is equivalent to Watt per Ampere
-        "W/A": "V",
-        "Ω": "V/A",  # Ohm is equivalent to Volt per Ampere
-        "V/A": "Ω",
-        "F": "C/V",  # Farad is equivalent to Coulomb per Volt
-        "C/V": "F",
-        "H": "V*s/A",  # Henry is equivalent to Volt second per Ampere
-        "V*s/A": "H",
-        "S": "1/Ω",  # Siemens is equivalent to the reciprocal of Ohm
-        "1/Ω": "S",
-        "lx": "cd/m²",  # Lux is equivalent to candela per square meter
-        "cd/m²": "lx",
-        "T": "Wb/m²",  # Tesla is equivalent to Weber per square meter
-        "Wb/m²": "T",
-    }
-
-    def __init__(self, name: str, symbol: str, dimensions: Dimensions) -> None:
-        self._name = name
-        self._symbol = symbol
-        self._dimensions = dimensions or {}
+    """A named unit of measurement.
+
+    Besides its name and symbol, every unit has a canonical form: the SI base
+    units of its dimensions with their exponents, plus the scale factor of the
+    unit in those base units (N and kg*m/s² both resolve to kg*m*s^-2 with
+    scale 1). Units compare and hash by canonical form, registered or not, so
+    W, VA and V*A are all equal; a single temperature unit also keeps its
+    offset, which tells K and °C apart. Units without a conversion table only
+    equal units with the same symbol and dimensions.
+    """
+
+    __slots__ = ("_name", "_symbol", "_dimensions", "_terms", "_is_compound", "_scale", "_key", "_base_transform", "__weakref__")
+
+    # Interned units, keyed by (name, symbol, dimensions, terms)
+    _INTERNED: "weakref.WeakValueDictionary[tuple, Unit]" = weakref.WeakValueDictionary()
+    _INTERN_LOCK = threading.Lock()
+
+    def __new__(cls, name: str, symbol: str, dimensions: Dimensions, terms: Optional[Mapping[str, Numeric]] = None) -> "Unit":
+        if dimensions is None:
+            dimensions = Dimensions()
+        elif not isinstance(dimensions, Dimensions):
+            dimensions = Dimensions(dimensions)
+        # Registered unit symbols this unit is made of (e.g. kW*hour -> {kW: 1, hour: 1}).
+        # A unit without explicit terms is its own single term.
+        if terms is None:
+            normalized_terms: Tuple[Tuple[str, Fraction], ...] = ((symbol, Fraction(1)),)
+        else:
+            normalized_terms = tuple(
+                sorted((term, Fraction(exponent)) for term, exponent in terms.items() if exponent != 0)
+            )
+
+        key = (name, symbol, dimensions, normalized_terms)
+        instance = cls._INTERNED.get(key)
+        if instance is None:
+            with cls._INTERN_LOCK:
+                instance = cls._INTERNED.get(key)
+                if instance is None:
+                    instance = super().__new__(cls)
+                    instance._name = name
+                    instance._symbol = symbol
+                    instance._dimensions = dimensions
+                    instance._terms = normalized_terms
+                    instance._is_compound = normalized_terms != ((symbol, 1),)
+                    # Resolved from the conversion tables on first use
+                    instance._scale = _UNRESOLVED_SCALE
+                    instance._key = None
+                    # Cached by conversion_managers.base_transform
+                    instance._base_transform = None
+                    cls._INTERNED[key] = instance
+        return instance
+
+    @classmethod
+    def _detached(cls, name: str, symbol: str, dimensions: Dimensions) -> "Unit":
+        """Builds a unit outside the intern table that is only equal to itself.
+
+        Used for units defined by a UnitRegistry: two registries may give the
+        same symbol different factors, so their units must not share an
+        interned object nor its cached scale.
+        """
+        instance = object.__new__(cls)
+        instance._name = name
+        instance._symbol = symbol
+        instance._dimensions = dimensions
+        instance._terms = ((symbol, Fraction(1)),)
+        instance._is_compound = False
+        # Only the registry that defined the unit knows its scale
+        instance._scale = None
+        instance._key = (dimensions, None, object())
+        instance._base_transform = None
+        return instance
+
+    def __reduce__(self):
+        # Unpickling goes through __new__ again, so the result is interned too
+        return (Unit, (self._name, self._symbol, self._dimensions, dict(self._terms)))
+
+    def __copy__(self) -> "Unit":
+        return self
+
+    def __deepcopy__(self, memo) -> "Unit":
+        return self
+
+    def __hash__(self) -> int:
+        return hash(self._equality_key())
 
     @property
     def name(self) -> str:
@@ -245,11 +457,78 @@ class Unit:
     def dimensions(self) -> Dimensions:
         return self._dimensions
 
+    @property
+    def terms(self) -> Tuple[Tuple[str, Fraction], ...]:
+        """Sorted (symbol, exponent) pairs of the registered units this unit is built from."""
+        return self._terms
+
+    @property
+    def is_compound(self) -> bool:
+        return self._is_compound
+
+    @property
+    def scale(self) -> Optional[float]:
+        """Size of the unit in the SI base units of its dimensions, or None if unknown.
+
+        The value is rounded to CANONICAL_SCALE_DIGITS significant digits so
+        that equivalent units built along different paths compare equal.
+        Temperature units resolve to the size of their degree.
+        """
+        scale = self._scale
+        if scale is _UNRESOLVED_SCALE:
+            # Imported here: conversion_managers depends on this module
+            from .conversion_managers import base_scale
+
+            try:
+                scale = float(f"{base_scale(self):.{CANONICAL_SCALE_DIGITS}g}")
+            except ValueError:
+                scale = None
+            self._scale = scale
+        return scale
+
+    @property
+    def canonical_form(self) -> Tuple[Tuple[Tuple[str, Fraction], ...], float]:
+        """Sorted (base unit, exponent) pairs and the scale factor of this unit.
+
+        Raises:
+            ValueError: If the unit has no conversion table to resolve its scale
+        """
+        scale = self.scale
+        if scale is None:
+            raise ValueError(f"No conversion table available for unit: {self._symbol}")
+        base_terms = tuple(
+            sorted((BASE_UNIT_SYMBOLS.get(dim, dim), exponent) for dim, exponent in self._dimensions.dimensions_dict.items())
+        )
+        return base_terms, scale
+
+    def _equality_key(self) -> tuple:
+        # Resolved on first use and cached; see __eq__
+        key = self._key
+        if key is None:
+            if not self._is_compound:
+                key = (self._dimensions, self._symbol)
+            else:
+                counterpart = _registered_counterpart(self)
+                if counterpart is not None:
+                    key = counterpart._equality_key()
+                elif self.scale is None:
+                    key = (self._dimensions, None, self._symbol)
+                else:
+                    key = (self._dimensions, self.scale)
+            self._key = key
+        return key
+
+    def _combine_terms(self, other: "Unit", sign: int) -> Dict[str, Fraction]:
+        combined = dict(self._terms)
+        for term, exponent in other._terms:
+            combined[term] = combined.get(term, 0) + sign * exponent
+        return combined
+
     def is_compatible_with(self, other: "Unit") -> bool:
         """Check if this unit is compatible with another unit."""
         if not isinstance(other, Unit):
             raise TypeError("Can only check compatibility with another Unit.")
-        return self.dimensions == other.dimensions
+        return self._dimensions is other._dimensions
 
     def __repr__(self) -> str:
         """Return a more detailed representation of the unit."""
@@ -262,555 +541,570 @@ class Unit:
         """Multiplying two units combines their dimensions."""
         if not isinstance(other, Unit):
             raise TypeError("Can only multiply by another Unit.")
+        return _cached_unit_algebra("*", self, other, Unit._multiply)
 
+    def _multiply(self, other: "Unit") -> "Unit":
         # Use the combine_dimensions method to combine the dimensions
         new_dimensions = self._dimensions * other._dimensions
 
         if self._symbol == other._symbol:
-            # Consolidate the symbol with an exponent if they are the same
-            if "^" in self._symbol:
-                base_symbol, existing_power = self._symbol.split("^")
-                new_power = int(existing_power) + 1
-                new_symbol = f"{base_symbol}^{new_power}"
-            elif "³" in self._symbol:
-                new_symbol = f"{self._symbol}⁴"
-            elif "²" in self._symbol:
-                new_symbol = f"{self._symbol}³"
-            else:
-                new_symbol = f"{self._symbol}²"
-            new_name = f"{self._name}^{new_symbol[-1]}"
+            # Consolidate the symbol with an exponent if they are the same (m*m -> m², m²*m² -> m⁴)
+            new_symbol = _squared_symbol(self._symbol)
+            new_name = f"{self._name}^2"
         else:
             new_name = f"{self._name}*{other._name}"
             new_symbol = f"{self._symbol}*{other._symbol}"  # Concatenate symbols
 
-        return Unit(new_name, new_symbol, new_dimensions)
+        return Unit(new_name, new_symbol, new_dimensions, self._combine_terms(other, 1))
 
     def __truediv__(self, other: "Unit") -> "Unit":
         """Dividing two units combines their dimensions with subtracted exponents."""
         if not isinstance(other, Unit):
             raise TypeError("Can only divide by another Unit.")
+        return _cached_unit_algebra("/", self, other, Unit._divide)
 
+    def _divide(self, other: "Unit") -> "Unit":
         # Use the divide_dimensions method to divide the dimensions
         new_dimensions = self._dimensions / other._dimensions
         new_name = f"{self._name}/{other._name}"
-        new_symbol = f"{self._symbol}/{other._symbol}"
+        new_symbol = f"{self._symbol}/{_grouped_symbol(other._symbol)}"
 
-        return Unit(new_name, new_symbol, new_dimensions)
+        return Unit(new_name, new_symbol, new_dimensions, self._combine_terms(other, -1))
 
     def is_dimensionless(self) -> bool:
         """Check if the unit is dimensionless."""
         return self._dimensions.is_dimensionless
 
     def __eq__(self, other: "Unit") -> bool:
-        """Check if two units are equal by comparing their dimensions and symbols."""
-        if not isinstance(other, Unit) or not self.is_compatible_with(other):
-            return False
-        # Check if symbols are equivalent, considering the mapping
-        if self._symbol == other._symbol:
+        """Check if two units are equal.
+
+        A registered unit is identified by its symbol, so W, VA and var stay
+        different units. A compound unit is resolved to the first registered
+        unit with its dimensions and canonical scale (kg*m/s² == N, V*A == W),
+        or compared by that scale when there is none. The relation is
+        transitive and consistent with __hash__.
+        """
+        if self is other:
             return True
-        elif self._symbol in Unit.EQUIVALENT_UNITS:
-            return Unit.EQUIVALENT_UNITS[self._symbol] == other._symbol
-        return False
+        if not isinstance(other, Unit) or self._dimensions is not other._dimensions:
+            return False
+        return self._equality_key() == other._equality_key()
 
     def __pow__(self, power: Numeric) -> "Unit":
         """Raise the unit to the given power, adjusting the dimensions accordingly."""
         if not isinstance(power, numbers.Number):
             raise TypeError("Power must be a number.")
+        # 2 and 2.0 format differently, so the type is part of the cache key
+        return _cached_unit_algebra("**", self, (type(power), power), Unit._power)
 
+    def _power(self, operand: Tuple[type, Numeric]) -> "Unit":
+        power = operand[1]
         new_dimensions = self._dimensions**power
         # Formateo básico del nombre y símbolo
         # Nota: Si es fracción, el símbolo quedará como "m^0.5" o "m^1/2"
         # Podrías mejorar esta lógica de string si quisieras, pero esto es funcional.
         new_name = f"({self._name})^{power}"
-        new_symbol = f"{self._symbol}^{power}"
+        new_symbol = f"{_grouped_symbol(self._symbol)}^{power}"
+        new_terms = {term: exponent * Fraction(power) for term, exponent in self._terms}
 
-        return Unit(new_name, new_symbol, new_dimensions)
+        return Unit(new_name, new_symbol, new_dimensions, new_terms)
 
 
-# Unit definition
+def _grouped_symbol(symbol: str) -> str:
+    """Parenthesize compound symbols used as a divisor or a power base (m/(s*A), (m/s)^2)."""
+    if "*" in symbol or "/" in symbol:
+        return f"({symbol})"
+    return symbol
+
+
+_TO_SUPERSCRIPT = str.maketrans("0123456789-", "⁰¹²³⁴⁵⁶⁷⁸⁹⁻")
+_FROM_SUPERSCRIPT = str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹⁻", "0123456789-")
+_POWER_SYMBOL_PATTERN = re.compile(r"^(?P<base>[^*/^()⁰¹²³⁴⁵⁶⁷⁸⁹⁻]+)(?:(?P<superscript>[⁰¹²³⁴⁵⁶⁷⁸⁹⁻]+)|\^(?P<power>-?\d+))?$")
+
+
+def _squared_symbol(symbol: str) -> str:
+    """Symbol of a unit multiplied by itself, doubling any integer exponent it already has."""
+    match = _POWER_SYMBOL_PATTERN.match(symbol)
+    if match is None:
+        return f"({symbol})²"
+    if match.group("superscript"):
+        power = int(match.group("superscript").translate(_FROM_SUPERSCRIPT))
+    elif match.group("power"):
+        power = int(match.group("power"))
+    else:
+        power = 1
+    return match.group("base") + str(2 * power).translate(_TO_SUPERSCRIPT)
 
 
-# Length Unit
-class LengthUnits(Enum):
-    METER = Unit("meter", "m", LENGTH_DIMENSIONS)
-    MICROMETER = Unit("micrometer", "μm", LENGTH_DIMENSIONS)
-    NANOMETER = Unit("nanometer", "nm", LENGTH_DIMENSIONS)
-    CENTIMETER = Unit("centimeter", "cm", LENGTH_DIMENSIONS)
-    MILLIMETER = Unit("millimeter", "mm", LENGTH_DIMENSIONS)
-    KILOMETER = Unit("kilometer", "km", LENGTH_DIMENSIONS)
-    INCH = Unit("inch", "in", LENGTH_DIMENSIONS)
-    FOOT = Unit("foot", "ft", LENGTH_DIMENSIONS)
-    YARD = Unit("yard", "yd", LENGTH_DIMENSIONS)
-    MILE = Unit("mile", "mile", LENGTH_DIMENSIONS)
-
-
-# Time Unit
-class TimeUnits(Enum):
-    SECOND = Unit("second", "s", TIME_DIMENSIONS)
-    MILLISECOND = Unit("millisecond", "ms", TIME_DIMENSIONS)
-    MICROSECOND = Unit("microsecond", "μs", TIME_DIMENSIONS)
-    NANOSECOND = Unit("nanosecond", "ns", TIME_DIMENSIONS)
-    MINUTE = Unit("minute", "min", TIME_DIMENSIONS)
-    HOUR = Unit("hour", "hour", TIME_DIMENSIONS)
-    DAY = Unit("day", "day", TIME_DIMENSIONS)
-    WEEK = Unit("week", "week", TIME_DIMENSIONS)
-    MONTH = Unit("month", "month", TIME_DIMENSIONS)
-    YEAR = Unit("year", "year", TIME_DIMENSIONS)
-
-
-# Define MassUnits Enum with explicit unit assignment
-class MassUnits(Enum):
-    KILOGRAM = Unit("kilogram", "kg", MASS_DIMENSIONS)
-    GRAM = Unit("gram", "g", MASS_DIMENSIONS)
-    MILLIGRAM = Unit("milligram", "mg", MASS_DIMENSIONS)
-    MICROGRAM = Unit("microgram", "μg", MASS_DIMENSIONS)
-    NANOGRAM = Unit("nanogram", "ng", MASS_DIMENSIONS)
-    POUND = Unit("pound", "lb", MASS_DIMENSIONS)
-    OUNCE = Unit("ounce", "oz", MASS_DIMENSIONS)
-
-
-# Temperature Unit
-class TemperatureUnits(Enum):
-    KELVIN = Unit("kelvin", "K", TEMPERATURE_DIMENSIONS)
-    CELSIUS = Unit("celsius", "°C", TEMPERATURE_DIMENSIONS)
-    FAHRENHEIT = Unit("fahrenheit", "°F", TEMPERATURE_DIMENSIONS)
-
-
-# Electric Current Unit
-class ElectricCurrentUnits(Enum):
-    AMPERE = Unit("ampere", "A", ELECTRIC_CURRENT_DIMENSIONS)
-    NANOAMPERE = Unit("nanoampere", "nA", ELECTRIC_CURRENT_DIMENSIONS)
-    MICROAMPERE = Unit("microampere", "μA", ELECTRIC_CURRENT_DIMENSIONS)
-    MILLIAMPERE = Unit("milliampere", "mA", ELECTRIC_CURRENT_DIMENSIONS)
-    KILOAMPERE = Unit("kiloampere", "kA", ELECTRIC_CURRENT_DIMENSIONS)
-
-
-# Amount of Substance Unit
-class AmountSubstanceUnits(Enum):
-    MOLE = Unit("mole", "mol", AMOUNT_SUBSTANCE_DIMENSIONS)
-
-
-# Luminous Intensity Unit
-class LuminousIntensityUnits(Enum):
-    # Define the units for luminous intensity
-    CANDELA = Unit("candela", "cd", LUMINOUS_INTENSITY_DIMENSIONS)
-    MILLICANDELA = Unit("millicandela", "mcd", LUMINOUS_INTENSITY_DIMENSIONS)
-    MICROCANDELA = Unit("microcandela", "μcd", LUMINOUS_INTENSITY_DIMENSIONS)
-    NANOCANDELA = Unit("nanocandela", "ncd", LUMINOUS_INTENSITY_DIMENSIONS)
-    KILOCANDELA = Unit("kilocandela", "kcd", LUMINOUS_INTENSITY_DIMENSIONS)
-    MEGACANDELA = Unit("megacandela", "Mcd", LUMINOUS_INTENSITY_DIMENSIONS)
-    GIGACANDELA = Unit("gigacandela", "Gcd", LUMINOUS_INTENSITY_DIMENSIONS)
-
-
-# Force Unit
-class ForceUnits(Enum):
-    NEWTON = Unit("newton", "N", FORCE_DIMENSIONS)
-    KILONEWTON = Unit("kilonewton", "kN", FORCE_DIMENSIONS)
-    KILOGRAM_FORCE = Unit("kilogram force", "kgf", FORCE_DIMENSIONS)
-    GRAM_FORCE = Unit("gram force", "gf", FORCE_DIMENSIONS)
-    POUND_FORCE = Unit("pound force", "lbf", FORCE_DIMENSIONS)
-    OUNCE_FORCE = Unit("ounce force", "ozf", FORCE_DIMENSIONS)
-
-
-# Pressure Unit
-class PressureUnits(Enum):
-    PASCAL = Unit("pascal", "Pa", PRESSURE_DIMENSIONS)
-    KILOPASCAL = Unit("kilopascal", "kPa", PRESSURE_DIMENSIONS)
-    MEGAPASCAL = Unit("megapascal", "MPa", PRESSURE_DIMENSIONS)
-    GIGAPASCAL = Unit("gigapascal", "GPa", PRESSURE_DIMENSIONS)
-    BAR = Unit("bar", "bar", PRESSURE_DIMENSIONS)
-    MILLIBAR = Unit("millibar", "mbar", PRESSURE_DIMENSIONS)
-    ATMOSPHERE = Unit("atmosphere", "atm", PRESSURE_DIMENSIONS)
-    MILLIMETER_OF_MERCURY = Unit("millimeter of mercury", "mmHg", PRESSURE_DIMENSIONS)
-    INCH_OF_MERCURY = Unit("inch of mercury", "inHg", PRESSURE_DIMENSIONS)
-    POUND_SQUARE_INCH = Unit("pound per square inch", "psi", PRESSURE_DIMENSIONS)
-    KILOGRAM_FORCE_PER_CENTIMETER_SQUARED = Unit(
-        "kilogram force per centimeter squared", "kgf/cm²", PRESSURE_DIMENSIONS
-    )
-
-
-# Energy Unit
-class EnergyUnits(Enum):
-    JOULE = Unit("joule", "J", ENERGY_DIMENSIONS)
-    NANOJOULE = Unit("nanojoule", "nJ", ENERGY_DIMENSIONS)
-    MICROJOULE = Unit("microjoule", "μJ", ENERGY_DIMENSIONS)
-    MILLIJOULE = Unit("millijoule", "mJ", ENERGY_DIMENSIONS)
-    KILOJOULE = Unit("kilojoule", "kJ", ENERGY_DIMENSIONS)
-    MEGAJOULE = Unit("megajoule", "MJ", ENERGY_DIMENSIONS)
-    GIGAJOULE = Unit("gigajoule", "GJ", ENERGY_DIMENSIONS)
-    TERAJOULE = Unit("terajoule", "TJ", ENERGY_DIMENSIONS)
-    CALORIE = Unit("calorie", "cal", ENERGY_DIMENSIONS)
-    KILOCALORIE = Unit("kilocalorie", "kcal", ENERGY_DIMENSIONS)
-    WATT_HOUR = Unit("watt hour", "Wh", ENERGY_DIMENSIONS)
-    KILOWATT_HOUR = Unit("kilowatt hour", "kWh", ENERGY_DIMENSIONS)
-    BRITISH_THERMAL_UNIT = Unit("British thermal unit", "BTU", ENERGY_DIMENSIONS)
-    ELECTRON_VOLT = Unit("electron volt", "eV", ENERGY_DIMENSIONS)
-    FOOT_POUND = Unit("foot-pound", "lb*ft", ENERGY_DIMENSIONS)
-
-
-# Power Unit
-class PowerUnits(Enum):
-    WATT = Unit("watt", "W", POWER_DIMENSIONS)
-    NANOWATT = Unit("nanowatt", "nW", POWER_DIMENSIONS)
-    MICROWATT = Unit("microwatt", "μW", POWER_DIMENSIONS)
-    MILLIWATT = Unit("milliwatt", "mW", POWER_DIMENSIONS)
-    KILOWATT = Unit("kilowatt", "kW", POWER_DIMENSIONS)
-    MEGAWATT = Unit("megawatt", "MW", POWER_DIMENSIONS)
-    GIGAWATT = Unit("gigawatt", "GW", POWER_DIMENSIONS)
-    TERAWATT = Unit("terawatt", "TW", POWER_DIMENSIONS)
-    HORSEPOWER = Unit("horsepower", "hp", POWER_DIMENSIONS)
-    BTU_PER_HOUR = Unit("BTU per hour", "BTU/h", POWER_DIMENSIONS)
-    KILOCALORIE_PER_HOUR = Unit("kilocalorie per hour", "kcal/h", POWER_DIMENSIONS)
-    FOOT_POUND_PER_SECOND = Unit("foot-pound per second", "lb*ft/s", POWER_DIMENSIONS)
-    REFRIGERATION_TON = Unit("refrigeration ton", "RT", POWER_DIMENSIONS)
-    VOLT_AMPERE = Unit("volt ampere", "VA", POWER_DIMENSIONS)
-    VOLT_AMPERE_REACTIVE = Unit("volt ampere reactive", "VAR", POWER_DIMENSIONS)
-    KILOVOLT_AMPERE_REACTIVE = Unit(
-        "kilovolt ampere reactive", "kVAR", POWER_DIMENSIONS
-    )
-    MEGAVOLT_AMPERE_REACTIVE = Unit(
-        "megavolt ampere reactive", "MVAR", POWER_DIMENSIONS
-    )
-
-
-# Voltage (Electrical Potential) Unit
-class VoltageUnits(Enum):
-    VOLT = Unit("volt", "V", VOLTAGE_DIMENSIONS)
-    NANOVOLT = Unit("nanovolt", "nV", VOLTAGE_DIMENSIONS)
-    MICROVOLT = Unit("microvolt", "μV", VOLTAGE_DIMENSIONS)
-    MILLIVOLT = Unit("millivolt", "mV", VOLTAGE_DIMENSIONS)
-    KILOVOLT = Unit("kilovolt", "kV", VOLTAGE_DIMENSIONS)
-
-
-# Frequency and Angular velocity Unit
-class FrequencyUnits(Enum):
-    HERTZ = Unit("hertz", "Hz", FREQUENCY_DIMENSIONS)
-    KILOHERTZ = Unit("kilohertz", "kHz", FREQUENCY_DIMENSIONS)
-    MEGAHERTZ = Unit("megahertz", "MHz", FREQUENCY_DIMENSIONS)
-    GIGAHERTZ = Unit("gigahertz", "GHz", FREQUENCY_DIMENSIONS)
-
-    REV_PER_MINUTE = Unit("revolutions per minute", "rpm", ANGULAR_VELOCITY_DIMENSIONS)
-    RAD_PER_SECOND = Unit("radian per second", "rad/s", ANGULAR_VELOCITY_DIMENSIONS)
-    DEG_PER_SECOND = Unit("degree per second", "°/s", ANGULAR_VELOCITY_DIMENSIONS)
-    REV_PER_SECOND = Unit("revolution per second", "rps", ANGULAR_VELOCITY_DIMENSIONS)
-
-
-# Electric Charge Unit
-class ElectricChargeUnits(Enum):
-    COULOMB = Unit("coulomb", "C", ELECTRIC_CHARGE_DIMENSIONS)
-    NANOCOULOMB = Unit("nanocoulomb", "nC", ELECTRIC_CHARGE_DIMENSIONS)
-    MICROCOULOMB = Unit("microcoulomb", "μC", ELECTRIC_CHARGE_DIMENSIONS)
-    MILLICOULOMB = Unit("millicoulomb", "mC", ELECTRIC_CHARGE_DIMENSIONS)
-    KILOCOULOMB = Unit("kilocoulomb", "kC", ELECTRIC_CHARGE_DIMENSIONS)
-    MEGACOULOMB = Unit("megacoulomb", "MC", ELECTRIC_CHARGE_DIMENSIONS)
-    ELEMENTARY_CHARGE = Unit("elementary charge", "e", ELECTRIC_CHARGE_DIMENSIONS)
-    AMPERE_HOUR = Unit("ampere hour", "Ah", ELECTRIC_CHARGE_DIMENSIONS)
-    MILLIAMPERE_HOUR = Unit("milliampere hour", "mAh", ELECTRIC_CHARGE_DIMENSIONS)
-    MICROAMPERE_HOUR = Unit("microampere hour", "μAh", ELECTRIC_CHARGE_DIMENSIONS)
-
-
-# Magnetic Flux Unit
-class MagneticFluxUnits(Enum):
-    WEBER = Unit("weber", "Wb", MAGNETIC_FLUX_DIMENSIONS)
-    MILLIWEBER = Unit("milliweber", "mWb", MAGNETIC_FLUX_DIMENSIONS)
-    MICROWEBER = Unit("microweber", "μWb", MAGNETIC_FLUX_DIMENSIONS)
-    KILOWEBER = Unit("kiloweber", "kWb", MAGNETIC_FLUX_DIMENSIONS)
-    MEGAWEBER = Unit("megaweber", "MWb", MAGNETIC_FLUX_DIMENSIONS)
-
-
-# Magnetic Field Unit
-class MagneticFieldUnits(Enum):
-    TESLA = Unit("tesla", "T", MAGNETIC_FIELD_DIMENSIONS)
-    GAUSS = Unit("gauss", "G", MAGNETIC_FIELD_DIMENSIONS)
-    MILLIGAUSS = Unit("milligauss", "mG", MAGNETIC_FIELD_DIMENSIONS)
-    MICROGAUSS = Unit("microgauss", "μG", MAGNETIC_FIELD_DIMENSIONS)
-    KILOTESLA = Unit("kilotesla", "kT", MAGNETIC_FIELD_DIMENSIONS)
-    MEGATESLA = Unit("megatesla", "MT", MAGNETIC_FIELD_DIMENSIONS)
-
-
-# Inductance Units
-class InductanceUnits(Enum):
-    HENRY = Unit("henry", "H", INDUCTANCE_DIMENSIONS)
-    MILLIHENRY = Unit("millihenry", "mH", INDUCTANCE_DIMENSIONS)
-    MICROHENRY = Unit("microhenry", "μH", INDUCTANCE_DIMENSIONS)
-    NANOHENRY = Unit("nanohenry", "nH", INDUCTANCE_DIMENSIONS)
-    PICOHENRY = Unit("picohenry", "pH", INDUCTANCE_DIMENSIONS)
-
-
-# Capacitance Unit
-class CapacitanceUnits(Enum):
-    FARAD = Unit("farad", "F", CAPACITANCE_DIMENSIONS)
-    MILLIFARAD = Unit("millifarad", "mF", CAPACITANCE_DIMENSIONS)
-    MICROFARAD = Unit("microfarad", "μF", CAPACITANCE_DIMENSIONS)
-    NANOFARAD = Unit("nanofarad", "nF", CAPACITANCE_DIMENSIONS)
-    PICOFARAD = Unit("picofarad", "pF", CAPACITANCE_DIMENSIONS)
-
-
-# Electrical Resistance Unit
-class ResistanceUnits(Enum):
-    OHM = Unit("ohm", "Ω", RESISTANCE_DIMENSIONS)
-    MILLIOHM = Unit("milliohm", "mΩ", RESISTANCE_DIMENSIONS)
-    MICROOHM = Unit("microohm", "μΩ", RESISTANCE_DIMENSIONS)
-    KILOHM = Unit("kilohm", "kΩ", RESISTANCE_DIMENSIONS)
-    MEGAOHM = Unit("megaohm", "MΩ", RESISTANCE_DIMENSIONS)
-    GIGOHM = Unit("gigohm", "GΩ", RESISTANCE_DIMENSIONS)
-
-
-# Electrical Conductance Unit
-class ConductanceUnits(Enum):
-    SIEMENS = Unit("siemens", "S", CONDUCTANCE_DIMENSIONS)
-    MILLI_SIEMENS = Unit("milli siemens", "mS", CONDUCTANCE_DIMENSIONS)
-    KILO_SIEMENS = Unit("kilo siemens", "kS", CONDUCTANCE_DIMENSIONS)
-    MEGA_SIEMENS = Unit("mega siemens", "MS", CONDUCTANCE_DIMENSIONS)
-    GIGA_SIEMENS = Unit("giga siemens", "GS", CONDUCTANCE_DIMENSIONS)
-
-
-# Illumination Unit (Luminous Flux/Area)
-class IlluminationUnits(Enum):
-    LUX = Unit("lux", "lx", ILLUMINATION_DIMENSIONS)
-    FOOT_CANDLE = Unit("foot-candle", "fc", ILLUMINATION_DIMENSIONS)
-    MILLILUX = Unit("millilux", "mlx", ILLUMINATION_DIMENSIONS)
-    MICROLUX = Unit("microlux", "μlx", ILLUMINATION_DIMENSIONS)
-    KILOLUX = Unit("kilolux", "klx", ILLUMINATION_DIMENSIONS)
-    MEGALUX = Unit("megalux", "mlx", ILLUMINATION_DIMENSIONS)
-
-
-# Angle Unit
-class AngleUnits(Enum):
-    DEGREE = Unit("degree", "°", ANGLE_DIMENSIONS)  # Degrees
-    RADIAN = Unit("radian", "rad", ANGLE_DIMENSIONS)  # Radians
-    GRADIAN = Unit("gradian", "gon", ANGLE_DIMENSIONS)  # Gradians
-    ARC_MINUTE = Unit(
-        "arcminute", "'", ANGLE_DIMENSIONS
-    )  # Arcminutes (1/60 of a degree)
-    ARC_SECOND = Unit(
-        "arcsecond", "″", ANGLE_DIMENSIONS
-    )  # Arcseconds (1/3600 of a degree)
-
-
-# Area Unit
-class AreaUnits(Enum):
-    SQUARE_METER = Unit("square meter", "m²", AREA_DIMENSIONS)
-    SQUARE_CENTIMETER = Unit("square centimeter", "cm²", AREA_DIMENSIONS)
-    SQUARE_DECIMETER = Unit("square decimeter", "dm²", AREA_DIMENSIONS)
-    SQUARE_MILLIMETER = Unit("square millimeter", "mm²", AREA_DIMENSIONS)
-    SQUARE_KILOMETER = Unit("square kilometer", "km²", AREA_DIMENSIONS)
-    SQUARE_INCH = Unit("square inch", "in²", AREA_DIMENSIONS)
-    SQUARE_FOOT = Unit("square foot", "ft²", AREA_DIMENSIONS)
-    SQUARE_YARD = Unit("square yard", "yd²", AREA_DIMENSIONS)
-    SQUARE_MILE = Unit("square mile", "mile²", AREA_DIMENSIONS)
-    ACRE = Unit("acre", "acre", AREA_DIMENSIONS)
-    HECTARE = Unit("hectare", "ha", AREA_DIMENSIONS)
-
-
-# Volume Unit
-class VolumeUnits(Enum):
-    CUBIC_METER = Unit("cubic meter", "m³", VOLUME_DIMENSIONS)
-    CUBIC_CENTIMETER = Unit("cubic centimeter", "cm³", VOLUME_DIMENSIONS)
-    CUBIC_DECIMETER = Unit("cubic decimeter", "dm³", VOLUME_DIMENSIONS)
-    CUBIC_MILLIMETER = Unit("cubic millimeter", "mm³", VOLUME_DIMENSIONS)
-    CUBIC_KILOMETER = Unit("cubic kilometer", "km³", VOLUME_DIMENSIONS)
-    LITER = Unit("liter", "l", VOLUME_DIMENSIONS)
-    MILLILITER = Unit("milliliter", "ml", VOLUME_DIMENSIONS)
-    CUBIC_FOOT = Unit("cubic foot", "ft³", VOLUME_DIMENSIONS)
-    CUBIC_INCH = Unit("cubic inch", "in³", VOLUME_DIMENSIONS)
-    CUBIC_YARD = Unit("cubic yard", "yd³", VOLUME_DIMENSIONS)
-    GALLON_US = Unit("gallon (US)", "gal (US)", VOLUME_DIMENSIONS)
-    GALLON_UK = Unit("gallon (UK)", "gal (UK)", VOLUME_DIMENSIONS)
-
-
-# Flow Rate Unit (Volume/Time)
-class FlowRateUnits(Enum):
-    CUBIC_METER_PER_SECOND = Unit(
-        "cubic meter per second", "m³/s", FLOW_RATE_DIMENSIONS
-    )
-    LITER_PER_SECOND = Unit("liter per second", "L/s", FLOW_RATE_DIMENSIONS)
-    GALLON_PER_MINUTE = Unit("gallon per minute", "gal/min", FLOW_RATE_DIMENSIONS)
-    MILLILITER_PER_SECOND = Unit("milliliter per second", "ml/s", FLOW_RATE_DIMENSIONS)
-    CUBIC_CENTIMETER_PER_SECOND = Unit(
-        "cubic centimeter per second", "cm³/s", FLOW_RATE_DIMENSIONS
-    )
-    CUBIC_INCH_PER_SECOND = Unit("cubic inch per second", "in³/s", FLOW_RATE_DIMENSIONS)
-    CUBIC_KILOMETER_PER_SECOND = Unit(
-        "cubic kilometer per second", "km³/s", FLOW_RATE_DIMENSIONS
-    )
-    CUBIC_METER_PER_HOUR = Unit("cubic meter per hour", "m³/h", FLOW_RATE_DIMENSIONS)
-    CUBIC_METER_PER_MINUTE = Unit(
-        "cubic meter per minute", "m³/min", FLOW_RATE_DIMENSIONS
-    )
-
-
-# Mass Flow Rate Unit (Mass/Time)
-class MassFlowRateUnits(Enum):
-    KILOGRAM_PER_SECOND = Unit("kilogram per second", "kg/s", MASS_FLOW_RATE_DIMENSIONS)
-    GRAM_PER_SECOND = Unit("gram per second", "g/s", MASS_FLOW_RATE_DIMENSIONS)
-    TON_PER_SECOND = Unit("ton per second", "ton/s", MASS_FLOW_RATE_DIMENSIONS)
-    MILLIGRAM_PER_SECOND = Unit(
-        "milligram per second", "mg/s", MASS_FLOW_RATE_DIMENSIONS
-    )
-    MICROGRAM_PER_SECOND = Unit(
-        "microgram per second", "μg/s", MASS_FLOW_RATE_DIMENSIONS
-    )
-    NANOGRAM_PER_SECOND = Unit("nanogram per second", "ng/s", MASS_FLOW_RATE_DIMENSIONS)
-    KILOGRAM_PER_HOUR = Unit("kilogram per hour", "kg/h", MASS_FLOW_RATE_DIMENSIONS)
-    TON_PER_HOUR = Unit("ton per hour", "ton/h", MASS_FLOW_RATE_DIMENSIONS)
-    POUND_PER_SECOND = Unit("pound per second", "lb/s", MASS_FLOW_RATE_DIMENSIONS)
-    OUNCE_PER_SECOND = Unit("ounce per second", "oz/s", MASS_FLOW_RATE_DIMENSIONS)
-    KILOGRAM_PER_MINUTE = Unit(
-        "kilogram per minute", "kg/min", MASS_FLOW_RATE_DIMENSIONS
-    )
-    GRAM_PER_MINUTE = Unit("gram per minute", "g/min", MASS_FLOW_RATE_DIMENSIONS)
-    MILLIGRAM_PER_MINUTE = Unit(
-        "milligram per minute", "mg/min", MASS_FLOW_RATE_DIMENSIONS
-    )
-    POUND_PER_MINUTE = Unit("pound per minute", "lb/min", MASS_FLOW_RATE_DIMENSIONS)
-    OUNCE_PER_MINUTE = Unit("ounce per minute", "oz/min", MASS_FLOW_RATE_DIMENSIONS)
-
-
-# Speed Unit (Distance/Time)
-class SpeedUnits(Enum):
-    METER_PER_SECOND = Unit("meter per second", "m/s", SPEED_DIMENSIONS)
-    KILOMETER_PER_HOUR = Unit("kilometer per hour", "km/h", SPEED_DIMENSIONS)
-    MILE_PER_HOUR = Unit("mile per hour", "mph", SPEED_DIMENSIONS)
-    KNOT = Unit("knot", "kn", SPEED_DIMENSIONS)
-    MILLIMETER_PER_SECOND = Unit("millimeter per second", "mm/s", SPEED_DIMENSIONS)
-    CENTIMETER_PER_SECOND = Unit("centimeter per second", "cm/s", SPEED_DIMENSIONS)
-    MICROMETER_PER_SECOND = Unit("micrometer per second", "μm/s", SPEED_DIMENSIONS)
-    KILOMETER_PER_SECOND = Unit("kilometer per second", "km/s", SPEED_DIMENSIONS)
-    MILE_PER_SECOND = Unit("mile per second", "mi/s", SPEED_DIMENSIONS)
-
-
-# Acceleration Unit (Distance/Time^2)
-class AccelerationUnits(Enum):
-    METER_PER_SECOND_SQUARED = Unit(
-        "meter per second squared", "m/s²", ACCELERATION_DIMENSIONS
-    )
-    KILOMETER_PER_HOUR_SQUARED = Unit(
-        "kilometer per hour squared", "km/h²", ACCELERATION_DIMENSIONS
-    )
-    MILE_PER_HOUR_SQUARED = Unit(
-        "mile per hour squared", "mph²", ACCELERATION_DIMENSIONS
-    )
-    CENTIMETER_PER_SECOND_SQUARED = Unit(
-        "centimeter per second squared", "cm/s²", ACCELERATION_DIMENSIONS
-    )
-    MILLIMETER_PER_SECOND_SQUARED = Unit(
-        "millimeter per second squared", "mm/s²", ACCELERATION_DIMENSIONS
-    )
-    G_FORCE = Unit(
-        "g-force", "g", ACCELERATION_DIMENSIONS
-    )  # Assuming 1 g = 9.80665 m/s² for context
-
-
-# Thermal conductivity Unit
-class ThermalConductivityUnits(Enum):
-    WATT_PER_METER_KELVIN = Unit(
-        "watt per meter kelvin", "W/(m*K)", THERMAL_CONDUCTIVITY_DIMENSIONS
-    )
-    MILLIWATT_PER_METER_KELVIN = Unit(
-        "milliwatt per meter kelvin", "mW/(m*K)", THERMAL_CONDUCTIVITY_DIMENSIONS
-    )
-    KILOWATT_PER_METER_KELVIN = Unit(
-        "kilowatt per meter kelvin", "kW/(m*K)", THERMAL_CONDUCTIVITY_DIMENSIONS
-    )
-    BTU_PER_HOUR_FOOT_FAHRENHEIT = Unit(
-        "BTU per hour foot fahrenheit", "BTU/(h*ft*°F)", THERMAL_CONDUCTIVITY_DIMENSIONS
-    )
-    CALORIE_PER_SECOND_CENTIMETER_CELSIUS = Unit(
-        "calorie per second centimeter celsius",
-        "cal/(s*cm*°C)",
-        THERMAL_CONDUCTIVITY_DIMENSIONS,
-    )
-    WATT_PER_CENTIMETER_CELSIUS = Unit(
-        "watt per centimeter celsius", "W/(cm*°C)", THERMAL_CONDUCTIVITY_DIMENSIONS
-    )
-
-
-# Thermal Resistance Unit
-class ThermalResistanceUnits(Enum):
-    KELVIN_PER_WATT = Unit("kelvin per watt", "K/W", THERMAL_RESISTANCE_DIMENSIONS)
-    MILLIKELVIN_PER_WATT = Unit(
-        "millikelvin per watt", "mK/W", THERMAL_RESISTANCE_DIMENSIONS
-    )
-    MICROKELVIN_PER_WATT = Unit(
-        "microkelvin per watt", "μK/W", THERMAL_RESISTANCE_DIMENSIONS
-    )
-    KILOKELVIN_PER_WATT = Unit(
-        "kilokelvin per watt", "kK/W", THERMAL_RESISTANCE_DIMENSIONS
-    )
-    MEGAKELVIN_PER_WATT = Unit(
-        "megakelvin per watt", "MK/W", THERMAL_RESISTANCE_DIMENSIONS
-    )
-    GIGAKELVIN_PER_WATT = Unit(
-        "gigakelvin per watt", "GK/W", THERMAL_RESISTANCE_DIMENSIONS
-    )
-
-
-# Mock Unit (for testing/mock)
-class MockUnits(Enum):
-    MOCK_UNIT = Unit("mock unit", "mock", Dimensions({}))
-
-
-UNIT_ENUM_BY_QUANTITY = {
-    "length": LengthUnits,
-    "time": TimeUnits,
-    "mass": MassUnits,
-    "temperature": TemperatureUnits,
-    "electric_current": ElectricCurrentUnits,
-    "amount_substance": AmountSubstanceUnits,
-    "luminous_intensity": LuminousIntensityUnits,
-    "force": ForceUnits,
-    "pressure": PressureUnits,
-    "energy": EnergyUnits,
-    "power": PowerUnits,
-    "voltage": VoltageUnits,
-    "frequency": FrequencyUnits,
-    "electric_charge": ElectricChargeUnits,
-    "magnetic_flux": MagneticFluxUnits,
-    "magnetic_field": MagneticFieldUnits,
-    "inductance": InductanceUnits,
-    "capacitance": CapacitanceUnits,
-    "resistance": ResistanceUnits,
-    "conductance": ConductanceUnits,
-    "illumination": IlluminationUnits,
-    "angle": AngleUnits,
-    "area": AreaUnits,
-    "volume": VolumeUnits,
-    "flow_rate": FlowRateUnits,
-    "mass_flow_rate": MassFlowRateUnits,
-    "speed": SpeedUnits,
-    "acceleration": AccelerationUnits,
-    "thermal_conductivity": ThermalConductivityUnits,
-    "thermal_resistance": ThermalResistanceUnits,
-    "mock": MockUnits,
+# Memo cache for unit algebra. Keys use operand identity (units are
+# interned), and each entry keeps its operands alive so an id() is never
+# reused while its entry is cached.
+UNIT_ALGEBRA_CACHE_SIZE = 1024
+_UNIT_ALGEBRA_CACHE: "OrderedDict[tuple, Tuple[Unit, object, Unit]]" = OrderedDict()
+_UNIT_ALGEBRA_LOCK = threading.Lock()
+
+
+def _cached_unit_algebra(operator_symbol: str, unit: Unit, operand: object, compute) -> Unit:
+    key = (operator_symbol, id(unit), id(operand) if isinstance(operand, Unit) else operand)
+    with _UNIT_ALGEBRA_LOCK:
+        entry = _UNIT_ALGEBRA_CACHE.get(key)
+        if entry is not None:
+            _UNIT_ALGEBRA_CACHE.move_to_end(key)
+            return entry[2]
+
+    result = compute(unit, operand)
+    with _UNIT_ALGEBRA_LOCK:
+        _UNIT_ALGEBRA_CACHE[key] = (unit, operand, result)
+        if len(_UNIT_ALGEBRA_CACHE) > UNIT_ALGEBRA_CACHE_SIZE:
+            _UNIT_ALGEBRA_CACHE.popitem(last=False)
+    return result
+
+
+def clear_unit_algebra_cache() -> None:
+    """Drop all memoized unit products, quotients and powers."""
+    with _UNIT_ALGEBRA_LOCK:
+        _UNIT_ALGEBRA_CACHE.clear()
+
+
+# Unit definition
+#
+# The unit catalogue is declared as plain data and every quantity family's
+# Enum (LengthUnits, VoltageUnits, ...) is only built the first time it is
+# used, through the module-level __getattr__ below (PEP 562). Importing this
+# module therefore only costs the Dimensions constants and the string indexes.
+#
+# quantity type -> (Enum name, dimensions, ((member, unit name, symbol), ...))
+
+_UNIT_FAMILIES: Dict[str, Tuple[str, Dimensions, Tuple[Tuple[str, str, str], ...]]] = {
+    "length": ("LengthUnits", LENGTH_DIMENSIONS, (
+        ("METER", "meter", "m"),
+        ("MICROMETER", "micrometer", "μm"),
+        ("NANOMETER", "nanometer", "nm"),
+        ("CENTIMETER", "centimeter", "cm"),
+        ("MILLIMETER", "millimeter", "mm"),
+        ("KILOMETER", "kilometer", "km"),
+        ("INCH", "inch", "in"),
+        ("FOOT", "foot", "ft"),
+        ("YARD", "yard", "yd"),
+        ("MILE", "mile", "mile"),
+    )),
+    "time": ("TimeUnits", TIME_DIMENSIONS, (
+        ("SECOND", "second", "s"),
+        ("MILLISECOND", "millisecond", "ms"),
+        ("MICROSECOND", "microsecond", "μs"),
+        ("NANOSECOND", "nanosecond", "ns"),
+        ("MINUTE", "minute", "min"),
+        ("HOUR", "hour", "hour"),
+        ("DAY", "day", "day"),
+        ("WEEK", "week", "week"),
+        ("MONTH", "month", "month"),
+        ("YEAR", "year", "year"),
+    )),
+    "mass": ("MassUnits", MASS_DIMENSIONS, (
+        ("KILOGRAM", "kilogram", "kg"),
+        ("GRAM", "gram", "g"),
+        ("MILLIGRAM", "milligram", "mg"),
+        ("MICROGRAM", "microgram", "μg"),
+        ("NANOGRAM", "nanogram", "ng"),
+        ("POUND", "pound", "lb"),
+        ("OUNCE", "ounce", "oz"),
+    )),
+    "temperature": ("TemperatureUnits", TEMPERATURE_DIMENSIONS, (
+        ("KELVIN", "kelvin", "K"),
+        ("CELSIUS", "celsius", "°C"),
+        ("FAHRENHEIT", "fahrenheit", "°F"),
+    )),
+    "electric_current": ("ElectricCurrentUnits", ELECTRIC_CURRENT_DIMENSIONS, (
+        ("AMPERE", "ampere", "A"),
+        ("NANOAMPERE", "nanoampere", "nA"),
+        ("MICROAMPERE", "microampere", "μA"),
+        ("MILLIAMPERE", "milliampere", "mA"),
+        ("KILOAMPERE", "kiloampere", "kA"),
+    )),
+    "amount_substance": ("AmountSubstanceUnits", AMOUNT_SUBSTANCE_DIMENSIONS, (
+        ("MOLE", "mole", "mol"),
+    )),
+    "luminous_intensity": ("LuminousIntensityUnits", LUMINOUS_INTENSITY_DIMENSIONS, (
+        ("CANDELA", "candela", "cd"),
+        ("MILLICANDELA", "millicandela", "mcd"),
+        ("MICROCANDELA", "microcandela", "μcd"),
+        ("NANOCANDELA", "nanocandela", "ncd"),
+        ("KILOCANDELA", "kilocandela", "kcd"),
+        ("MEGACANDELA", "megacandela", "Mcd"),
+        ("GIGACANDELA", "gigacandela", "Gcd"),
+    )),
+    "force": ("ForceUnits", FORCE_DIMENSIONS, (
+        ("NEWTON", "newton", "N"),
+        ("KILONEWTON", "kilonewton", "kN"),
+        ("KILOGRAM_FORCE", "kilogram force", "kgf"),
+        ("GRAM_FORCE", "gram force", "gf"),
+        ("POUND_FORCE", "pound force", "lbf"),
+        ("OUNCE_FORCE", "ounce force", "ozf"),
+    )),
+    "pressure": ("PressureUnits", PRESSURE_DIMENSIONS, (
+        ("PASCAL", "pascal", "Pa"),
+        ("KILOPASCAL", "kilopascal", "kPa"),
+        ("MEGAPASCAL", "megapascal", "MPa"),
+        ("GIGAPASCAL", "gigapascal", "GPa"),
+        ("BAR", "bar", "bar"),
+        ("MILLIBAR", "millibar", "mbar"),
+        ("ATMOSPHERE", "atmosphere", "atm"),
+        ("MILLIMETER_OF_MERCURY", "millimeter of mercury", "mmHg"),
+        ("INCH_OF_MERCURY", "inch of mercury", "inHg"),
+        ("POUND_SQUARE_INCH", "pound per square inch", "psi"),
+        ("KILOGRAM_FORCE_PER_CENTIMETER_SQUARED", "kilogram force per centimeter squared", "kgf/cm²"),
+    )),
+    "energy": ("EnergyUnits", ENERGY_DIMENSIONS, (
+        ("JOULE", "joule", "J"),
+        ("NANOJOULE", "nanojoule", "nJ"),
+        ("MICROJOULE", "microjoule", "μJ"),
+        ("MILLIJOULE", "millijoule", "mJ"),
+        ("KILOJOULE", "kilojoule", "kJ"),
+        ("MEGAJOULE", "megajoule", "MJ"),
+        ("GIGAJOULE", "gigajoule", "GJ"),
+        ("TERAJOULE", "terajoule", "TJ"),
+        ("CALORIE", "calorie", "cal"),
+        ("KILOCALORIE", "kilocalorie", "kcal"),
+        ("WATT_HOUR", "watt hour", "Wh"),
+        ("KILOWATT_HOUR", "kilowatt hour", "kWh"),
+        ("BRITISH_THERMAL_UNIT", "British thermal unit", "BTU"),
+        ("ELECTRON_VOLT", "electron volt", "eV"),
+        ("FOOT_POUND", "foot-pound", "lb*ft"),
+    )),
+    "power": ("PowerUnits", POWER_DIMENSIONS, (
+        ("WATT", "watt", "W"),
+        ("NANOWATT", "nanowatt", "nW"),
+        ("MICROWATT", "microwatt", "μW"),
+        ("MILLIWATT", "milliwatt", "mW"),
+        ("KILOWATT", "kilowatt", "kW"),
+        ("MEGAWATT", "megawatt", "MW"),
+        ("GIGAWATT", "gigawatt", "GW"),
+        ("TERAWATT", "terawatt", "TW"),
+        ("HORSEPOWER", "horsepower", "hp"),
+        ("BTU_PER_HOUR", "BTU per hour", "BTU/h"),
+        ("KILOCALORIE_PER_HOUR", "kilocalorie per hour", "kcal/h"),
+        ("FOOT_POUND_PER_SECOND", "foot-pound per second", "lb*ft/s"),
+        ("REFRIGERATION_TON", "refrigeration ton", "RT"),
+        ("VOLT_AMPERE", "volt ampere", "VA"),
+        ("VOLT_AMPERE_REACTIVE", "volt ampere reactive", "VAR"),
+        ("KILOVOLT_AMPERE_REACTIVE", "kilovolt ampere reactive", "kVAR"),
+        ("MEGAVOLT_AMPERE_REACTIVE", "megavolt ampere reactive", "MVAR"),
+    )),
+    "voltage": ("VoltageUnits", VOLTAGE_DIMENSIONS, (
+        ("VOLT", "volt", "V"),
+        ("NANOVOLT", "nanovolt", "nV"),
+        ("MICROVOLT", "microvolt", "μV"),
+        ("MILLIVOLT", "millivolt", "mV"),
+        ("KILOVOLT", "kilovolt", "kV"),
+    )),
+    "frequency": ("FrequencyUnits", FREQUENCY_DIMENSIONS, (
+        ("HERTZ", "hertz", "Hz"),
+        ("KILOHERTZ", "kilohertz", "kHz"),
+        ("MEGAHERTZ", "megahertz", "MHz"),
+        ("GIGAHERTZ", "gigahertz", "GHz"),
+        ("REV_PER_MINUTE", "revolutions per minute", "rpm"),
+        ("RAD_PER_SECOND", "radian per second", "rad/s"),
+        ("DEG_PER_SECOND", "degree per second", "°/s"),
+        ("REV_PER_SECOND", "revolution per second", "rps"),
+    )),
+    "electric_charge": ("ElectricChargeUnits", ELECTRIC_CHARGE_DIMENSIONS, (
+        ("COULOMB", "coulomb", "C"),
+        ("NANOCOULOMB", "nanocoulomb", "nC"),
+        ("MICROCOULOMB", "microcoulomb", "μC"),
+        ("MILLICOULOMB", "millicoulomb", "mC"),
+        ("KILOCOULOMB", "kilocoulomb", "kC"),
+        ("MEGACOULOMB", "megacoulomb", "MC"),
+        ("ELEMENTARY_CHARGE", "elementary charge", "e"),
+        ("AMPERE_HOUR", "ampere hour", "Ah"),
+        ("MILLIAMPERE_HOUR", "milliampere hour", "mAh"),
+        ("MICROAMPERE_HOUR", "microampere hour", "μAh"),
+    )),
+    "magnetic_flux": ("MagneticFluxUnits", MAGNETIC_FLUX_DIMENSIONS, (
+        ("WEBER", "weber", "Wb"),
+        ("MILLIWEBER", "milliweber", "mWb"),
+        ("MICROWEBER", "microweber", "μWb"),
+        ("KILOWEBER", "kiloweber", "kWb"),
+        ("MEGAWEBER", "megaweber", "MWb"),
+    )),
+    "magnetic_field": ("MagneticFieldUnits", MAGNETIC_FIELD_DIMENSIONS, (
+        ("TESLA", "tesla", "T"),
+        ("GAUSS", "gauss", "G"),
+        ("MILLIGAUSS", "milligauss", "mG"),
+        ("MICROGAUSS", "microgauss", "μG"),
+        ("KILOTESLA", "kilotesla", "kT"),
+        ("MEGATESLA", "megatesla", "MT"),
+    )),
+    "inductance": ("InductanceUnits", INDUCTANCE_DIMENSIONS, (
+        ("HENRY", "henry", "H"),
+        ("MILLIHENRY", "millihenry", "mH"),
+        ("MICROHENRY", "microhenry", "μH"),
+        ("NANOHENRY", "nanohenry", "nH"),
+        ("PICOHENRY", "picohenry", "pH"),
+    )),
+    "capacitance": ("CapacitanceUnits", CAPACITANCE_DIMENSIONS, (
+        ("FARAD", "farad", "F"),
+        ("MILLIFARAD", "millifarad", "mF"),
+        ("MICROFARAD", "microfarad", "μF"),
+        ("NANOFARAD", "nanofarad", "nF"),
+        ("PICOFARAD", "picofarad", "pF"),
+    )),
+    "resistance": ("ResistanceUnits", RESISTANCE_DIMENSIONS, (
+        ("OHM", "ohm", "Ω"),
+        ("MILLIOHM", "milliohm", "mΩ"),
+        ("MICROOHM", "microohm", "μΩ"),
+        ("KILOHM", "kilohm", "kΩ"),
+        ("MEGAOHM", "megaohm", "MΩ"),
+        ("GIGOHM", "gigohm", "GΩ"),
+    )),
+    "conductance": ("ConductanceUnits", CONDUCTANCE_DIMENSIONS, (
+        ("SIEMENS", "siemens", "S"),
+        ("MILLI_SIEMENS", "milli siemens", "mS"),
+        ("KILO_SIEMENS", "kilo siemens", "kS"),
+        ("MEGA_SIEMENS", "mega siemens", "MS"),
+        ("GIGA_SIEMENS", "giga siemens", "GS"),
+    )),
+    "illumination": ("IlluminationUnits", ILLUMINATION_DIMENSIONS, (
+        ("LUX", "lux", "lx"),
+        ("FOOT_CANDLE", "foot-candle", "fc"),
+        ("MILLILUX", "millilux", "mlx"),
+        ("MICROLUX", "microlux", "μlx"),
+        ("KILOLUX", "kilolux", "klx"),
+        ("MEGALUX", "megalux", "Mlx"),
+    )),
+    "angle": ("AngleUnits", ANGLE_DIMENSIONS, (
+        ("DEGREE", "degree", "°"),  # Degrees
+        ("RADIAN", "radian", "rad"),  # Radians
+        ("GRADIAN", "gradian", "gon"),  # Gradians
+        ("ARC_MINUTE", "arcminute", "'"),  # Arcminutes (1/60 of a degree)
+        ("ARC_SECOND", "arcsecond", "″"),  # Arcseconds (1/3600 of a degree)
+    )),
+    "area": ("AreaUnits", AREA_DIMENSIONS, (
+        ("SQUARE_METER", "square meter", "m²"),
+        ("SQUARE_CENTIMETER", "square centimeter", "cm²"),
+        ("SQUARE_DECIMETER", "square decimeter", "dm²"),
+        ("SQUARE_MILLIMETER", "square millimeter", "mm²"),
+        ("SQUARE_KILOMETER", "square kilometer", "km²"),
+        ("SQUARE_INCH", "square inch", "in²"),
+        ("SQUARE_FOOT", "square foot", "ft²"),
+        ("SQUARE_YARD", "square yard", "yd²"),
+        ("SQUARE_MILE", "square mile", "mile²"),
+        ("ACRE", "acre", "acre"),
+        ("HECTARE", "hectare", "ha"),
+    )),
+    "volume": ("VolumeUnits", VOLUME_DIMENSIONS, (
+        ("CUBIC_METER", "cubic meter", "m³"),
+        ("CUBIC_CENTIMETER", "cubic centimeter", "cm³"),
+        ("CUBIC_DECIMETER", "cubic decimeter", "dm³"),
+        ("CUBIC_MILLIMETER", "cubic millimeter", "mm³"),
+        ("CUBIC_KILOMETER", "cubic kilometer", "km³"),
+        ("LITER", "liter", "l"),
+        ("MILLILITER", "milliliter", "ml"),
+        ("CUBIC_FOOT", "cubic foot", "ft³"),
+        ("CUBIC_INCH", "cubic inch", "in³"),
+        ("CUBIC_YARD", "cubic yard", "yd³"),
+        ("GALLON_US", "gallon (US)", "gal (US)"),
+        ("GALLON_UK", "gallon (UK)", "gal (UK)"),
+    )),
+    "flow_rate": ("FlowRateUnits", FLOW_RATE_DIMENSIONS, (
+        ("CUBIC_METER_PER_SECOND", "cubic meter per second", "m³/s"),
+        ("LITER_PER_SECOND", "liter per second", "L/s"),
+        ("GALLON_PER_MINUTE", "gallon per minute", "gal/min"),
+        ("MILLILITER_PER_SECOND", "milliliter per second", "ml/s"),
+        ("CUBIC_CENTIMETER_PER_SECOND", "cubic centimeter per second", "cm³/s"),
+        ("CUBIC_INCH_PER_SECOND", "cubic inch per second", "in³/s"),
+        ("CUBIC_KILOMETER_PER_SECOND", "cubic kilometer per second", "km³/s"),
+        ("CUBIC_METER_PER_HOUR", "cubic meter per hour", "m³/h"),
+        ("CUBIC_METER_PER_MINUTE", "cubic meter per minute", "m³/min"),
+    )),
+    "mass_flow_rate": ("MassFlowRateUnits", MASS_FLOW_RATE_DIMENSIONS, (
+        ("KILOGRAM_PER_SECOND", "kilogram per second", "kg/s"),
+        ("GRAM_PER_SECOND", "gram per second", "g/s"),
+        ("TON_PER_SECOND", "ton per second", "ton/s"),
+        ("MILLIGRAM_PER_SECOND", "milligram per second", "mg/s"),
+        ("MICROGRAM_PER_SECOND", "microgram per second", "μg/s"),
+        ("NANOGRAM_PER_SECOND", "nanogram per second", "ng/s"),
+        ("KILOGRAM_PER_HOUR", "kilogram per hour", "kg/h"),
+        ("TON_PER_HOUR", "ton per hour", "ton/h"),
+        ("POUND_PER_SECOND", "pound per second", "lb/s"),
+        ("OUNCE_PER_SECOND", "ounce per second", "oz/s"),
+        ("KILOGRAM_PER_MINUTE", "kilogram per minute", "kg/min"),
+        ("GRAM_PER_MINUTE", "gram per minute", "g/min"),
+        ("MILLIGRAM_PER_MINUTE", "milligram per minute", "mg/min"),
+        ("POUND_PER_MINUTE", "pound per minute", "lb/min"),
+        ("OUNCE_PER_MINUTE", "ounce per minute", "oz/min"),
+    )),
+    "speed": ("SpeedUnits", SPEED_DIMENSIONS, (
+        ("METER_PER_SECOND", "meter per second", "m/s"),
+        ("KILOMETER_PER_HOUR", "kilometer per hour", "km/h"),
+        ("MILE_PER_HOUR", "mile per hour", "mph"),
+        ("KNOT", "knot", "kn"),
+        ("MILLIMETER_PER_SECOND", "millimeter per second", "mm/s"),
+        ("CENTIMETER_PER_SECOND", "centimeter per second", "cm/s"),
+        ("MICROMETER_PER_SECOND", "micrometer per second", "μm/s"),
+        ("KILOMETER_PER_SECOND", "kilometer per second", "km/s"),
+        ("MILE_PER_SECOND", "mile per second", "mi/s"),
+    )),
+    "acceleration": ("AccelerationUnits", ACCELERATION_DIMENSIONS, (
+        ("METER_PER_SECOND_SQUARED", "meter per second squared", "m/s²"),
+        ("KILOMETER_PER_HOUR_SQUARED", "kilometer per hour squared", "km/h²"),
+        ("MILE_PER_HOUR_SQUARED", "mile per hour squared", "mph²"),
+        ("CENTIMETER_PER_SECOND_SQUARED", "centimeter per second squared", "cm/s²"),
+        ("MILLIMETER_PER_SECOND_SQUARED", "millimeter per second squared", "mm/s²"),
+        ("G_FORCE", "g-force", "gₙ"),  # Assuming 1 g = 9.80665 m/s² for context
+    )),
+    "thermal_conductivity": ("ThermalConductivityUnits", THERMAL_CONDUCTIVITY_DIMENSIONS, (
+        ("WATT_PER_METER_KELVIN", "watt per meter kelvin", "W/(m*K)"),
+        ("MILLIWATT_PER_METER_KELVIN", "milliwatt per meter kelvin", "mW/(m*K)"),
+        ("KILOWATT_PER_METER_KELVIN", "kilowatt per meter kelvin", "kW/(m*K)"),
+        ("BTU_PER_HOUR_FOOT_FAHRENHEIT", "BTU per hour foot fahrenheit", "BTU/(h*ft*°F)"),
+        ("CALORIE_PER_SECOND_CENTIMETER_CELSIUS", "calorie per second centimeter celsius", "cal/(s*cm*°C)"),
+        ("WATT_PER_CENTIMETER_CELSIUS", "watt per centimeter celsius", "W/(cm*°C)"),
+    )),
+    "thermal_resistance": ("ThermalResistanceUnits", THERMAL_RESISTANCE_DIMENSIONS, (
+        ("KELVIN_PER_WATT", "kelvin per watt", "K/W"),
+        ("MILLIKELVIN_PER_WATT", "millikelvin per watt", "mK/W"),
+        ("MICROKELVIN_PER_WATT", "microkelvin per watt", "μK/W"),
+        ("KILOKELVIN_PER_WATT", "kilokelvin per watt", "kK/W"),
+        ("MEGAKELVIN_PER_WATT", "megakelvin per watt", "MK/W"),
+        ("GIGAKELVIN_PER_WATT", "gigakelvin per watt", "GK/W"),
+    )),
+    "mock": ("MockUnits", Dimensions(), (
+        ("MOCK_UNIT", "mock unit", "mock"),
+    )),
+}
+
+_QUANTITY_TYPE_BY_ENUM_NAME: Dict[str, str] = {
+    enum_name: quantity_type for quantity_type, (enum_name, _, _) in _UNIT_FAMILIES.items()
 }
 
+
 # =========================================================
 # OPTIMIZACIÓN: Mapas de Búsqueda (Caché)
 # =========================================================
-# Llenamos estos diccionarios una sola vez para que las búsquedas 
-# sean instantáneas (O(1)) en lugar de recorrer bucles (O(N)).
+# Los índices de texto (símbolo/nombre -> tipo) se construyen al importar;
+# los objetos Unit de cada familia se añaden al cargarla.
 
 _SYMBOL_TO_UNIT: Dict[str, Unit] = {}
 _NAME_TO_UNIT: Dict[str, Unit] = {}
 _SYMBOL_TO_TYPE: Dict[str, str] = {}
 _NAME_TO_TYPE: Dict[str, str] = {}
 
-for quantity_type, enum_class in UNIT_ENUM_BY_QUANTITY.items():
-    for member in enum_class:
-        unit_obj = member.value
-        
-        # 1. Mapeo de Símbolo -> Objeto Unit
-        _SYMBOL_TO_UNIT[unit_obj.symbol] = unit_obj
-        
-        # 2. Mapeo de Nombre -> Objeto Unit
-        _NAME_TO_UNIT[unit_obj.name] = unit_obj
-        
-        # 3. Mapeo de Símbolo -> Tipo (ej. "length")
-        _SYMBOL_TO_TYPE[unit_obj.symbol] = quantity_type
-        
-        # 4. Mapeo de Nombre -> Tipo
-        _NAME_TO_TYPE[unit_obj.name] = quantity_type
+for _quantity_type, (_, _, _members) in _UNIT_FAMILIES.items():
+    for _, _unit_name, _unit_symbol in _members:
+        _SYMBOL_TO_TYPE[_unit_symbol] = _quantity_type
+        _NAME_TO_TYPE[_unit_name] = _quantity_type
+del _quantity_type, _members, _unit_name, _unit_symbol
+
+class _UnitEnum(Enum):
+    """Enum of the units of one quantity family.
+
+    Members are keyed by their symbol and expose their Unit through .value;
+    looking a member up by its Unit goes through _missing_.
+    """
+
+    def __new__(cls, symbol: str, unit: Unit) -> "_UnitEnum":
+        member = object.__new__(cls)
+        member._value_ = symbol
+        member._unit = unit
+        return member
+
+    @property
+    def value(self) -> Unit:
+        return self._unit
+
+    @classmethod
+    def _missing_(cls, value):
+        # Lookups by Unit (PowerUnits(PowerUnits.WATT.value)) resolve through its symbol
+        if isinstance(value, Unit):
+            member = cls._value2member_map_.get(value.symbol)
+            if member is not None and member.value == value:
+                return member
+            for member in cls:
+                if member.value == value:
+                    return member
+        return None
+
+
+_UNIT_FAMILIES_LOCK = threading.RLock()
+_UNIT_ENUM_CACHE: Dict[str, Enum] = {}
+
+
+def _load_unit_family(quantity_type: str) -> Enum:
+    """Build (once) the Enum of a quantity family and index its units."""
+    enum_class = _UNIT_ENUM_CACHE.get(quantity_type)
+    if enum_class is not None:
+        return enum_class
+    with _UNIT_FAMILIES_LOCK:
+        enum_class = _UNIT_ENUM_CACHE.get(quantity_type)
+        if enum_class is None:
+            enum_name, dimensions, members = _UNIT_FAMILIES[quantity_type]
+            enum_class = _UnitEnum(
+                enum_name,
+                [(member, (symbol, Unit(unit_name, symbol, dimensions))) for member, unit_name, symbol in members],
+                module=__name__,
+                qualname=enum_name,
+            )
+            for member in enum_class:
+                unit_obj = member.value
+                _SYMBOL_TO_UNIT[unit_obj.symbol] = unit_obj
+                _NAME_TO_UNIT[unit_obj.name] = unit_obj
+            globals()[enum_name] = enum_class
+            _UNIT_ENUM_CACHE[quantity_type] = enum_class
+    return enum_class
+
+
+
+def _registered_counterpart(unit: Unit) -> Optional[Unit]:
+    """First registered unit with the dimensions and canonical scale of a compound unit.
+
+    Temperature units with an offset (°C, °F) are never a counterpart: a
+    compound unit only carries the size of its terms, not their zero.
+    """
+    scale = unit.scale
+    if scale is None:
+        return None
+    # Imported here: conversion_managers depends on this module
+    from .conversion_managers import base_transform
+
+    for quantity_type, (_, dimensions, _) in _UNIT_FAMILIES.items():
+        if dimensions is not unit.dimensions:
+            continue
+        for member in _load_unit_family(quantity_type):
+            candidate = member.value
+            if candidate.scale == scale and base_transform(candidate).offset == 0:
+                return candidate
+    return None
+
+class _UnitEnumMapping(Mapping):
+    """Read-only quantity type -> unit Enum mapping that builds each Enum on access."""
+
+    def __getitem__(self, quantity_type: str) -> Enum:
+        if quantity_type not in _UNIT_FAMILIES:
+            raise KeyError(quantity_type)
+        return _load_unit_family(quantity_type)
+
+    def __iter__(self):
+        return iter(_UNIT_FAMILIES)
+
+    def __len__(self) -> int:
+        return len(_UNIT_FAMILIES)
+
+    def __repr__(self) -> str:
+        return f"UNIT_ENUM_BY_QUANTITY({list(_UNIT_FAMILIES)})"
+
+
+UNIT_ENUM_BY_QUANTITY: Mapping[str, Enum] = _UnitEnumMapping()
+
+
+def __getattr__(name: str):
+    quantity_type = _QUANTITY_TYPE_BY_ENUM_NAME.get(name)
+    if quantity_type is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _load_unit_family(quantity_type)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_QUANTITY_TYPE_BY_ENUM_NAME))
 
 
 # =========================================================
@@ -821,14 +1115,22 @@ def find_unit_by_symbol(symbol: str) -> Unit | None:
     """
     Returns the Unit object associated with a symbol (e.g. 'm' -> Unit('meter'...)).
     """
-    return _SYMBOL_TO_UNIT.get(symbol)
+    unit = _SYMBOL_TO_UNIT.get(symbol)
+    if unit is None and symbol in _SYMBOL_TO_TYPE:
+        _load_unit_family(_SYMBOL_TO_TYPE[symbol])
+        unit = _SYMBOL_TO_UNIT.get(symbol)
+    return unit
 
 
 def find_unit_by_name(unit_name: str) -> Unit | None:
     """
     Returns the Unit object associated with a name (e.g. 'meter' -> Unit('meter'...)).
     """
-    return _NAME_TO_UNIT.get(unit_name)
+    unit = _NAME_TO_UNIT.get(unit_name)
+    if unit is None and unit_name in _NAME_TO_TYPE:
+        _load_unit_family(_NAME_TO_TYPE[unit_name])
+        unit = _NAME_TO_UNIT.get(unit_name)
+    return unit
 
 
 def find_name_by_symbol(symbol: str) -> str | None:
@@ -867,3 +1169,171 @@ def find_unit_type_by_name(unit_name: str) -> str | None:
     Returns the quantity type string (e.g. 'length') given a unit name.
     """
     return _NAME_TO_TYPE.get(unit_name)
+
+
+def find_dimensions_by_unit_type(unit_type: str) -> Dimensions | None:
+    """
+    Returns the Dimensions of a quantity type (e.g. 'length' -> L) without building its units.
+    """
+    family = _UNIT_FAMILIES.get(unit_type)
+    return family[1] if family else None
+
+
+# =========================================================
+# Parser de expresiones de unidades ("kg*m/s²", "m^1/2", ...)
+# =========================================================
+
+UNIT_PARSER_CACHE_SIZE = 512
+
+_SUPERSCRIPT_CHARACTERS = {
+    "⁰": "0", "¹": "1", "²": "2", "³": "3", "⁴": "4",
+    "⁵": "5", "⁶": "6", "⁷": "7", "⁸": "8", "⁹": "9", "⁻": "-",
+}
+_EXPONENT_PATTERN = re.compile(r"-?\d+(?:\.\d+)?(?:/\d+)?")
+_MULTIPLICATION_CHARACTERS = "*·"
+
+# Registered symbols grouped by first character, longest first, so that the
+# parser always prefers "mm" over "m" and "m/s²" over "m".
+_SYMBOLS_BY_FIRST_CHARACTER: Dict[str, Tuple[str, ...]] = {}
+for _symbol in sorted(_SYMBOL_TO_TYPE, key=len, reverse=True):
+    _SYMBOLS_BY_FIRST_CHARACTER[_symbol[0]] = _SYMBOLS_BY_FIRST_CHARACTER.get(_symbol[0], ()) + (_symbol,)
+del _symbol
+
+
+class _UnitExpressionParser:
+    """Recursive-descent parser for unit expressions.
+
+    expression := factor (("*" | "/") factor)*     (left to right)
+    factor     := (symbol | "(" expression ")") exponent?
+    exponent   := superscripts | "^" number | "^(" number ")"
+
+    Registered symbols that contain operators (e.g. "m/s", "lb*ft") are read
+    as a single unit only where that cannot change the meaning: not right
+    after a "/" and not when an exponent follows.
+    """
+
+    def __init__(
+        self,
+        expression: str,
+        symbols_by_first_character: Optional[Mapping[str, Tuple[str, ...]]] = None,
+        find_unit=None,
+    ) -> None:
+        self._text = expression
+        self._position = 0
+        # Symbol catalogue to resolve against (the global one unless a registry provides its own)
+        self._symbols_by_first_character = (
+            _SYMBOLS_BY_FIRST_CHARACTER if symbols_by_first_character is None else symbols_by_first_character
+        )
+        self._find_unit = find_unit_by_symbol if find_unit is None else find_unit
+
+    def parse(self) -> Unit:
+        unit = self._expression()
+        if self._position != len(self._text):
+            raise self._error()
+        return unit
+
+    def _error(self) -> ValueError:
+        return ValueError(f"Cannot parse unit expression: {self._text!r}")
+
+    def _peek(self) -> str:
+        return self._text[self._position] if self._position < len(self._text) else ""
+
+    def _expression(self) -> Unit:
+        unit = self._factor(after_division=False)
+        while True:
+            operator = self._peek()
+            if operator and operator in _MULTIPLICATION_CHARACTERS:
+                self._position += 1
+                unit = unit * self._factor(after_division=False)
+            elif operator == "/":
+                self._position += 1
+                unit = unit / self._factor(after_division=True)
+            else:
+                return unit
+
+    def _factor(self, after_division: bool) -> Unit:
+        if self._peek() == "(":
+            self._position += 1
+            unit = self._expression()
+            if self._peek() != ")":
+                raise self._error()
+            self._position += 1
+        else:
+            unit = self._symbol(after_division)
+        exponent = self._exponent()
+        if exponent is not None and exponent != 1:
+            unit = unit**exponent
+        return unit
+
+    def _symbol(self, after_division: bool) -> Unit:
+        text = self._text
+        start = self._position
+        for symbol in self._symbols_by_first_character.get(self._peek(), ()):
+            if not text.startswith(symbol, start):
+                continue
+            end = start + len(symbol)
+            if any(character in symbol for character in "*/^"):
+                next_character = text[end] if end < len(text) else ""
+                if after_division or (next_character and next_character in "^" + "".join(_SUPERSCRIPT_CHARACTERS)):
+                    continue
+            self._position = end
+            return self._find_unit(symbol)
+        raise self._error()
+
+    def _exponent(self) -> Optional[Union[int, Fraction]]:
+        text = self._text
+        start = self._position
+        if self._peek() in _SUPERSCRIPT_CHARACTERS and self._peek():
+            end = start
+            while end < len(text) and text[end] in _SUPERSCRIPT_CHARACTERS:
+                end += 1
+            self._position = end
+            try:
+                return int("".join(_SUPERSCRIPT_CHARACTERS[character] for character in text[start:end]))
+            except ValueError:
+                raise self._error() from None
+        if self._peek() != "^":
+            return None
+        self._position += 1
+        parenthesized = self._peek() == "("
+        if parenthesized:
+            self._position += 1
+        match = _EXPONENT_PATTERN.match(text, self._position)
+        if match is None:
+            raise self._error()
+        self._position = match.end()
+        if parenthesized:
+            if self._peek() != ")":
+                raise self._error()
+            self._position += 1
+        exponent = Fraction(match.group())
+        return exponent.numerator if exponent.denominator == 1 else exponent
+
+
+# The micro sign (U+00B5), common in CSV and instrument exports, is read as
+# the Greek mu (U+03BC) used by the registered symbols: 'µA' -> 'μA'.
+_SYMBOL_NORMALIZATION = str.maketrans("\u00b5", "\u03bc")
+
+
+def _normalize_symbols(expression: str) -> str:
+    return expression.translate(_SYMBOL_NORMALIZATION)
+
+
+@lru_cache(maxsize=UNIT_PARSER_CACHE_SIZE)
+def parse_unit(expression: str) -> Unit:
+    """
+    Returns the Unit described by a symbol expression (e.g. 'kg*m/s²', 'm^1/2', 'W/(m*K)').
+    Registered symbols resolve to their enum unit; anything else is built
+    through unit algebra, so equivalent expressions compare equal. Results are
+    cached, so parsing repeated strings is a dictionary lookup.
+
+    The micro sign 'µ' (U+00B5) is accepted as the Greek mu 'μ' (U+03BC).
+
+    Raises:
+        ValueError: If the expression contains unknown symbols or bad syntax
+    """
+    expression = _normalize_symbols(expression)
+    unit = find_unit_by_symbol(expression)
+    if unit is not None:
+        return unit
+    return _UnitExpressionParser(expression.strip()).parse()
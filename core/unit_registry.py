@@ -0,0 +1,275 @@
+import threading
+from collections import OrderedDict
+from fractions import Fraction
+from typing import Dict, Optional, Tuple
+
+from .conversion_managers import AffineConversionMatrix, AffineTransform, get_conversion_matrix
+from .unit import (
+    _SYMBOLS_BY_FIRST_CHARACTER,
+    UNIT_PARSER_CACHE_SIZE,
+    Dimensions,
+    Unit,
+    _UnitExpressionParser,
+    _normalize_symbols,
+    find_dimensions_by_unit_type,
+    find_unit_by_name,
+    find_unit_by_symbol,
+    find_unit_type_by_symbol,
+)
+
+
+class UnitRegistry:
+    """A self-contained catalogue of units, quantity types and conversion factors.
+
+    A registry without a parent is backed by the built-in catalogue (unit
+    enums and conversion tables), which it reads but never modifies.
+    ``derive()`` creates a child registry that starts empty and falls back to
+    its parent for every lookup: units, overrides and quantity types defined
+    in the child are copy-on-write and never visible to the parent, to sibling
+    registries or to the module-level lookup functions.
+
+    Lookup and conversion results are cached per registry; the caches are
+    dropped whenever the registry or one of its ancestors is modified.
+
+    Units defined here are known only to this registry (and its children):
+    they are not interned and the quantity classes and conversion managers
+    cannot convert them. Convert values through the registry's convert(),
+    factor() or transform() instead. Likewise, factor overrides only apply
+    to conversions made through the registry.
+    """
+
+    def __init__(self, parent: Optional["UnitRegistry"] = None) -> None:
+        self._parent = parent
+        self._units_by_symbol: Dict[str, Unit] = {}
+        self._units_by_name: Dict[str, Unit] = {}
+        self._type_by_symbol: Dict[str, str] = {}
+        self._dimensions_by_type: Dict[str, Dimensions] = {}
+        self._base_transforms: Dict[str, AffineTransform] = {}
+        self._lock = threading.RLock()
+        self._modifications = 0
+        self._cache_generation = -1
+        self._composite_factors: Dict[Tuple[Tuple[str, Fraction], ...], float] = {}
+        self._parsed_units: "OrderedDict[str, Unit]" = OrderedDict()
+        self._symbols_by_first_character: Optional[Dict[str, Tuple[str, ...]]] = None
+
+    def __repr__(self) -> str:
+        return f'UnitRegistry(units={len(self._units_by_symbol)}, overrides={len(self._base_transforms)}, parent={self._parent!r})'
+
+    @property
+    def parent(self) -> Optional["UnitRegistry"]:
+        return self._parent
+
+    def derive(self) -> "UnitRegistry":
+        """Returns a child registry that shares this one's catalogue until it defines its own units."""
+        return UnitRegistry(self)
+
+    # ------------------------------------------------------------------
+    # Definitions
+    # ------------------------------------------------------------------
+
+    def define_quantity_type(self, quantity_type: str, dimensions: Dimensions) -> None:
+        """Adds a new quantity type (e.g. 'data_rate') with the given dimensions."""
+        if not isinstance(dimensions, Dimensions):
+            raise TypeError('dimensions must be a Dimensions instance.')
+        with self._lock:
+            if self.find_dimensions_by_unit_type(quantity_type) is not None:
+                raise ValueError(f'Quantity type already defined: {quantity_type}')
+            self._dimensions_by_type[quantity_type] = dimensions
+            self._modifications += 1
+
+    def define_unit(self, name: str, symbol: str, quantity_type: str, factor: float, offset: float = 0.0) -> Unit:
+        """Adds a unit to a quantity type and returns it.
+
+        The unit converts into the base unit of its quantity type as
+        base = (value + offset) * factor, the same convention used by the
+        conversion tables. The returned unit is private to this registry: it
+        is equal only to itself and only converts through the registry.
+        """
+        dimensions = self.find_dimensions_by_unit_type(quantity_type)
+        if dimensions is None:
+            raise ValueError(f'Unknown quantity type: {quantity_type}')
+        with self._lock:
+            if self.find_unit_by_symbol(symbol) is not None:
+                raise ValueError(f'Unit symbol already defined: {symbol}')
+            unit = Unit._detached(name, symbol, dimensions)
+            self._units_by_symbol[symbol] = unit
+            self._units_by_name[name] = unit
+            self._type_by_symbol[symbol] = quantity_type
+            self._base_transforms[symbol] = self._make_transform(factor, offset)
+            self._modifications += 1
+        return unit
+
+    def override_factor(self, symbol: str, factor: float, offset: float = 0.0) -> None:
+        """Changes, for this registry only, how an existing unit converts into its base unit."""
+        with self._lock:
+            if self.find_unit_by_symbol(symbol) is None:
+                raise ValueError(f'Unknown unit: {symbol}')
+            self._base_transforms[symbol] = self._make_transform(factor, offset)
+            self._modifications += 1
+
+    @staticmethod
+    def _make_transform(factor: float, offset: float) -> AffineTransform:
+        if factor == 0:
+            raise ValueError('Conversion factor must be non-zero.')
+        return AffineTransform(factor, offset * factor)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def find_unit_by_symbol(self, symbol: str) -> Optional[Unit]:
+        unit = self._units_by_symbol.get(symbol)
+        if unit is not None:
+            return unit
+        return self._parent.find_unit_by_symbol(symbol) if self._parent else find_unit_by_symbol(symbol)
+
+    def find_unit_by_name(self, unit_name: str) -> Optional[Unit]:
+        unit = self._units_by_name.get(unit_name)
+        if unit is not None:
+            return unit
+        return self._parent.find_unit_by_name(unit_name) if self._parent else find_unit_by_name(unit_name)
+
+    def find_unit_type_by_symbol(self, symbol: str) -> Optional[str]:
+        quantity_type = self._type_by_symbol.get(symbol)
+        if quantity_type is not None:
+            return quantity_type
+        return self._parent.find_unit_type_by_symbol(symbol) if self._parent else find_unit_type_by_symbol(symbol)
+
+    def find_dimensions_by_unit_type(self, quantity_type: str) -> Optional[Dimensions]:
+        dimensions = self._dimensions_by_type.get(quantity_type)
+        if dimensions is not None:
+            return dimensions
+        if self._parent:
+            return self._parent.find_dimensions_by_unit_type(quantity_type)
+        return find_dimensions_by_unit_type(quantity_type)
+
+    def parse_unit(self, expression: str) -> Unit:
+        """Parses a unit expression against this registry's symbols (see core.unit.parse_unit)."""
+        self._check_caches()
+        # The LRU cache is reordered on every hit, so reads take the lock too
+        with self._lock:
+            unit = self._parsed_units.get(expression)
+            if unit is not None:
+                self._parsed_units.move_to_end(expression)
+                return unit
+        normalized = _normalize_symbols(expression)
+        unit = self.find_unit_by_symbol(normalized)
+        if unit is None:
+            parser = _UnitExpressionParser(normalized.strip(), self._symbol_index(), self.find_unit_by_symbol)
+            unit = parser.parse()
+        with self._lock:
+            self._parsed_units[expression] = unit
+            if len(self._parsed_units) > UNIT_PARSER_CACHE_SIZE:
+                self._parsed_units.popitem(last=False)
+        return unit
+
+    def _symbol_index(self) -> Dict[str, Tuple[str, ...]]:
+        self._check_caches()
+        index = self._symbols_by_first_character
+        if index is None:
+            base_index = self._parent._symbol_index() if self._parent else _SYMBOLS_BY_FIRST_CHARACTER
+            if not self._units_by_symbol:
+                index = base_index
+            else:
+                index = dict(base_index)
+                for symbol in self._units_by_symbol:
+                    symbols = index.get(symbol[0], ()) + (symbol,)
+                    index[symbol[0]] = tuple(sorted(set(symbols), key=len, reverse=True))
+            self._symbols_by_first_character = index
+        return index
+
+    # ------------------------------------------------------------------
+    # Conversions
+    # ------------------------------------------------------------------
+
+    def base_transform(self, symbol: str) -> AffineTransform:
+        """Returns the transform from a registered unit into the base unit of its quantity type."""
+        transform = self._base_transforms.get(symbol)
+        if transform is not None:
+            return transform
+        if self._parent:
+            return self._parent.base_transform(symbol)
+        quantity_type = find_unit_type_by_symbol(symbol)
+        if quantity_type is None:
+            raise ValueError(f'Unknown unit: {symbol}')
+        try:
+            matrix = get_conversion_matrix(quantity_type)
+        except Exception:
+            raise ValueError(f'No conversion table available for unit: {symbol}') from None
+        if isinstance(matrix, AffineConversionMatrix):
+            return matrix.base_transform(symbol)
+        return AffineTransform(matrix.base_factor(symbol))
+
+    def composite_factor(self, unit: Unit) -> float:
+        """Returns the factor that converts a (possibly compound) unit into the base units of its terms."""
+        self._check_caches()
+        terms = unit.terms
+        factor = self._composite_factors.get(terms)
+        if factor is None:
+            factor = 1.0
+            for symbol, exponent in terms:
+                transform = self.base_transform(symbol)
+                if len(terms) == 1 and exponent == 1 and not transform.is_linear:
+                    raise ValueError(f'Unit {symbol} needs an affine conversion and cannot be used as a compound unit')
+                factor *= transform.scale**exponent
+            self._composite_factors[terms] = factor
+        return factor
+
+    def factor(self, from_unit: Unit, to_unit: Unit) -> float:
+        """Returns the multiplicative factor that converts from_unit into to_unit."""
+        if not from_unit.is_compatible_with(to_unit):
+            raise ValueError(f'Cannot convert between incompatible units: {from_unit} and {to_unit}')
+        if from_unit is to_unit:
+            return 1.0
+        return self.composite_factor(from_unit) / self.composite_factor(to_unit)
+
+    def transform(self, from_unit: Unit, to_unit: Unit) -> AffineTransform:
+        """Returns the transform that converts from_unit into to_unit, affine ones included."""
+        if not from_unit.is_compatible_with(to_unit):
+            raise ValueError(f'Cannot convert between incompatible units: {from_unit} and {to_unit}')
+        if not (from_unit.is_compound or to_unit.is_compound):
+            from_transform = self.base_transform(from_unit.symbol)
+            to_transform = self.base_transform(to_unit.symbol)
+            if not (from_transform.is_linear and to_transform.is_linear):
+                scale = from_transform.scale / to_transform.scale
+                return AffineTransform(scale, (from_transform.offset - to_transform.offset) / to_transform.scale)
+        return AffineTransform(self.factor(from_unit, to_unit))
+
+    def convert(self, value, from_unit: Unit, to_unit: Unit):
+        """Converts a value (or a NumPy array) from from_unit into to_unit."""
+        return self.transform(from_unit, to_unit)(value)
+
+    # ------------------------------------------------------------------
+    # Cache invalidation
+    # ------------------------------------------------------------------
+
+    @property
+    def generation(self) -> int:
+        """Number of modifications made to this registry and its ancestors."""
+        generation = self._modifications
+        if self._parent:
+            generation += self._parent.generation
+        return generation
+
+    def _check_caches(self) -> None:
+        generation = self.generation
+        if generation != self._cache_generation:
+            with self._lock:
+                self._composite_factors.clear()
+                self._parsed_units.clear()
+                self._symbols_by_first_character = None
+                self._cache_generation = generation
+
+
+_DEFAULT_REGISTRY: Optional[UnitRegistry] = None
+_DEFAULT_REGISTRY_LOCK = threading.Lock()
+
+
+def get_default_registry() -> UnitRegistry:
+    """Returns the shared registry backed by the built-in catalogue, meant as the parent of per-tenant registries."""
+    global _DEFAULT_REGISTRY
+    if _DEFAULT_REGISTRY is None:
+        with _DEFAULT_REGISTRY_LOCK:
+            if _DEFAULT_REGISTRY is None:
+                _DEFAULT_REGISTRY = UnitRegistry()
+    return _DEFAULT_REGISTRY
@@ -14,7 +14,7 @@ power = cmp1.power
 print(cmp1)
 print(f'power conversion of {cmp1.name}: {cmp1.power.convert_to('mW')}')
 
-voltage.value = 10
+voltage = VoltageQuantity(10.0)
 power = PowerQuantity(0.025,'W')
 
 cmp2 = Component.from_voltage_power('LED_PV',voltage,power)
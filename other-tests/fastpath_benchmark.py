@@ -0,0 +1,74 @@
+"""Measures the per-operation validation overhead removed by core.fastpath().
+
+Same-unit workloads gain the most. Mixed-unit ones are dominated by the unit
+conversion, which fastpath does not skip, and gain only a few percent.
+
+Usage:
+    python other-tests/fastpath_benchmark.py [--count N] [--repeat R]
+"""
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+import argparse
+import random
+import timeit
+
+import core
+from core.physical_quantities import ElectricCurrentQuantity
+from core.unit import ElectricCurrentUnits
+
+
+def make_currents(count: int, mixed_units: bool):
+    random.seed(0)
+    units = [ElectricCurrentUnits.AMPERE.value]
+    if mixed_units:
+        units.append(ElectricCurrentUnits.MILLIAMPERE.value)
+    return [ElectricCurrentQuantity(random.uniform(0.0, 1000.0), random.choice(units)) for _ in range(count)]
+
+
+def accumulate(currents):
+    total = currents[0]
+    for current in currents[1:]:
+        total = total + current
+    return total
+
+
+def best_time(statement, repeat: int) -> float:
+    return min(timeit.repeat(statement, number=1, repeat=repeat))
+
+
+def run(count: int, repeat: int) -> None:
+    print(f'{count} operations, best of {repeat}')
+    print(f'{"workload":<28}{"validated":>12}{"fastpath":>12}{"saved":>8}')
+    for mixed_units in (False, True):
+        currents = make_currents(count, mixed_units)
+        label = 'mixed units' if mixed_units else 'same unit'
+        workloads = {
+            f'add ({label})': lambda: accumulate(currents),
+            f'sort ({label})': lambda: sorted(currents),
+        }
+        for name, workload in workloads.items():
+            validated = best_time(workload, repeat)
+
+            def trusted():
+                with core.fastpath(currents):
+                    workload()
+
+            fast = best_time(trusted, repeat)
+            print(f'{name:<28}{validated * 1e3:>10.1f}ms{fast * 1e3:>10.1f}ms{(1 - fast / validated) * 100:>7.0f}%')
+
+        def entry_check_only():
+            with core.fastpath(currents):
+                pass
+
+        entry_check = best_time(entry_check_only, repeat)
+        print(f'{"  (entry check included)":<28}{"":>12}{entry_check * 1e3:>10.1f}ms')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    run(args.count, args.repeat)
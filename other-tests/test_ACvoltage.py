@@ -13,10 +13,9 @@ phase = AngleQuantity(0.125*pi,'rad')
 conversion_manager = BaseConversionManager('angle')
 
 ac_voltage = AC_Voltage(voltage,frequency,phase)
-ac_voltage._phase_angle.value = conversion_manager.convert(ac_voltage._phase_angle.value, phase.unit, 'deg')
+ac_voltage._phase_angle = AngleQuantity(conversion_manager.convert(ac_voltage._phase_angle.value, phase.unit, 'deg'), 'deg')
 
 conversion_manager = BaseConversionManager.change_quantity_type('voltage')
-ac_voltage._rms_value.value = conversion_manager.convert(ac_voltage._rms_value.value, voltage.unit, 'mV')
-ac_voltage._rms_value.unit = 'mV'
+ac_voltage._rms_value = VoltageQuantity(conversion_manager.convert(ac_voltage._rms_value.value, voltage.unit, 'mV'), 'mV')
 
 print(ac_voltage)
\ No newline at end of file
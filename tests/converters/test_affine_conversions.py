@@ -0,0 +1,54 @@
+import unittest
+from core.conversion_managers import AffineConversionMatrix, AffineTransform, TemperatureConversionManager, get_conversion_matrix
+from core.physical_quantities import TemperatureQuantity
+from core.unit import TemperatureUnits
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class TestAffineConversions(unittest.TestCase):
+
+    def test_temperature_matrix_is_affine(self):
+        self.assertIsInstance(get_conversion_matrix('temperature'), AffineConversionMatrix)
+
+    def test_precomposed_transforms(self):
+        manager = TemperatureConversionManager()
+        transform = manager.transform(TemperatureUnits.CELSIUS.value, TemperatureUnits.FAHRENHEIT.value)
+        self.assertEqual(transform, AffineTransform(1.8, 32.0))
+        self.assertEqual(manager.convert(100, TemperatureUnits.CELSIUS.value, TemperatureUnits.FAHRENHEIT.value), 212.0)
+        self.assertEqual(manager.convert(-40, TemperatureUnits.FAHRENHEIT.value, TemperatureUnits.CELSIUS.value), -40.0)
+
+    def test_linear_pairs_have_factor(self):
+        matrix = get_conversion_matrix('temperature')
+        self.assertEqual(matrix.factor(TemperatureUnits.KELVIN.value, TemperatureUnits.KELVIN.value), 1.0)
+        with self.assertRaises(ValueError):
+            matrix.factor(TemperatureUnits.KELVIN.value, TemperatureUnits.CELSIUS.value)
+
+    def test_invalid_entries(self):
+        invalid_tables = [
+            {'K': {'to_base': 'lambda x: x', 'from_base': 'lambda x: x'}},
+            {'K': {'offset': 0, 'scale': 0}},
+            {'K': {'offset': 'import os', 'scale': 1}},
+            {'K': {'offset': 0, 'scale': float('nan')}},
+            {'K': {'offset': 0}},
+        ]
+        for table in invalid_tables:
+            with self.subTest(table=table):
+                with self.assertRaises(ValueError):
+                    AffineConversionMatrix('temperature', table)
+
+    def test_quantity_conversion(self):
+        temperature = TemperatureQuantity(25, TemperatureUnits.CELSIUS.value)
+        self.assertAlmostEqual(temperature.convert_to(TemperatureUnits.KELVIN.value).value, 298.15)
+        self.assertEqual(TemperatureQuantity(300).unit, TemperatureUnits.KELVIN.value)
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_array_conversion(self):
+        transform = TemperatureConversionManager().transform(TemperatureUnits.CELSIUS.value, TemperatureUnits.KELVIN.value)
+        converted = transform(np.array([0.0, 100.0, -273.15]))
+        np.testing.assert_allclose(converted, [273.15, 373.15, 0.0], atol=1e-9)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from core.conversion_managers import BaseConversionManager, compile_converter
+from core.physical_quantities import ResistanceQuantity
+from core.unit import ElectricCurrentUnits, LengthUnits, ResistanceUnits, TemperatureUnits, MockUnits
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class TestCompiledConverters(unittest.TestCase):
+
+    def test_linear_converter(self):
+        to_milliampere = BaseConversionManager('electric_current').compile_converter(ElectricCurrentUnits.AMPERE.value, ElectricCurrentUnits.MILLIAMPERE.value)
+        self.assertAlmostEqual(to_milliampere(0.25), 250.0)
+        self.assertEqual([round(to_milliampere(value), 9) for value in (1, 2, 3)], [1000.0, 2000.0, 3000.0])
+
+    def test_affine_converter(self):
+        to_fahrenheit = compile_converter(TemperatureUnits.CELSIUS.value, TemperatureUnits.FAHRENHEIT.value)
+        self.assertEqual(to_fahrenheit(100), 212.0)
+        self.assertEqual(to_fahrenheit(0), 32.0)
+
+    def test_converter_matches_convert(self):
+        manager = BaseConversionManager('length')
+        converter = manager.compile_converter(LengthUnits.INCH.value, LengthUnits.MILLIMETER.value)
+        for value in (0.0, 1.0, 3.5, -12.0):
+            with self.subTest(value=value):
+                self.assertAlmostEqual(converter(value), manager.convert(value, LengthUnits.INCH.value, LengthUnits.MILLIMETER.value))
+
+    def test_incompatible_units(self):
+        with self.assertRaises(ValueError):
+            compile_converter(LengthUnits.METER.value, ElectricCurrentUnits.AMPERE.value)
+        with self.assertRaises(ValueError):
+            compile_converter(MockUnits.MOCK_UNIT.value, LengthUnits.METER.value)
+
+    def test_resistance_converter(self):
+        to_ohm = compile_converter(ResistanceUnits.KILOHM.value, ResistanceUnits.OHM.value)
+        self.assertAlmostEqual(to_ohm(4.7), 4700.0)
+        resistance = ResistanceQuantity(1.5, ResistanceUnits.MEGAOHM.value)
+        self.assertAlmostEqual(resistance.convert_to(ResistanceUnits.KILOHM.value).value, 1500.0)
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_array_converter(self):
+        to_ampere = compile_converter(ElectricCurrentUnits.MILLIAMPERE.value, ElectricCurrentUnits.AMPERE.value)
+        np.testing.assert_allclose(to_ampere(np.array([1.0, 500.0])), [0.001, 0.5])
+
+if __name__ == '__main__':
+    unittest.main()
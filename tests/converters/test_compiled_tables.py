@@ -0,0 +1,62 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from core import conversion_managers
+from core.build_conversion_tables import build_compiled_tables
+from core.conversion_managers import (CONVERSION_TABLES_DIRECTORY, AffineConversionMatrix, ConversionMatrix,
+                                      compile_conversion_matrix, load_compiled_tables, get_conversion_table)
+from core.utilities.json_utilities import json_to_dict
+
+class TestCompiledTables(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.tables_directory = os.path.join(self.directory, 'conversion_tables')
+        shutil.copytree(CONVERSION_TABLES_DIRECTORY, self.tables_directory)
+        self.artifact = os.path.join(self.directory, 'compiled_tables.py')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_missing_artifact(self):
+        self.assertIsNone(load_compiled_tables(self.artifact, self.tables_directory))
+
+    def test_artifact_matches_json(self):
+        build_compiled_tables(self.artifact, self.tables_directory)
+        compiled = load_compiled_tables(self.artifact, self.tables_directory)
+        self.assertIsNotNone(compiled)
+        for table_name in ('length', 'energy', 'temperature'):
+            with self.subTest(table=table_name):
+                conversion_table = json_to_dict(os.path.join(self.tables_directory, f'{table_name}.json'))
+                self.assertEqual(compiled.CONVERSION_TABLES[table_name], conversion_table)
+                expected = compile_conversion_matrix(table_name, conversion_table).to_compiled()
+                self.assertEqual(compiled.CONVERSION_MATRICES[table_name], expected)
+
+    def test_matrices_from_artifact(self):
+        build_compiled_tables(self.artifact, self.tables_directory)
+        compiled = load_compiled_tables(self.artifact, self.tables_directory)
+        length = ConversionMatrix.from_compiled('length', compiled.CONVERSION_MATRICES['length'])
+        self.assertEqual(length.factors, compile_conversion_matrix('length', compiled.CONVERSION_TABLES['length']).factors)
+        temperature = AffineConversionMatrix.from_compiled('temperature', compiled.CONVERSION_MATRICES['temperature'])
+        self.assertEqual(temperature.to_compiled(), compiled.CONVERSION_MATRICES['temperature'])
+
+    def test_stale_artifact(self):
+        build_compiled_tables(self.artifact, self.tables_directory)
+        artifact_mtime = os.stat(self.artifact).st_mtime
+        source = os.path.join(self.tables_directory, 'voltage.json')
+        os.utime(source, (artifact_mtime + 10, artifact_mtime + 10))
+        self.assertIsNone(load_compiled_tables(self.artifact, self.tables_directory))
+
+    def test_registry_uses_artifact(self):
+        build_compiled_tables(self.artifact, self.tables_directory)
+        compiled = load_compiled_tables(self.artifact, self.tables_directory)
+        conversion_managers._CONVERSION_TABLES.pop('force', None)
+        with mock.patch.object(conversion_managers, '_COMPILED_TABLES', compiled), \
+             mock.patch.object(conversion_managers, 'json_to_dict', side_effect=AssertionError('Unexpected JSON parsing')):
+            self.assertEqual(dict(get_conversion_table('force')), compiled.CONVERSION_TABLES['force'])
+        conversion_managers._CONVERSION_TABLES.pop('force', None)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from core import conversion_managers
+from core.conversion_managers import BaseConversionManager, composite_factor, compound_factor, compile_converter
+from core.physical_quantities import PowerQuantity, TimeQuantity, LengthQuantity
+from core.unit import (PowerUnits, TimeUnits, EnergyUnits, LengthUnits, SpeedUnits, AreaUnits, ForceUnits, MassUnits,
+                       ThermalConductivityUnits, TemperatureUnits, MockUnits)
+
+class TestCompoundConversions(unittest.TestCase):
+
+    def test_terms(self):
+        kilowatt_hour = PowerUnits.KILOWATT.value * TimeUnits.HOUR.value
+        self.assertEqual(dict(kilowatt_hour.terms), {'kW': 1, 'hour': 1})
+        self.assertTrue(kilowatt_hour.is_compound)
+        self.assertFalse(PowerUnits.KILOWATT.value.is_compound)
+        square_meter = LengthUnits.METER.value * LengthUnits.METER.value
+        self.assertEqual(dict(square_meter.terms), {'m': 2})
+        self.assertEqual(dict((square_meter / LengthUnits.METER.value).terms), {'m': 1})
+        self.assertEqual(dict((LengthUnits.METER.value ** 0.5).terms), {'m': 0.5})
+
+    def test_composite_factor(self):
+        self.assertAlmostEqual(composite_factor(PowerUnits.KILOWATT.value * TimeUnits.HOUR.value), 3.6e6)
+        self.assertAlmostEqual(composite_factor(LengthUnits.KILOMETER.value / TimeUnits.HOUR.value), 1 / 3.6)
+
+    def test_composite_factor_is_cached(self):
+        kilometer_per_hour = LengthUnits.KILOMETER.value / TimeUnits.HOUR.value
+        composite_factor(kilometer_per_hour)
+        self.assertIn(kilometer_per_hour.terms, conversion_managers._COMPOSITE_FACTORS)
+
+    def test_energy_from_power_and_time(self):
+        manager = BaseConversionManager('energy')
+        kilowatt_hour = PowerUnits.KILOWATT.value * TimeUnits.HOUR.value
+        self.assertAlmostEqual(manager.convert(2, kilowatt_hour, EnergyUnits.KILOWATT_HOUR.value), 2.0)
+        self.assertAlmostEqual(manager.convert(1, kilowatt_hour, EnergyUnits.MEGAJOULE.value), 3.6)
+
+    def test_speed_from_length_and_time(self):
+        kilometer_per_hour = LengthUnits.KILOMETER.value / TimeUnits.HOUR.value
+        self.assertAlmostEqual(compound_factor(kilometer_per_hour, SpeedUnits.METER_PER_SECOND.value), 1 / 3.6)
+        to_meter_per_second = compile_converter(kilometer_per_hour, SpeedUnits.METER_PER_SECOND.value)
+        self.assertAlmostEqual(to_meter_per_second(36), 10.0)
+
+    def test_compound_to_compound(self):
+        newton = MassUnits.KILOGRAM.value * LengthUnits.METER.value / (TimeUnits.SECOND.value * TimeUnits.SECOND.value)
+        gram_centimeter = MassUnits.GRAM.value * LengthUnits.CENTIMETER.value / (TimeUnits.SECOND.value * TimeUnits.SECOND.value)
+        self.assertAlmostEqual(compound_factor(newton, gram_centimeter), 1e5)
+        self.assertAlmostEqual(compound_factor(newton, ForceUnits.KILONEWTON.value), 1e-3)
+        self.assertAlmostEqual(compound_factor(LengthUnits.CENTIMETER.value * LengthUnits.CENTIMETER.value, AreaUnits.SQUARE_METER.value), 1e-4)
+
+    def test_temperature_inside_derived_units(self):
+        watt_per_meter_celsius = PowerUnits.WATT.value / (LengthUnits.METER.value * TemperatureUnits.CELSIUS.value)
+        self.assertAlmostEqual(compound_factor(watt_per_meter_celsius, ThermalConductivityUnits.WATT_PER_METER_KELVIN.value), 1.0)
+
+    def test_quantity_products(self):
+        energy = PowerQuantity(2, PowerUnits.KILOWATT.value) * TimeQuantity(30, TimeUnits.MINUTE.value)
+        self.assertAlmostEqual(energy.convert_to(EnergyUnits.KILOWATT_HOUR.value).value, 1.0)
+        speed = LengthQuantity(100, LengthUnits.METER.value) / TimeQuantity(10)
+        self.assertAlmostEqual(speed.convert_to(SpeedUnits.KILOMETER_PER_HOUR.value).value, 36.0, places=6)
+
+    def test_incompatible_compound_units(self):
+        with self.assertRaises(ValueError):
+            compound_factor(LengthUnits.METER.value / TimeUnits.SECOND.value, EnergyUnits.JOULE.value)
+        with self.assertRaises(ValueError):
+            composite_factor(MockUnits.MOCK_UNIT.value * LengthUnits.METER.value)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from core.conversion_managers import BaseConversionManager, TemperatureConversionManager, get_conversion_matrix
+from core.physical_quantities import ElectricCurrentQuantity
+from core.unit import ElectricCurrentUnits, LengthUnits, TemperatureUnits, MockUnits
+
+class TestConversionMatrix(unittest.TestCase):
+
+    def test_matrix_is_shared(self):
+        self.assertIs(get_conversion_matrix('length'), get_conversion_matrix('length'))
+        self.assertIs(BaseConversionManager('length').conversion_matrix, get_conversion_matrix('length'))
+
+    def test_matrix_factors(self):
+        matrix = get_conversion_matrix('length')
+        meter = matrix.index_of(LengthUnits.METER.value)
+        kilometer = matrix.index_of(LengthUnits.KILOMETER.value)
+        self.assertEqual(matrix.factor_by_index(meter, meter), 1.0)
+        self.assertAlmostEqual(matrix.factor_by_index(kilometer, meter), 1000.0)
+        self.assertAlmostEqual(matrix.factor_by_index(meter, kilometer), 1e-3)
+        self.assertEqual(len(matrix.factors), len(matrix.symbols))
+
+    def test_factor(self):
+        manager = BaseConversionManager('electric_current')
+        self.assertAlmostEqual(manager.factor(ElectricCurrentUnits.AMPERE.value, ElectricCurrentUnits.MILLIAMPERE.value), 1000.0)
+        self.assertAlmostEqual(manager.factor(ElectricCurrentUnits.MICROAMPERE.value, ElectricCurrentUnits.MILLIAMPERE.value), 1e-3)
+
+    def test_factor_unknown_units(self):
+        manager = BaseConversionManager('electric_current')
+        with self.assertRaises(ValueError):
+            manager.factor(MockUnits.MOCK_UNIT.value, ElectricCurrentUnits.AMPERE.value)
+        with self.assertRaises(ValueError):
+            get_conversion_matrix('electric_current').index_of(MockUnits.MOCK_UNIT.value)
+
+    def test_temperature_has_no_factor(self):
+        with self.assertRaises(ValueError):
+            TemperatureConversionManager().factor(TemperatureUnits.KELVIN.value, TemperatureUnits.CELSIUS.value)
+
+    def test_quantity_conversion_factor(self):
+        current = ElectricCurrentQuantity(250, ElectricCurrentUnits.MILLIAMPERE.value)
+        self.assertAlmostEqual(current.conversion_factor(ElectricCurrentUnits.AMPERE.value), 1e-3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import threading
+from unittest import mock
+from core import conversion_managers
+from core.conversion_managers import BaseConversionManager, TemperatureConversionManager, get_conversion_table
+from core.physical_quantities import LengthQuantity, VoltageQuantity
+from core.unit import LengthUnits, VoltageUnits
+
+class TestConversionTableRegistry(unittest.TestCase):
+
+    def test_table_is_shared(self):
+        manager1 = BaseConversionManager('length')
+        manager2 = BaseConversionManager('length')
+        self.assertIs(manager1._conversion_table, manager2._conversion_table)
+        self.assertIs(manager1._conversion_table, get_conversion_table('length'))
+
+    def test_table_is_read_only(self):
+        table = get_conversion_table('voltage')
+        with self.assertRaises(TypeError):
+            table['V'] = 2
+        temperature_table = TemperatureConversionManager()._conversion_table
+        with self.assertRaises(TypeError):
+            temperature_table['K']['to_base'] = 'lambda x: 0'
+
+    def test_unknown_table(self):
+        with self.assertRaises(Exception):
+            BaseConversionManager('non_existent_quantity')
+
+    def test_quantities_do_not_load_files(self):
+        get_conversion_table('length')
+        get_conversion_table('voltage')
+        with mock.patch.object(conversion_managers, 'json_to_dict', side_effect=AssertionError('Unexpected table load')):
+            distance = LengthQuantity(1.0, LengthUnits.KILOMETER.value)
+            self.assertAlmostEqual(distance.convert_to(LengthUnits.METER.value).value, 1000.0)
+            total = VoltageQuantity(1.0) + VoltageQuantity(500.0, VoltageUnits.MILLIVOLT.value)
+            self.assertAlmostEqual(total.value, 1.5)
+
+    def test_concurrent_first_load(self):
+        quantity_type = 'luminous_intensity'
+        conversion_managers._CONVERSION_TABLES.pop(quantity_type, None)
+        results = []
+        with mock.patch.object(conversion_managers, '_COMPILED_TABLES', None), \
+             mock.patch.object(conversion_managers, 'json_to_dict', wraps=conversion_managers.json_to_dict) as loader:
+            threads = [threading.Thread(target=lambda: results.append(get_conversion_table(quantity_type))) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(loader.call_count, 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(table is results[0] for table in results))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from core.physical_quantities import TemperatureConversionManager
+from core.conversion_managers import TemperatureConversionManager
 from core.unit import TemperatureUnits
 from .base_converter_test import BaseConversionTest
 
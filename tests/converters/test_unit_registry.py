@@ -0,0 +1,93 @@
+import unittest
+
+from core.physical_quantities import LengthQuantity
+from core.unit import LengthUnits, TemperatureUnits, TimeUnits, VolumeUnits, Dimensions, find_unit_by_symbol, parse_unit
+from core.unit_registry import get_default_registry
+
+class TestUnitRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.base = get_default_registry()
+        self.tenant = self.base.derive()
+
+    def test_default_catalogue(self):
+        self.assertIs(self.base.find_unit_by_symbol('m'), LengthUnits.METER.value)
+        self.assertEqual(self.base.find_unit_type_by_symbol('km'), 'length')
+        self.assertAlmostEqual(self.base.convert(1.0, LengthUnits.KILOMETER.value, LengthUnits.METER.value), 1000.0)
+        self.assertAlmostEqual(self.base.convert(100.0, TemperatureUnits.CELSIUS.value, TemperatureUnits.FAHRENHEIT.value), 212.0)
+
+    def test_custom_unit_is_isolated(self):
+        furlong = self.tenant.define_unit('furlong', 'fur', 'length', 201.168)
+        self.assertIs(self.tenant.find_unit_by_symbol('fur'), furlong)
+        self.assertIs(self.tenant.find_unit_by_name('furlong'), furlong)
+        self.assertAlmostEqual(self.tenant.convert(2.0, furlong, LengthUnits.METER.value), 402.336)
+        self.assertIsNone(self.base.find_unit_by_symbol('fur'))
+        self.assertIsNone(self.base.derive().find_unit_by_symbol('fur'))
+        self.assertIsNone(find_unit_by_symbol('fur'))
+
+    def test_custom_units_in_expressions(self):
+        furlong = self.tenant.define_unit('furlong', 'fur', 'length', 201.168)
+        fortnight = self.tenant.define_unit('fortnight', 'ftn', 'time', 1209600)
+        speed = self.tenant.parse_unit('fur/ftn')
+        self.assertEqual(speed.dimensions, Dimensions({'L': 1, 'T': -1}))
+        self.assertAlmostEqual(self.tenant.factor(speed, parse_unit('m/s')), 201.168 / 1209600)
+        with self.assertRaises(ValueError):
+            self.base.parse_unit('fur/ftn')
+
+    def test_custom_units_are_private(self):
+        other_tenant = self.base.derive()
+        mil = self.tenant.define_unit('mil', 'mil', 'length', 2.54e-5)
+        other_mil = other_tenant.define_unit('mil', 'mil', 'length', 1e-3)
+        self.assertIsNot(mil, other_mil)
+        self.assertNotEqual(mil, other_mil)
+        self.assertEqual(len({mil, other_mil}), 2)
+        self.assertIsNone(mil.scale)
+        millimeter = LengthUnits.MILLIMETER.value
+        self.assertAlmostEqual(self.tenant.convert(1000.0, mil, millimeter), 25.4)
+        self.assertAlmostEqual(other_tenant.convert(1000.0, other_mil, millimeter), 1000.0)
+        # Quantities only know the built-in catalogue: convert through the registry
+        with self.assertRaisesRegex(ValueError, 'Unknown unit: mil'):
+            LengthQuantity(1000.0, mil).convert_to(millimeter)
+        with self.assertRaisesRegex(ValueError, 'Unknown unit: mil'):
+            LengthQuantity(1000.0, mil) < LengthQuantity(1.0, millimeter)
+
+    def test_override_factor(self):
+        gallon = find_unit_by_symbol('gal (US)')
+        liter = VolumeUnits.LITER.value
+        self.tenant.override_factor('gal (US)', 0.004)
+        self.assertAlmostEqual(self.tenant.convert(1.0, gallon, liter), 4.0)
+        self.assertAlmostEqual(self.base.convert(1.0, gallon, liter), 3.78541)
+
+    def test_child_sees_later_parent_changes(self):
+        parent = self.base.derive()
+        child = parent.derive()
+        self.assertIsNone(child.find_unit_by_symbol('fur'))
+        self.assertEqual(child.parse_unit('m/s').symbol, 'm/s')
+        furlong = parent.define_unit('furlong', 'fur', 'length', 201.168)
+        self.assertIs(child.parse_unit('fur'), furlong)
+        self.assertEqual(child.parse_unit('fur*m').dimensions, Dimensions({'L': 2}))
+
+    def test_custom_quantity_type_and_affine_unit(self):
+        self.tenant.define_quantity_type('data', Dimensions({'B': 1}))
+        byte = self.tenant.define_unit('byte', 'B', 'data', 1)
+        kibibyte = self.tenant.define_unit('kibibyte', 'KiB', 'data', 1024)
+        self.assertEqual(self.tenant.convert(2.0, kibibyte, byte), 2048.0)
+        rankine = self.tenant.define_unit('rankine', '°Ra', 'temperature', 5 / 9)
+        self.assertAlmostEqual(self.tenant.convert(491.67, rankine, TemperatureUnits.CELSIUS.value), 0.0)
+
+    def test_invalid_definitions(self):
+        with self.assertRaises(ValueError):
+            self.tenant.define_unit('meter again', 'm', 'length', 1)
+        with self.assertRaises(ValueError):
+            self.tenant.define_unit('thing', 'thg', 'no_such_type', 1)
+        with self.assertRaises(ValueError):
+            self.tenant.define_unit('zero', 'zr', 'length', 0)
+        with self.assertRaises(ValueError):
+            self.tenant.override_factor('not_a_unit', 2)
+        with self.assertRaises(ValueError):
+            self.tenant.define_quantity_type('length', Dimensions({'L': 1}))
+        with self.assertRaises(ValueError):
+            self.tenant.factor(LengthUnits.METER.value, TimeUnits.SECOND.value)
+
+if __name__ == '__main__':
+    unittest.main()
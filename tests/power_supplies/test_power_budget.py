@@ -0,0 +1,88 @@
+import sys
+import os
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from core.physical_quantities import VoltageQuantity, ElectricCurrentQuantity, ElectricChargeQuantity
+from core.unit import ElectricCurrentUnits, PowerUnits, ElectricChargeUnits
+from core.power_budget import BasePowerSupply, Component, LeadAcidBattery
+
+class PowerBudgetTester(unittest.TestCase):
+
+    def setUp(self):
+        self.battery = LeadAcidBattery('test_leadAcid_battery', ElectricCurrentQuantity(3.5), ElectricChargeQuantity(2, ElectricChargeUnits.AMPERE_HOUR.value), cell_count=6)
+        self.resistor = Component('resistor', voltage=VoltageQuantity(12.0), current=ElectricCurrentQuantity(2, ElectricCurrentUnits.MILLIAMPERE.value))
+        self.led = Component('led', voltage=VoltageQuantity(12.0), current=ElectricCurrentQuantity(0.01))
+
+    def test_add_components(self):
+        self.battery.add_component(self.resistor, 5)
+        self.battery.add_component(self.led, 3)
+        self.assertEqual(self.battery.total_current.unit, ElectricCurrentUnits.MILLIAMPERE.value)
+        self.assertAlmostEqual(self.battery.total_current.value, 40.0)
+        self.assertEqual(self.battery.total_power.unit, PowerUnits.MILLIWATT.value)
+        self.assertAlmostEqual(self.battery.total_power.value, 480.0)
+
+    def test_modify_and_remove_components(self):
+        self.battery.add_component(self.resistor, 5)
+        self.battery.add_component(self.led, 3)
+        self.battery.modify_component_quantity(1, 1)
+        self.assertAlmostEqual(self.battery.total_current.value, 20.0)
+        self.battery.remove_component(0)
+        self.assertAlmostEqual(self.battery.total_current.value, 10.0)
+        self.assertAlmostEqual(self.battery.total_power.value, 120.0)
+
+    def test_totals_are_updated_incrementally(self):
+        with mock.patch.object(BasePowerSupply, 'compute_power_budget', side_effect=AssertionError('Unexpected rescan')):
+            self.battery.add_component(self.resistor, 5)
+            self.battery.add_component(self.led, 3)
+            self.battery.modify_component_quantity(0, 10)
+            self.battery.remove_component(1)
+        self.assertAlmostEqual(self.battery.total_current.value, 20.0)
+        self.assertAlmostEqual(self.battery.total_power.value, 240.0)
+        self.battery.modify_component_quantity(0, 0)
+        self.assertEqual(self.battery.total_current.value, 0.0)
+        self.assertEqual(self.battery.total_power.value, 0.0)
+
+    def test_periodic_recompute_cancels_drift(self):
+        tiny = Component('tiny', voltage=VoltageQuantity(12.0), current=ElectricCurrentQuantity(0.1, ElectricCurrentUnits.MICROAMPERE.value))
+        self.battery.add_component(self.led, 1)
+        with mock.patch.object(BasePowerSupply, 'compute_power_budget', autospec=True, side_effect=BasePowerSupply.compute_power_budget) as recompute:
+            for _ in range(BasePowerSupply.RECOMPUTE_INTERVAL):
+                self.battery.add_component(tiny, 3)
+                self.battery.remove_component(1)
+        self.assertEqual(recompute.call_count, 2)
+        self.assertAlmostEqual(self.battery.total_current.value, 10.0, places=12)
+
+    def test_remove_after_changing_a_component_current(self):
+        first = Component('first', voltage=VoltageQuantity(12.0), current=ElectricCurrentQuantity(10, ElectricCurrentUnits.MILLIAMPERE.value))
+        second = Component('second', voltage=VoltageQuantity(12.0), current=ElectricCurrentQuantity(5, ElectricCurrentUnits.MILLIAMPERE.value))
+        self.battery.add_component(first, 1)
+        self.battery.add_component(second, 1)
+        first.current = ElectricCurrentQuantity(20, ElectricCurrentUnits.MILLIAMPERE.value)
+        self.battery.remove_component(0)
+        self.assertEqual(self.battery.total_current.value, 5.0)
+        self.battery.add_component(first, 1)
+        self.battery.modify_component_quantity(1, 2)
+        self.assertAlmostEqual(self.battery.total_current.value, 45.0)
+        self.battery.remove_component(1)
+        self.assertAlmostEqual(self.battery.total_current.value, 5.0)
+        self.battery.compute_power_budget()
+        self.assertAlmostEqual(self.battery.total_current.value, 5.0)
+
+    def test_totals_are_new_quantities(self):
+        self.battery.add_component(self.led, 1)
+        first = self.battery.total_current
+        self.battery.add_component(self.led, 1)
+        self.assertIsNot(self.battery.total_current, first)
+        self.assertAlmostEqual(first.value, 10.0)
+        self.assertAlmostEqual(self.battery.total_current.value, 20.0)
+
+    def test_nominal_voltage_change_updates_power(self):
+        self.battery.add_component(self.led, 2)
+        self.battery.nominal_voltage = VoltageQuantity(6.0)
+        self.assertAlmostEqual(self.battery.total_power.value, 120.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+
+from core.electrical_quantitites import AC_Voltage, normalize_phase
+from core.physical_quantities import VoltageQuantity, FrequencyQuantity, AngleQuantity
+from core.unit import AngleUnits
+
+class TestACVoltage(unittest.TestCase):
+
+    def test_normalize_phase_keeps_the_unit(self):
+        degrees = normalize_phase(AngleQuantity(270.0))
+        self.assertIs(degrees.unit, AngleUnits.DEGREE.value)
+        self.assertAlmostEqual(degrees.value, -90.0)
+        radians = normalize_phase(AngleQuantity(-3.5, AngleUnits.RADIAN.value))
+        self.assertIs(radians.unit, AngleUnits.RADIAN.value)
+        self.assertAlmostEqual(radians.value, 2.78318530718)
+        self.assertAlmostEqual(normalize_phase(AngleQuantity(180.0)).value, 180.0)
+
+    def test_build_ac_voltage(self):
+        voltage = AC_Voltage(VoltageQuantity(230.0), FrequencyQuantity(50.0), AngleQuantity(390.0))
+        self.assertAlmostEqual(voltage._phase_angle.value, 30.0)
+        self.assertIs(voltage._phase_angle.unit, AngleUnits.DEGREE.value)
+        self.assertAlmostEqual(voltage._amplitude.value, 325.2691193458119)
+        with self.assertRaises(ValueError):
+            AC_Voltage(VoltageQuantity(230.0), FrequencyQuantity(0.0), AngleQuantity(0.0))
+
+if __name__ == '__main__':
+    unittest.main()
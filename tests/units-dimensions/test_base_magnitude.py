@@ -0,0 +1,65 @@
+import unittest
+from unittest import mock
+
+from core.physical_quantities import *
+from core.unit import *
+
+class TestBaseMagnitude(unittest.TestCase):
+
+    def test_base_value(self):
+        self.assertAlmostEqual(PowerQuantity(1.5, PowerUnits.KILOWATT.value).base_value, 1500.0)
+        self.assertAlmostEqual(TemperatureQuantity(25.0, TemperatureUnits.CELSIUS.value).base_value, 298.15)
+        speed = LengthQuantity(36.0, LengthUnits.KILOMETER.value / TimeUnits.HOUR.value)
+        self.assertAlmostEqual(speed.base_value, 10.0)
+
+    def test_base_value_is_cached(self):
+        current = ElectricCurrentQuantity(250.0, ElectricCurrentUnits.MILLIAMPERE.value)
+        self.assertAlmostEqual(current.base_value, 0.25)
+        self.assertIs(current.base_value, current.base_value)
+
+    def test_quantities_are_immutable(self):
+        current = ElectricCurrentQuantity(250.0, ElectricCurrentUnits.MILLIAMPERE.value)
+        key = hash(current)
+        with self.assertRaises(AttributeError):
+            current.value = 500.0
+        with self.assertRaises(AttributeError):
+            current.unit = ElectricCurrentUnits.AMPERE.value
+        self.assertEqual(hash(current), key)
+        self.assertIn(current, {ElectricCurrentQuantity(0.25)})
+
+    def test_sorting_does_not_convert(self):
+        currents = [ElectricCurrentQuantity(value, unit) for value, unit in (
+            (2.0, ElectricCurrentUnits.AMPERE.value),
+            (150.0, ElectricCurrentUnits.MILLIAMPERE.value),
+            (1.0, ElectricCurrentUnits.AMPERE.value),
+            (1500.0, ElectricCurrentUnits.MILLIAMPERE.value),
+        )]
+        with mock.patch.object(BaseQuantity, 'convert_to', side_effect=AssertionError('Unexpected conversion')):
+            ordered = sorted(currents)
+        self.assertEqual([quantity.value for quantity in ordered], [150.0, 1.0, 1500.0, 2.0])
+
+    def test_equality_and_hash(self):
+        kilometre = LengthQuantity(1.0, LengthUnits.KILOMETER.value)
+        metres = LengthQuantity(1000.0, LengthUnits.METER.value)
+        self.assertEqual(kilometre, metres)
+        self.assertEqual(hash(kilometre), hash(metres))
+        self.assertEqual(len({kilometre, metres, LengthQuantity(2.0)}), 2)
+        freezing = TemperatureQuantity(0.0, TemperatureUnits.CELSIUS.value)
+        self.assertEqual(freezing, TemperatureQuantity(273.15))
+        self.assertEqual(hash(freezing), hash(TemperatureQuantity(273.15)))
+
+    def test_mixed_unit_arithmetic(self):
+        total = PowerQuantity(1.0, PowerUnits.KILOWATT.value) + PowerQuantity(500.0)
+        self.assertIs(total.unit, PowerUnits.KILOWATT.value)
+        self.assertAlmostEqual(total.value, 1.5)
+        difference = TemperatureQuantity(300.0) - TemperatureQuantity(20.0, TemperatureUnits.CELSIUS.value)
+        self.assertAlmostEqual(difference.value, 6.85)
+
+    def test_incompatible_units(self):
+        with self.assertRaises(ValueError):
+            LengthQuantity(1.0) < LengthQuantity(1.0, LengthUnits.METER.value / TimeUnits.SECOND.value)
+        with self.assertRaises(TypeError):
+            LengthQuantity(1.0) == MassQuantity(1.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+from fractions import Fraction
+
+from core.unit import *
+
+class TestCanonicalUnits(unittest.TestCase):
+
+    def test_canonical_form(self):
+        newton = ForceUnits.NEWTON.value
+        self.assertEqual(newton.canonical_form, ((("kg", Fraction(1)), ("m", Fraction(1)), ("s", Fraction(-2))), 1.0))
+        self.assertEqual(LengthUnits.KILOMETER.value.canonical_form, ((("m", Fraction(1)),), 1000.0))
+
+    def test_equivalent_compound_units(self):
+        kilogram = MassUnits.KILOGRAM.value
+        meter = LengthUnits.METER.value
+        second = TimeUnits.SECOND.value
+        newton = ForceUnits.NEWTON.value
+        self.assertEqual(kilogram * meter / second ** 2, newton)
+        self.assertEqual(newton * meter, EnergyUnits.JOULE.value)
+        self.assertEqual(EnergyUnits.JOULE.value / second, PowerUnits.WATT.value)
+        self.assertEqual(PowerUnits.KILOWATT.value * TimeUnits.HOUR.value, EnergyUnits.KILOWATT_HOUR.value)
+        self.assertEqual(hash(kilogram * meter / second ** 2), hash(newton))
+
+    def test_nesting_does_not_matter(self):
+        meter = LengthUnits.METER.value
+        second = TimeUnits.SECOND.value
+        nested = ((meter * meter) * meter) / (second * (meter * meter))
+        self.assertEqual(nested, meter / second)
+        self.assertEqual(nested, SpeedUnits.METER_PER_SECOND.value)
+
+    def test_different_scales_are_not_equal(self):
+        kilometer = LengthUnits.KILOMETER.value
+        self.assertNotEqual(kilometer * kilometer, AreaUnits.SQUARE_METER.value)
+        self.assertNotEqual(kilometer / TimeUnits.SECOND.value, SpeedUnits.METER_PER_SECOND.value)
+
+    def test_registered_units_keep_their_symbol(self):
+        watt = PowerUnits.WATT.value
+        volt_ampere = PowerUnits.VOLT_AMPERE.value
+        var = PowerUnits.VOLT_AMPERE_REACTIVE.value
+        self.assertNotEqual(watt, volt_ampere)
+        self.assertNotEqual(volt_ampere, var)
+        self.assertNotEqual(watt, var)
+        self.assertEqual(len({watt, volt_ampere, var}), 3)
+        self.assertNotEqual(TemperatureUnits.KELVIN.value, TemperatureUnits.CELSIUS.value)
+        self.assertIsNot(PowerUnits.VOLT_AMPERE, PowerUnits.WATT)
+        self.assertEqual(PowerUnits.VOLT_AMPERE.value.symbol, 'VA')
+
+    def test_enum_lookup_by_unit(self):
+        self.assertIs(PowerUnits(PowerUnits.WATT.value), PowerUnits.WATT)
+        self.assertIs(PowerUnits(PowerUnits.VOLT_AMPERE.value), PowerUnits.VOLT_AMPERE)
+        self.assertIs(PowerUnits(PowerUnits.VOLT_AMPERE_REACTIVE.value), PowerUnits.VOLT_AMPERE_REACTIVE)
+        product = VoltageUnits.VOLT.value * ElectricCurrentUnits.AMPERE.value
+        self.assertIs(PowerUnits(product), PowerUnits.WATT)
+        with self.assertRaises(ValueError):
+            PowerUnits(LengthUnits.METER.value)
+
+    def test_equality_is_transitive(self):
+        watt = PowerUnits.WATT.value
+        volt_ampere = PowerUnits.VOLT_AMPERE.value
+        product = VoltageUnits.VOLT.value * ElectricCurrentUnits.AMPERE.value
+        self.assertEqual(product, watt)
+        self.assertNotEqual(product, volt_ampere)
+        self.assertEqual(len({watt, volt_ampere, product}), 2)
+        self.assertEqual(len({product, watt, volt_ampere}), 2)
+        self.assertEqual(len({volt_ampere, product, watt}), 2)
+        kelvin_second = TemperatureUnits.KELVIN.value * TimeUnits.SECOND.value
+        units = [TemperatureUnits.KELVIN.value, TemperatureUnits.CELSIUS.value, kelvin_second,
+                 TemperatureUnits.CELSIUS.value * TimeUnits.SECOND.value]
+        self.assertEqual(len(set(units)), 3)
+        self.assertEqual(len(set(reversed(units))), 3)
+
+    def test_hash_tells_scales_apart(self):
+        lengths = [LengthUnits.METER.value, LengthUnits.KILOMETER.value, LengthUnits.MILLIMETER.value]
+        self.assertEqual(len({hash(unit) for unit in lengths}), 3)
+
+    def test_temperature_in_compound_units(self):
+        second = TimeUnits.SECOND.value
+        self.assertEqual(TemperatureUnits.CELSIUS.value * second, TemperatureUnits.KELVIN.value * second)
+        self.assertNotEqual(TemperatureUnits.FAHRENHEIT.value * second, TemperatureUnits.KELVIN.value * second)
+
+    def test_units_without_table(self):
+        mock = MockUnits.MOCK_UNIT.value
+        self.assertIsNone(mock.scale)
+        with self.assertRaises(ValueError):
+            mock.canonical_form
+        self.assertEqual(mock * mock, mock * mock)
+
+if __name__ == '__main__':
+    unittest.main()
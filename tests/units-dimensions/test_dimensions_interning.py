@@ -0,0 +1,40 @@
+import copy
+import pickle
+import unittest
+from fractions import Fraction
+
+from core.unit import *
+
+class TestDimensionsInterning(unittest.TestCase):
+
+    def test_equal_dimensions_are_identical(self):
+        self.assertIs(Dimensions({"L": 1, "T": -1}), SPEED_DIMENSIONS)
+        self.assertIs(Dimensions({"T": -1.0, "L": Fraction(1)}), SPEED_DIMENSIONS)
+        self.assertIs(LENGTH_DIMENSIONS / TIME_DIMENSIONS, SPEED_DIMENSIONS)
+        self.assertIs(Dimensions({"L": 0}), Dimensions())
+
+    def test_hashable(self):
+        lookup = {SPEED_DIMENSIONS: "speed", FORCE_DIMENSIONS: "force"}
+        self.assertEqual(lookup[LENGTH_DIMENSIONS / TIME_DIMENSIONS], "speed")
+        self.assertEqual(len({AREA_DIMENSIONS, LENGTH_DIMENSIONS * LENGTH_DIMENSIONS}), 1)
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            LENGTH_DIMENSIONS.foo = 1
+        with self.assertRaises(AttributeError):
+            del LENGTH_DIMENSIONS._key
+        exponents = LENGTH_DIMENSIONS.dimensions_dict
+        exponents["L"] = 2
+        self.assertEqual(LENGTH_DIMENSIONS.dimensions_dict, {"L": Fraction(1)})
+
+    def test_copy_and_pickle_preserve_identity(self):
+        self.assertIs(copy.copy(FORCE_DIMENSIONS), FORCE_DIMENSIONS)
+        self.assertIs(copy.deepcopy(FORCE_DIMENSIONS), FORCE_DIMENSIONS)
+        self.assertIs(pickle.loads(pickle.dumps(FORCE_DIMENSIONS)), FORCE_DIMENSIONS)
+
+    def test_unit_compatibility(self):
+        self.assertTrue(LengthUnits.METER.value.is_compatible_with(LengthUnits.INCH.value))
+        self.assertFalse(LengthUnits.METER.value.is_compatible_with(TimeUnits.SECOND.value))
+
+if __name__ == '__main__':
+    unittest.main()
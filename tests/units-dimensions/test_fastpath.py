@@ -0,0 +1,97 @@
+import threading
+import unittest
+from unittest import mock
+
+import core
+from core.physical_quantities import *
+from core.unit import *
+
+class TestFastpath(unittest.TestCase):
+
+    def setUp(self):
+        self.currents = [
+            ElectricCurrentQuantity(2.0),
+            ElectricCurrentQuantity(150.0, ElectricCurrentUnits.MILLIAMPERE.value),
+            ElectricCurrentQuantity(1.0),
+        ]
+
+    def test_exported_from_core(self):
+        self.assertIs(core.fastpath, fastpath)
+
+    def test_results_match_validated_operations(self):
+        validated_total = self.currents[0] + self.currents[1] - self.currents[2]
+        validated_order = sorted(self.currents)
+        with core.fastpath(self.currents):
+            total = self.currents[0] + self.currents[1] - self.currents[2]
+            order = sorted(self.currents)
+            self.assertTrue(self.currents[1] < self.currents[0])
+            self.assertEqual(self.currents[1], ElectricCurrentQuantity(0.15))
+        self.assertAlmostEqual(total.value, validated_total.value)
+        self.assertEqual([quantity.value for quantity in order], [quantity.value for quantity in validated_order])
+
+    def test_validation_is_skipped(self):
+        with mock.patch.object(BaseQuantity, '_assert_compatible', side_effect=AssertionError('Unexpected check')), \
+             mock.patch.object(Unit, 'is_compatible_with', side_effect=AssertionError('Unexpected check')):
+            with core.fastpath():
+                total = self.currents[0] + self.currents[1]
+                self.assertTrue(self.currents[1] < self.currents[0])
+        self.assertAlmostEqual(total.value, 2.15)
+
+    def test_validation_is_restored(self):
+        with core.fastpath():
+            pass
+        with self.assertRaises(TypeError):
+            self.currents[0] + VoltageQuantity(1.0)
+        with self.assertRaises(TypeError):
+            with core.fastpath():
+                raise TypeError('inside the block')
+        with self.assertRaises(TypeError):
+            self.currents[0] < VoltageQuantity(1.0)
+
+    def test_entry_check(self):
+        with self.assertRaises(TypeError):
+            with core.fastpath(self.currents, [VoltageQuantity(1.0)]):
+                pass
+        with self.assertRaises(TypeError):
+            with core.fastpath([1.0, 2.0]):
+                pass
+        speed = LengthQuantity(1.0, LengthUnits.METER.value / TimeUnits.SECOND.value)
+        with self.assertRaises(ValueError):
+            with core.fastpath(LengthQuantity(1.0), speed):
+                pass
+
+    def test_non_quantities_are_still_refused(self):
+        with core.fastpath(self.currents):
+            self.assertFalse(self.currents[0] == None)
+            self.assertNotEqual(self.currents[0], 'x')
+            with self.assertRaises(TypeError):
+                self.currents[0] < 1.0
+            with self.assertRaises(TypeError):
+                self.currents[0] + None
+
+    def test_iterators_are_materialized(self):
+        with core.fastpath(iter(self.currents), self.currents[0]) as (currents, first):
+            self.assertEqual(currents, self.currents)
+            self.assertIs(first, self.currents[0])
+            self.assertAlmostEqual(sum(currents).value, 3.15)
+        with self.assertRaises(ValueError):
+            with core.fastpath(quantity for quantity in [LengthQuantity(1.0), LengthQuantity(1.0, LengthUnits.METER.value / TimeUnits.SECOND.value)]):
+                pass
+
+    def test_other_threads_keep_validating(self):
+        errors = []
+
+        def mix_types():
+            try:
+                self.currents[0] + VoltageQuantity(1.0)
+            except TypeError as error:
+                errors.append(error)
+
+        with core.fastpath():
+            thread = threading.Thread(target=mix_types)
+            thread.start()
+            thread.join()
+        self.assertEqual(len(errors), 1)
+
+if __name__ == '__main__':
+    unittest.main()
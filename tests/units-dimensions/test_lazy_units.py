@@ -0,0 +1,56 @@
+import os
+import re
+import subprocess
+import sys
+import unittest
+
+import core.unit as units
+
+PACKAGE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+# Cumulative import time of core.physical_quantities (stdlib dependencies included)
+IMPORT_TIME_BUDGET_MS = 150
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=PACKAGE_ROOT,
+                          capture_output=True, text=True, check=True)
+
+
+class TestLazyUnits(unittest.TestCase):
+
+    def test_import_builds_no_unit_family(self):
+        result = run_python('import core.physical_quantities, core.unit as u; print(sorted(u._UNIT_ENUM_CACHE))')
+        self.assertEqual(result.stdout.strip(), '[]')
+
+    def test_only_used_families_are_built(self):
+        result = run_python(
+            'import core.unit as u\n'
+            'from core.physical_quantities import VoltageQuantity\n'
+            'VoltageQuantity(5.0) + VoltageQuantity(1.0, u.VoltageUnits.MILLIVOLT.value)\n'
+            'print(sorted(u._UNIT_ENUM_CACHE))'
+        )
+        self.assertEqual(result.stdout.strip(), "['voltage']")
+
+    def test_import_time_budget(self):
+        result = run_python('import core.physical_quantities')
+        match = re.search(r'\|\s*(\d+) \| core\.physical_quantities$', result.stderr, re.M)
+        self.assertIsNotNone(match, result.stderr)
+        self.assertLess(int(match.group(1)) / 1000, IMPORT_TIME_BUDGET_MS)
+
+    def test_module_attributes(self):
+        self.assertIs(units.LengthUnits, units.UNIT_ENUM_BY_QUANTITY['length'])
+        self.assertIn('ThermalConductivityUnits', dir(units))
+        self.assertIn('ThermalConductivityUnits', units.__all__)
+        with self.assertRaises(AttributeError):
+            units.NotAUnitFamily
+        with self.assertRaises(KeyError):
+            units.UNIT_ENUM_BY_QUANTITY['not_a_quantity']
+
+    def test_lookups_load_families(self):
+        self.assertEqual(units.find_unit_by_symbol('W/(m*K)').name, 'watt per meter kelvin')
+        self.assertEqual(units.find_unit_by_name('siemens').symbol, 'S')
+        self.assertIsNone(units.find_unit_by_symbol('not a unit'))
+        self.assertIs(units.find_dimensions_by_unit_type('power'), units.POWER_DIMENSIONS)
+
+if __name__ == '__main__':
+    unittest.main()
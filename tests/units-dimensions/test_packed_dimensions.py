@@ -0,0 +1,38 @@
+import unittest
+from fractions import Fraction
+
+from core.unit import *
+
+class TestPackedDimensions(unittest.TestCase):
+
+    def test_packed_products_match_fraction_path(self):
+        self.assertIsNotNone(VOLTAGE_DIMENSIONS._packed)
+        self.assertIs(VOLTAGE_DIMENSIONS * ELECTRIC_CURRENT_DIMENSIONS, POWER_DIMENSIONS)
+        self.assertIs(POWER_DIMENSIONS / ELECTRIC_CURRENT_DIMENSIONS, VOLTAGE_DIMENSIONS)
+        self.assertIs(FORCE_DIMENSIONS / FORCE_DIMENSIONS, Dimensions())
+        self.assertIs(ANGLE_DIMENSIONS / TIME_DIMENSIONS, Dimensions({"": 1, "T": -1}))
+
+    def test_half_integer_exponents(self):
+        root_length = Dimensions({"L": 0.5})
+        self.assertIsNotNone(root_length._packed)
+        self.assertIs(root_length * root_length, LENGTH_DIMENSIONS)
+        self.assertEqual((Dimensions() / root_length).dimensions_dict, {"L": Fraction(-1, 2)})
+
+    def test_fallback_for_exotic_dimensions(self):
+        third = Dimensions({"L": Fraction(1, 3)})
+        self.assertIsNone(third._packed)
+        self.assertIs(third * third * third, LENGTH_DIMENSIONS)
+        custom = Dimensions({"X": 1})
+        self.assertIsNone(custom._packed)
+        self.assertIs(custom * LENGTH_DIMENSIONS / custom, LENGTH_DIMENSIONS)
+
+    def test_large_exponents_fall_back(self):
+        large = Dimensions({"L": 4096})
+        self.assertIsNotNone(large._packed)
+        product = large * large
+        self.assertIsNone(product._packed)
+        self.assertEqual(product.dimensions_dict, {"L": Fraction(8192)})
+        self.assertIs(product / large, large)
+
+if __name__ == '__main__':
+    unittest.main()
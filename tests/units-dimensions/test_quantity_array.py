@@ -0,0 +1,120 @@
+import unittest
+
+from core.physical_quantities import *
+from core.unit import *
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class TestQuantityArray(unittest.TestCase):
+
+    def setUp(self):
+        self.currents = QuantityArray([100.0, 250.0, 500.0, 1000.0], ElectricCurrentUnits.MILLIAMPERE.value)
+        self.voltages = QuantityArray(np.array([5.0, 5.0, 3.3, 12.0]), VoltageUnits.VOLT.value)
+
+    def test_construction(self):
+        self.assertIs(self.currents.quantity_class, ElectricCurrentQuantity)
+        self.assertEqual(self.currents.dtype, np.float64)
+        self.assertTrue(self.currents.values.flags['C_CONTIGUOUS'])
+        self.assertEqual(QuantityArray([1, 2], VoltageUnits.VOLT.value).dtype, np.float64)
+        with self.assertRaises(ValueError):
+            QuantityArray([1.0], VoltageUnits.VOLT.value * TimeUnits.SECOND.value)
+        charge = QuantityArray([1.0], VoltageUnits.VOLT.value * TimeUnits.SECOND.value, VoltageQuantity)
+        self.assertIs(charge.quantity_class, VoltageQuantity)
+
+    def test_convert_to(self):
+        amperes = self.currents.convert_to(ElectricCurrentUnits.AMPERE.value)
+        np.testing.assert_allclose(amperes.values, [0.1, 0.25, 0.5, 1.0])
+        self.assertIs(amperes.unit, ElectricCurrentUnits.AMPERE.value)
+        temperatures = QuantityArray([0.0, 100.0], TemperatureUnits.CELSIUS.value)
+        np.testing.assert_allclose(temperatures.convert_to(TemperatureUnits.KELVIN.value).values, [273.15, 373.15])
+        with self.assertRaises(ValueError):
+            self.currents.convert_to(VoltageUnits.VOLT.value)
+
+    def test_addition_and_subtraction(self):
+        total = self.currents + QuantityArray([0.1, 0.1, 0.1, 0.1], ElectricCurrentUnits.AMPERE.value)
+        self.assertIs(total.unit, ElectricCurrentUnits.MILLIAMPERE.value)
+        np.testing.assert_allclose(total.values, [200.0, 350.0, 600.0, 1100.0])
+        np.testing.assert_allclose((self.currents - ElectricCurrentQuantity(0.1)).values, [0.0, 150.0, 400.0, 900.0])
+        shifted = ElectricCurrentQuantity(1.0) + self.currents
+        self.assertIs(shifted.unit, ElectricCurrentUnits.AMPERE.value)
+        np.testing.assert_allclose(shifted.values, [1.1, 1.25, 1.5, 2.0])
+        with self.assertRaises(TypeError):
+            self.currents + self.voltages
+
+    def test_multiplication_and_division(self):
+        power = self.voltages * self.currents
+        self.assertIs(power.quantity_class, PowerQuantity)
+        np.testing.assert_allclose(power.convert_to(PowerUnits.WATT.value).values, [0.5, 1.25, 1.65, 12.0])
+        resistance = self.voltages / self.currents
+        self.assertIs(resistance.quantity_class, ResistanceQuantity)
+        np.testing.assert_allclose((self.currents * 2).values, [200.0, 500.0, 1000.0, 2000.0])
+        np.testing.assert_allclose((np.array([1.0, 2.0, 3.0, 4.0]) * self.currents).values, [100.0, 500.0, 1500.0, 4000.0])
+        scaled = VoltageQuantity(2.0) * self.currents
+        self.assertIs(scaled.quantity_class, PowerQuantity)
+
+    def test_slicing_does_not_copy(self):
+        view = self.currents[1:3]
+        self.assertIsInstance(view, QuantityArray)
+        self.assertTrue(np.shares_memory(view.values, self.currents.values))
+        self.assertIs(view.unit, self.currents.unit)
+        element = self.currents[2]
+        self.assertIsInstance(element, ElectricCurrentQuantity)
+        self.assertEqual(element.value, 500.0)
+        self.assertIsInstance(element.value, float)
+
+    def test_scalar_quantities_round_trip(self):
+        quantities = [ElectricCurrentQuantity(1.0), ElectricCurrentQuantity(5.0, ElectricCurrentUnits.MILLIAMPERE.value)]
+        array = QuantityArray.from_quantities(quantities)
+        self.assertIs(array.unit, ElectricCurrentUnits.AMPERE.value)
+        np.testing.assert_allclose(array.values, [1.0, 0.005])
+        array = QuantityArray.from_quantities(quantities, ElectricCurrentUnits.MILLIAMPERE.value)
+        self.assertEqual(array.to_quantities(), [ElectricCurrentQuantity(1000.0, ElectricCurrentUnits.MILLIAMPERE.value),
+                                                 ElectricCurrentQuantity(5.0, ElectricCurrentUnits.MILLIAMPERE.value)])
+        with self.assertRaises(TypeError):
+            QuantityArray.from_quantities([ElectricCurrentQuantity(1.0), VoltageQuantity(1.0)])
+        with self.assertRaises(ValueError):
+            QuantityArray.from_quantities([])
+
+    def test_from_columns(self):
+        currents = QuantityArray.from_columns([12, 0.5, 300], ['mA', 'A', 'μA'])
+        self.assertIs(currents.unit, ElectricCurrentUnits.MILLIAMPERE.value)
+        self.assertIs(currents.quantity_class, ElectricCurrentQuantity)
+        np.testing.assert_allclose(currents.values, [12.0, 500.0, 0.3])
+        currents = QuantityArray.from_columns(np.array([12, 0.5, 300]), np.array(['mA', ' A', 'μA']), ElectricCurrentUnits.AMPERE.value)
+        np.testing.assert_allclose(currents.values, [0.012, 0.5, 0.0003])
+
+    def test_from_columns_micro_sign(self):
+        currents = QuantityArray.from_columns([300.0, 2.0], ['\u00b5A', '\u03bcA'], ElectricCurrentUnits.MICROAMPERE.value)
+        np.testing.assert_allclose(currents.values, [300.0, 2.0])
+        self.assertIs(parse_unit('\u00b5A'), ElectricCurrentUnits.MICROAMPERE.value)
+        self.assertEqual(parse_unit('\u00b5m/s').dimensions, SPEED_DIMENSIONS)
+
+    def test_from_columns_affine_and_compound_units(self):
+        temperatures = QuantityArray.from_columns([20.0, 300.0, 32.0], ['°C', 'K', '°F'])
+        np.testing.assert_allclose(temperatures.values, [20.0, 26.85, 0.0], atol=1e-9)
+        flows = QuantityArray.from_columns([1.0, 1.0], ['kg/s', 'kg/h'])
+        self.assertIs(flows.quantity_class, MassFlowRateQuantity)
+        np.testing.assert_allclose(flows.values, [1.0, 1.0 / 3600.0])
+
+    def test_from_columns_errors(self):
+        with self.assertRaises(ValueError):
+            QuantityArray.from_columns([1.0, 2.0], ['mA'])
+        with self.assertRaises(ValueError):
+            QuantityArray.from_columns([1.0, 2.0], ['mA', 'V'])
+        with self.assertRaises(ValueError):
+            QuantityArray.from_columns([1.0], ['not-a-unit'])
+        with self.assertRaises(ValueError):
+            QuantityArray.from_columns([], [])
+        empty = QuantityArray.from_columns([], [], ElectricCurrentUnits.AMPERE.value)
+        self.assertEqual(len(empty), 0)
+
+    def test_comparisons(self):
+        np.testing.assert_array_equal(self.currents > ElectricCurrentQuantity(0.2), [False, True, True, True])
+        np.testing.assert_array_equal(self.currents == self.currents.convert_to(ElectricCurrentUnits.AMPERE.value), [True] * 4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+
+from core.physical_quantities import *
+from core.unit import *
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class TestQuantityArrayPrecision(unittest.TestCase):
+
+    def setUp(self):
+        self.powers = QuantityArray(np.linspace(0.5, 4000.0, 1000), PowerUnits.MILLIWATT.value)
+
+    def test_error_bounds(self):
+        self.assertEqual(max_relative_error('float64'), 2.0**-53)
+        self.assertEqual(max_relative_error(np.float32), 2.0**-24)
+        self.assertEqual(max_relative_error('float16'), 2.0**-11)
+        with self.assertRaises(ValueError):
+            max_relative_error('int16')
+
+    def test_narrow_storage(self):
+        narrow = self.powers.astype('float32')
+        self.assertEqual(narrow.dtype, np.float32)
+        self.assertEqual(narrow.values.nbytes * 2, self.powers.values.nbytes)
+        self.assertIs(narrow.unit, self.powers.unit)
+        self.assertLessEqual(self.powers.relative_error('float32'), max_relative_error('float32'))
+        self.assertLessEqual(self.powers.relative_error('float16'), max_relative_error('float16'))
+        self.assertEqual(QuantityArray([1.0, 2.0], VoltageUnits.VOLT.value, dtype='float16').dtype, np.float16)
+        with self.assertRaises(ValueError):
+            QuantityArray([1.0], VoltageUnits.VOLT.value, dtype='int32')
+
+    def test_conversions_keep_precision(self):
+        narrow = self.powers.astype('float32')
+        watts = narrow.convert_to(PowerUnits.WATT.value)
+        self.assertEqual(watts.dtype, np.float32)
+        np.testing.assert_allclose(watts.values, self.powers.values / 1000.0, rtol=max_relative_error('float32') * 2)
+        temperatures = QuantityArray([20.0, 25.0], TemperatureUnits.CELSIUS.value, dtype='float32')
+        kelvins = temperatures.convert_to(TemperatureUnits.KELVIN.value)
+        self.assertEqual(kelvins.dtype, np.float32)
+        np.testing.assert_allclose(kelvins.values, [293.15, 298.15], rtol=max_relative_error('float32'))
+
+    def test_constructors_convert_in_float64(self):
+        currents = QuantityArray.from_columns([12.0, 0.5, 300.0], ['mA', 'A', 'μA'], dtype='float32')
+        self.assertEqual(currents.dtype, np.float32)
+        np.testing.assert_array_equal(currents.values, np.array([12.0, 500.0, 0.3]).astype(np.float32))
+        quantities = [ElectricCurrentQuantity(1.0), ElectricCurrentQuantity(5.0, ElectricCurrentUnits.MILLIAMPERE.value)]
+        currents = QuantityArray.from_quantities(quantities, ElectricCurrentUnits.MILLIAMPERE.value, dtype='float16')
+        self.assertEqual(currents.dtype, np.float16)
+        np.testing.assert_array_equal(currents.values, [1000.0, 5.0])
+
+    def test_overflow_is_reported(self):
+        microwatts = self.powers.convert_to(PowerUnits.MICROWATT.value)
+        self.assertEqual(microwatts.relative_error('float16'), float('inf'))
+        with self.assertRaises(ValueError):
+            microwatts.astype('float16', max_error=1e-3)
+        self.assertEqual(self.powers.astype('float16', max_error=1e-3).dtype, np.float16)
+        self.assertEqual(QuantityArray([0.0], VoltageUnits.VOLT.value).relative_error('float16'), 0.0)
+
+    def test_non_finite_values(self):
+        milliamperes = ElectricCurrentUnits.MILLIAMPERE.value
+        self.assertEqual(QuantityArray([np.nan, 1e5], milliamperes).relative_error('float16'), float('inf'))
+        with self.assertRaises(ValueError):
+            QuantityArray([np.nan, 1e5], milliamperes).astype('float16', max_error=1e-3)
+        samples = QuantityArray([np.nan, np.inf, -np.inf, 1.0, 2.5], milliamperes)
+        self.assertEqual(samples.relative_error('float16'), 0.0)
+        narrow = samples.astype('float16', max_error=1e-3)
+        self.assertTrue(np.isnan(narrow.values[0]))
+        self.assertEqual(QuantityArray([np.nan], milliamperes).relative_error('float32'), 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
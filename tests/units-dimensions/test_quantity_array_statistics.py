@@ -0,0 +1,96 @@
+import unittest
+from unittest import mock
+
+from core.physical_quantities import *
+from core.unit import *
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class TestQuantityArrayStatistics(unittest.TestCase):
+
+    def setUp(self):
+        self.currents = QuantityArray.from_columns([100.0, 0.3, 200.0, 0.4], ['mA', 'A', 'mA', 'A'])
+        self.temperatures = QuantityArray([20.0, 22.0, 24.0], TemperatureUnits.CELSIUS.value)
+
+    def test_typed_results(self):
+        for result in (self.currents.sum(), self.currents.mean(), self.currents.min(), self.currents.max(),
+                       self.currents.std(), self.currents.ptp(), self.currents.median()):
+            self.assertIsInstance(result, ElectricCurrentQuantity)
+            self.assertIs(result.unit, ElectricCurrentUnits.MILLIAMPERE.value)
+            self.assertIsInstance(result.value, float)
+        power = (QuantityArray([5.0, 12.0], VoltageUnits.VOLT.value) * QuantityArray([1.0, 0.5], ElectricCurrentUnits.AMPERE.value)).sum()
+        self.assertIsInstance(power, PowerQuantity)
+
+    def test_values(self):
+        self.assertAlmostEqual(self.currents.sum().value, 1000.0)
+        self.assertAlmostEqual(self.currents.mean(ElectricCurrentUnits.AMPERE.value).value, 0.25)
+        self.assertAlmostEqual(self.currents.min().value, 100.0)
+        self.assertAlmostEqual(self.currents.max().value, 400.0)
+        self.assertAlmostEqual(self.currents.std().value, np.std([100.0, 300.0, 200.0, 400.0]))
+        self.assertAlmostEqual(self.currents.std(ddof=1).value, np.std([100.0, 300.0, 200.0, 400.0], ddof=1))
+        self.assertAlmostEqual(self.currents.ptp().value, 300.0)
+        self.assertAlmostEqual(self.currents.percentile(50).value, 250.0)
+        percentiles = self.currents.percentile([0, 100], ElectricCurrentUnits.AMPERE.value)
+        self.assertIsInstance(percentiles, QuantityArray)
+        np.testing.assert_allclose(percentiles.values, [0.1, 0.4])
+
+    def test_no_per_element_objects(self):
+        with mock.patch.object(QuantityArray, 'to_quantities', side_effect=AssertionError('Unexpected quantities')):
+            self.currents.sum()
+            self.currents.std()
+            self.currents.histogram(4)
+
+    def test_affine_temperatures(self):
+        mean = self.temperatures.mean()
+        self.assertIs(mean.unit, TemperatureUnits.CELSIUS.value)
+        self.assertAlmostEqual(mean.value, 22.0)
+        self.assertAlmostEqual(self.temperatures.mean(TemperatureUnits.KELVIN.value).value, 295.15)
+        spread = self.temperatures.std()
+        self.assertIs(spread.unit, TemperatureUnits.KELVIN.value)
+        self.assertAlmostEqual(spread.value, np.std([20.0, 22.0, 24.0]))
+        self.assertAlmostEqual(self.temperatures.ptp().value, 4.0)
+        self.assertAlmostEqual(self.temperatures.ptp(TemperatureUnits.FAHRENHEIT.value).value, 7.2)
+        self.assertAlmostEqual(self.temperatures.ptp(TemperatureUnits.CELSIUS.value).value, 4.0)
+        fahrenheit = QuantityArray([32.0, 50.0], TemperatureUnits.FAHRENHEIT.value)
+        self.assertAlmostEqual(fahrenheit.ptp().value, 10.0)
+        self.assertAlmostEqual(fahrenheit.mean(TemperatureUnits.CELSIUS.value).value, 5.0)
+
+    def test_affine_sum_is_refused(self):
+        with self.assertRaises(ValueError):
+            self.temperatures.sum()
+        with self.assertRaises(ValueError):
+            self.temperatures.sum(TemperatureUnits.KELVIN.value)
+        kelvins = self.temperatures.convert_to(TemperatureUnits.KELVIN.value)
+        self.assertAlmostEqual(kelvins.sum().value, 66.0 + 3 * 273.15)
+        with self.assertRaises(ValueError):
+            kelvins.sum(TemperatureUnits.CELSIUS.value)
+        self.assertAlmostEqual(self.temperatures.mean(TemperatureUnits.KELVIN.value).value, TemperatureQuantity.mean(self.temperatures.to_quantities(), TemperatureUnits.KELVIN.value).value)
+
+    def test_histogram(self):
+        counts, edges = self.currents.histogram(3)
+        self.assertEqual(counts.tolist(), [1, 1, 2])
+        self.assertIs(edges.unit, self.currents.unit)
+        np.testing.assert_allclose(edges.values, [100.0, 200.0, 300.0, 400.0])
+        counts, edges = self.currents.histogram(2, (ElectricCurrentQuantity(0.0), ElectricCurrentQuantity(0.5)))
+        self.assertEqual(counts.tolist(), [2, 2])
+        np.testing.assert_allclose(edges.values, [0.0, 250.0, 500.0])
+        counts, _ = self.currents.histogram(QuantityArray([0.0, 0.25, 0.5], ElectricCurrentUnits.AMPERE.value))
+        self.assertEqual(counts.tolist(), [2, 2])
+
+    def test_empty(self):
+        empty = QuantityArray([], ElectricCurrentUnits.AMPERE.value)
+        self.assertEqual(empty.sum().value, 0.0)
+        for reduction in (empty.mean, empty.min, empty.max, empty.std, empty.median):
+            with self.assertRaises(ValueError):
+                reduction()
+
+    def test_low_precision_accumulates_in_float64(self):
+        values = QuantityArray(np.full(100000, 0.1, dtype=np.float16), VoltageUnits.VOLT.value)
+        self.assertAlmostEqual(values.sum().value, 100000 * float(np.float16(0.1)), places=3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from core.physical_quantities import *
+from core.unit import *
+from core.power_budget import Component
+
+class TestQuantityDispatch(unittest.TestCase):
+
+    def test_index(self):
+        self.assertIs(find_quantity_class_by_dimensions(POWER_DIMENSIONS), PowerQuantity)
+        self.assertIs(find_quantity_class_by_dimensions(LENGTH_DIMENSIONS / TIME_DIMENSIONS * TIME_DIMENSIONS), LengthQuantity)
+        self.assertIsNone(find_quantity_class_by_dimensions(Dimensions({"L": 7})))
+
+    def test_multiplication_result_class(self):
+        power = VoltageQuantity(5.0) * ElectricCurrentQuantity(200.0, ElectricCurrentUnits.MILLIAMPERE.value)
+        self.assertIsInstance(power, PowerQuantity)
+        self.assertAlmostEqual(power.convert_to(PowerUnits.WATT.value).value, 1.0)
+        energy = PowerQuantity(2.0, PowerUnits.KILOWATT.value) * TimeQuantity(1.0, TimeUnits.HOUR.value)
+        self.assertIsInstance(energy, EnergyQuantity)
+        self.assertAlmostEqual(energy.convert_to(EnergyUnits.KILOWATT_HOUR.value).value, 2.0)
+
+    def test_division_result_class(self):
+        current = PowerQuantity(10.0) / VoltageQuantity(5.0)
+        self.assertIsInstance(current, ElectricCurrentQuantity)
+        self.assertAlmostEqual(current.convert_to(ElectricCurrentUnits.AMPERE.value).value, 2.0)
+        resistance = VoltageQuantity(10.0) / ElectricCurrentQuantity(2.0)
+        self.assertIsInstance(resistance, ResistanceQuantity)
+
+    def test_unknown_dimensions_keep_left_class(self):
+        result = VoltageQuantity(1.0) * TimeQuantity(2.0)
+        self.assertIsInstance(result, VoltageQuantity)
+
+    def test_convert_to_equivalent_unit(self):
+        power = VoltageQuantity(2.0) * ElectricCurrentQuantity(3.0)
+        in_watts = power.convert_to(PowerUnits.WATT.value)
+        self.assertEqual(in_watts.value, 6.0)
+        self.assertIs(in_watts.unit, PowerUnits.WATT.value)
+
+    def test_component_results(self):
+        component = Component('led', voltage=VoltageQuantity(2000.0, VoltageUnits.MILLIVOLT.value),
+                              current=ElectricCurrentQuantity(10.0, ElectricCurrentUnits.MILLIAMPERE.value))
+        self.assertIsInstance(component.power, PowerQuantity)
+        self.assertIs(component.power.unit, PowerUnits.WATT.value)
+        self.assertAlmostEqual(component.power.value, 0.02)
+        energy = component.energy_consumption(TimeQuantity(1.0, TimeUnits.MINUTE.value))
+        self.assertIsInstance(energy, EnergyQuantity)
+        self.assertAlmostEqual(energy.value, 1.2)
+
+if __name__ == '__main__':
+    unittest.main()
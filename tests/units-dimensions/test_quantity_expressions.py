@@ -0,0 +1,71 @@
+import unittest
+
+from core.physical_quantities import *
+from core.quantity_expressions import LazyExpression, lazy
+from core.unit import *
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class TestQuantityExpressions(unittest.TestCase):
+
+    def setUp(self):
+        self.voltage = VoltageQuantity(5.0)
+        self.current = ElectricCurrentQuantity(200.0, ElectricCurrentUnits.MILLIAMPERE.value)
+        self.static_power = PowerQuantity(250.0, PowerUnits.MILLIWATT.value)
+
+    def test_expression_is_abstract(self):
+        with self.assertRaises(TypeError):
+            LazyExpression(Dimensions())
+
+    def test_operators_build_a_tree(self):
+        expression = (lazy(self.voltage) * self.current) / 0.8 + self.static_power
+        self.assertIsInstance(expression, LazyExpression)
+        self.assertIs(expression.dimensions, POWER_DIMENSIONS)
+        self.assertIsInstance(self.static_power + expression, LazyExpression)
+
+    def test_matches_eager_arithmetic(self):
+        eager = self.voltage * self.current + self.static_power
+        result = (self.voltage.lazy() * self.current + self.static_power).evaluate()
+        self.assertIsInstance(result, PowerQuantity)
+        self.assertIs(result.unit, eager.unit)
+        self.assertAlmostEqual(result.value, eager.value)
+
+    def test_unit_factors_are_folded(self):
+        expression = (lazy(self.voltage) * self.current) / 0.8 + self.static_power
+        self.assertAlmostEqual(expression.scale, 1e-3)
+        result = expression.evaluate(PowerUnits.WATT.value)
+        self.assertIsInstance(result, PowerQuantity)
+        self.assertAlmostEqual(result.value, 1.5)
+
+    def test_dimensionless_result(self):
+        ratio = lazy(self.current) / ElectricCurrentQuantity(1.0)
+        self.assertAlmostEqual(ratio.evaluate().base_value, 0.2)
+        self.assertAlmostEqual((2 * lazy(self.voltage) - self.voltage).evaluate().value, 5.0)
+
+    def test_dimension_errors(self):
+        with self.assertRaises(ValueError):
+            lazy(self.voltage) + self.current
+        with self.assertRaises(ValueError):
+            (lazy(self.voltage) * self.current).evaluate(VoltageUnits.VOLT.value)
+        with self.assertRaises(ValueError):
+            (lazy(TemperatureQuantity(20.0, TemperatureUnits.CELSIUS.value)) * 2).evaluate()
+        with self.assertRaises(TypeError):
+            lazy(5.0)
+        with self.assertRaises(TypeError):
+            lazy(self.voltage) * 'x'
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_arrays(self):
+        voltages = VoltageQuantity(np.array([3.3, 5.0, 12.0]))
+        efficiencies = np.array([0.9, 0.8, 0.75])
+        expression = (voltages.lazy() * self.current) / efficiencies + self.static_power
+        result = expression.evaluate(PowerUnits.WATT.value)
+        expected = np.array([3.3, 5.0, 12.0]) * 0.2 / efficiencies + 0.25
+        np.testing.assert_allclose(result.value, expected)
+        self.assertIsInstance(efficiencies * voltages.lazy(), LazyExpression)
+
+if __name__ == '__main__':
+    unittest.main()
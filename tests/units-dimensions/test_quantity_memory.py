@@ -0,0 +1,60 @@
+import copy
+import pickle
+import sys
+import tracemalloc
+import unittest
+
+from core.physical_quantities import *
+from core.unit import *
+
+# Per-instance memory budget of a quantity (object only, value excluded).
+# With __slots__ = ('_value', '_unit', '_base_value') an instance is 56 bytes on
+# 64-bit CPython; the previous layout (instance __dict__ plus an embedded
+# conversion manager reference) was about 100 bytes per instance.
+QUANTITY_SIZE_BUDGET = 56
+# Average traced bytes per instance when building many quantities, including
+# the float value and the list slot that holds each quantity.
+QUANTITY_TRACED_BUDGET = 72
+
+class TestQuantityMemory(unittest.TestCase):
+
+    def test_no_instance_dict(self):
+        for quantity_class in QUANTITY_CLASS_BY_TYPE.values():
+            quantity = quantity_class(1.0)
+            self.assertFalse(hasattr(quantity, '__dict__'), quantity_class.__name__)
+            with self.assertRaises(AttributeError):
+                quantity.extra = 1
+
+    def test_instance_size(self):
+        self.assertLessEqual(sys.getsizeof(VoltageQuantity(1.0)), QUANTITY_SIZE_BUDGET)
+
+    def test_traced_memory_per_instance(self):
+        count = 100000
+        values = [i + 0.5 for i in range(count)]
+        unit = VoltageUnits.MILLIVOLT.value
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            quantities = [VoltageQuantity(value, unit) for value in values]
+            after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(len(quantities), count)
+        self.assertLessEqual((after - before) / count, QUANTITY_TRACED_BUDGET)
+
+    def test_units_are_shared(self):
+        first = LengthQuantity(1.0, LengthUnits.KILOMETER.value)
+        second = LengthQuantity(2.0, LengthUnits.KILOMETER.value)
+        self.assertIs(first.unit, second.unit)
+        self.assertIs(first.conversion_manager, second.conversion_manager)
+
+    def test_copy_and_pickle(self):
+        quantity = TemperatureQuantity(25.0, TemperatureUnits.CELSIUS.value)
+        for clone in (copy.copy(quantity), copy.deepcopy(quantity), pickle.loads(pickle.dumps(quantity))):
+            self.assertIsInstance(clone, TemperatureQuantity)
+            self.assertEqual(clone.value, 25.0)
+            self.assertIs(clone.unit, quantity.unit)
+        self.assertAlmostEqual(quantity.convert_to(TemperatureUnits.KELVIN.value).value, 298.15)
+
+if __name__ == '__main__':
+    unittest.main()
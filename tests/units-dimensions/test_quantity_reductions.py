@@ -0,0 +1,90 @@
+import unittest
+from unittest import mock
+
+from core.physical_quantities import *
+from core.unit import *
+
+class TestQuantityReductions(unittest.TestCase):
+
+    def setUp(self):
+        self.currents = [
+            ElectricCurrentQuantity(1.0),
+            ElectricCurrentQuantity(250.0, ElectricCurrentUnits.MILLIAMPERE.value),
+            ElectricCurrentQuantity(0.5),
+            ElectricCurrentQuantity(750.0, ElectricCurrentUnits.MILLIAMPERE.value),
+        ]
+
+    def test_sum(self):
+        total = ElectricCurrentQuantity.sum(self.currents)
+        self.assertIsInstance(total, ElectricCurrentQuantity)
+        self.assertIs(total.unit, ElectricCurrentUnits.AMPERE.value)
+        self.assertAlmostEqual(total.value, 2.5)
+        total = BaseQuantity.sum(iter(self.currents), ElectricCurrentUnits.MILLIAMPERE.value)
+        self.assertIsInstance(total, ElectricCurrentQuantity)
+        self.assertAlmostEqual(total.value, 2500.0)
+
+    def test_builtin_sum(self):
+        total = sum(self.currents)
+        self.assertIsInstance(total, ElectricCurrentQuantity)
+        self.assertAlmostEqual(total.value, 2.5)
+
+    def test_one_conversion_per_unit(self):
+        currents = self.currents * 1000
+        with mock.patch.object(BaseQuantity, 'convert_to', side_effect=AssertionError('Unexpected conversion')):
+            total = ElectricCurrentQuantity.sum(currents)
+        self.assertAlmostEqual(total.value, 2500.0)
+
+    def test_compensated_summation(self):
+        values = [PowerQuantity(1e16), PowerQuantity(1.0), PowerQuantity(-1e16)] * 10
+        self.assertEqual(PowerQuantity.sum(values).value, 10.0)
+
+    def test_mean(self):
+        self.assertAlmostEqual(ElectricCurrentQuantity.mean(self.currents).value, 0.625)
+        temperatures = [TemperatureQuantity(0.0, TemperatureUnits.CELSIUS.value), TemperatureQuantity(283.15)]
+        mean = TemperatureQuantity.mean(temperatures)
+        self.assertIs(mean.unit, TemperatureUnits.CELSIUS.value)
+        self.assertAlmostEqual(mean.value, 5.0)
+
+    def test_affine_temperatures(self):
+        celsius = TemperatureUnits.CELSIUS.value
+        kelvin = TemperatureUnits.KELVIN.value
+        mixed = [TemperatureQuantity(0.0, celsius), TemperatureQuantity(32.0, TemperatureUnits.FAHRENHEIT.value), TemperatureQuantity(300.0)]
+        with self.assertRaises(ValueError):
+            TemperatureQuantity.sum(mixed)
+        with self.assertRaises(ValueError):
+            TemperatureQuantity.sum(mixed, kelvin)
+        with self.assertRaises(ValueError):
+            TemperatureQuantity.sum([TemperatureQuantity(20.0, celsius), TemperatureQuantity(30.0, celsius)], kelvin)
+        with self.assertRaises(ValueError):
+            TemperatureQuantity.sum([TemperatureQuantity(300.0)], celsius)
+        self.assertAlmostEqual(TemperatureQuantity.sum([TemperatureQuantity(300.0), TemperatureQuantity(10.0)]).value, 310.0)
+        # The mean is the same temperature whatever unit it is reported in
+        self.assertAlmostEqual(TemperatureQuantity.mean(mixed).value, 8.95)
+        self.assertAlmostEqual(TemperatureQuantity.mean(mixed, kelvin).value, 282.1)
+        self.assertAlmostEqual(TemperatureQuantity.mean(mixed, TemperatureUnits.FAHRENHEIT.value).value, 48.11)
+
+    def test_min_max(self):
+        smallest = ElectricCurrentQuantity.min(self.currents)
+        self.assertIs(smallest.unit, ElectricCurrentUnits.MILLIAMPERE.value)
+        self.assertEqual(smallest.value, 250.0)
+        largest = ElectricCurrentQuantity.max(self.currents)
+        self.assertIs(largest.unit, ElectricCurrentUnits.AMPERE.value)
+        self.assertEqual(largest.value, 1.0)
+
+    def test_compound_units(self):
+        speeds = [LengthQuantity(36.0, LengthUnits.KILOMETER.value / TimeUnits.HOUR.value),
+                  LengthQuantity(5.0, LengthUnits.METER.value / TimeUnits.SECOND.value)]
+        self.assertAlmostEqual(LengthQuantity.sum(speeds).value, 54.0)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            PowerQuantity.sum([])
+        with self.assertRaises(TypeError):
+            BaseQuantity.sum([PowerQuantity(1.0), VoltageQuantity(1.0)])
+        with self.assertRaises(TypeError):
+            PowerQuantity.sum([1.0])
+        with self.assertRaises(TypeError):
+            sum([PowerQuantity(1.0)], 1)
+
+if __name__ == '__main__':
+    unittest.main()
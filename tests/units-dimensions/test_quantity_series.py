@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+
+from core.physical_quantities import *
+from core.unit import *
+
+try:
+    import numpy as np
+    from core.quantity_series import QuantitySeries
+except ImportError:
+    np = None
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class TestQuantitySeries(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'currents.pqs')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_header(self):
+        with QuantitySeries.create(self.path, ElectricCurrentUnits.MILLIAMPERE.value, start=1000.0, interval=0.5):
+            pass
+        with QuantitySeries.open(self.path) as series:
+            self.assertIs(series.unit, ElectricCurrentUnits.MILLIAMPERE.value)
+            self.assertEqual(series.quantity_type, 'electric_current')
+            self.assertIs(series.quantity_class, ElectricCurrentQuantity)
+            self.assertEqual(series.dtype, np.float64)
+            self.assertEqual(series.start, 1000.0)
+            self.assertEqual(series.interval, 0.5)
+            self.assertEqual(len(series), 0)
+            self.assertEqual(len(series.array()), 0)
+        self.assertEqual(os.path.getsize(self.path) % 64, 0)
+
+    def test_append_and_read(self):
+        with QuantitySeries.create(self.path, ElectricCurrentUnits.MILLIAMPERE.value, start=1000.0, interval=0.5) as series:
+            series.append([1.0, 2.0])
+            series.append(QuantityArray([0.003, 0.004], ElectricCurrentUnits.AMPERE.value))
+            self.assertEqual(series.append([ElectricCurrentQuantity(5.0, ElectricCurrentUnits.MILLIAMPERE.value)]), 5)
+            with self.assertRaises(TypeError):
+                series.append(QuantityArray([1.0], VoltageUnits.VOLT.value))
+        with QuantitySeries.open(self.path) as series:
+            samples = series.array()
+            self.assertIsInstance(samples, QuantityArray)
+            np.testing.assert_allclose(samples.values, [1.0, 2.0, 3.0, 4.0, 5.0])
+            self.assertAlmostEqual(series[1:4].mean().value, 3.0)
+            self.assertIsInstance(series[-1], ElectricCurrentQuantity)
+            np.testing.assert_allclose(series.timestamps(), [1000.0, 1000.5, 1001.0, 1001.5, 1002.0])
+            np.testing.assert_allclose(series.timestamps(3), [1001.5, 1002.0])
+            self.assertEqual(series.index_at(1001.2), 2)
+            with self.assertRaises(ValueError):
+                series.append([1.0])
+
+    def test_views_are_memory_mapped(self):
+        with QuantitySeries.create(self.path, VoltageUnits.VOLT.value) as series:
+            series.append(np.arange(1000, dtype=np.float64))
+            view = series[100:200]
+            self.assertIsInstance(view.values.base, np.memmap)
+            self.assertFalse(view.values.flags['WRITEABLE'])
+            self.assertAlmostEqual(view.sum().value, sum(range(100, 200)))
+
+    def test_append_while_reading(self):
+        writer = QuantitySeries.create(self.path, PowerUnits.WATT.value, dtype='float32')
+        reader = QuantitySeries.open(self.path)
+        try:
+            writer.append([1.0, 2.0])
+            before = reader.array()
+            self.assertEqual(len(before), 2)
+            writer.append([3.0])
+            self.assertEqual(len(reader), 3)
+            np.testing.assert_allclose(reader.array().values, [1.0, 2.0, 3.0])
+            np.testing.assert_allclose(before.values, [1.0, 2.0])
+            self.assertEqual(reader.dtype, np.float32)
+        finally:
+            writer.close()
+            reader.close()
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            QuantitySeries.create(self.path, VoltageUnits.VOLT.value, dtype='int32')
+        with self.assertRaises(ValueError):
+            QuantitySeries.create(self.path, VoltageUnits.VOLT.value, quantity_type='electric_current')
+        QuantitySeries.create(self.path, VoltageUnits.VOLT.value).close()
+        with self.assertRaises(FileExistsError):
+            QuantitySeries.create(self.path, VoltageUnits.VOLT.value)
+        QuantitySeries.create(self.path, VoltageUnits.VOLT.value, overwrite=True).close()
+        other = os.path.join(self.directory.name, 'other.bin')
+        with open(other, 'wb') as file:
+            file.write(b'x' * 64)
+        with self.assertRaises(ValueError):
+            QuantitySeries.open(other)
+
+if __name__ == '__main__':
+    unittest.main()
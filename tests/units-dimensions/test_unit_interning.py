@@ -0,0 +1,56 @@
+import copy
+import gc
+import pickle
+import unittest
+import weakref
+
+from core import unit as unit_module
+from core.conversion_managers import base_transform
+from core.unit import *
+
+class TestUnitInterning(unittest.TestCase):
+
+    def test_equal_definitions_are_identical(self):
+        self.assertIs(Unit("meter", "m", LENGTH_DIMENSIONS), LengthUnits.METER.value)
+        self.assertIs(copy.deepcopy(LengthUnits.METER.value), LengthUnits.METER.value)
+        self.assertIs(pickle.loads(pickle.dumps(LengthUnits.METER.value)), LengthUnits.METER.value)
+
+    def test_units_are_hashable(self):
+        volt = VoltageUnits.VOLT.value
+        lookup = {volt: "volt", LengthUnits.METER.value: "meter"}
+        self.assertEqual(lookup[Unit("volt", "V", VOLTAGE_DIMENSIONS)], "volt")
+        newton = ForceUnits.NEWTON.value
+        derived = MassUnits.KILOGRAM.value * LengthUnits.METER.value / TimeUnits.SECOND.value ** 2
+        self.assertEqual(newton, derived)
+        self.assertEqual(hash(newton), hash(derived))
+
+    def test_algebra_results_are_cached(self):
+        volt = VoltageUnits.VOLT.value
+        ampere = ElectricCurrentUnits.AMPERE.value
+        product = volt * ampere
+        self.assertIs(volt * ampere, product)
+        self.assertIs(product / ampere, product / ampere)
+        self.assertIs(volt ** 2, volt ** 2)
+        self.assertEqual(str(volt ** 2), "V^2")
+        self.assertEqual(str(volt ** 2.0), "V^2.0")
+
+    def test_cache_is_bounded(self):
+        unit_module.clear_unit_algebra_cache()
+        meter = LengthUnits.METER.value
+        for power in range(unit_module.UNIT_ALGEBRA_CACHE_SIZE + 10):
+            meter ** power
+        self.assertEqual(len(unit_module._UNIT_ALGEBRA_CACHE), unit_module.UNIT_ALGEBRA_CACHE_SIZE)
+        unit_module.clear_unit_algebra_cache()
+        self.assertEqual(len(unit_module._UNIT_ALGEBRA_CACHE), 0)
+
+    def test_base_transform_cache_does_not_keep_units_alive(self):
+        speed = Unit("kilometer/hour", "km/(hour)", SPEED_DIMENSIONS, {"km": 1, "hour": -1})
+        self.assertAlmostEqual(base_transform(speed).scale, 1 / 3.6)
+        self.assertIs(base_transform(speed), base_transform(speed))
+        reference = weakref.ref(speed)
+        del speed
+        gc.collect()
+        self.assertIsNone(reference())
+
+if __name__ == '__main__':
+    unittest.main()
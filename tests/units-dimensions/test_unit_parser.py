@@ -0,0 +1,71 @@
+import unittest
+from fractions import Fraction
+
+from core.unit import *
+from core.physical_quantities import EnergyQuantity, LengthQuantity
+
+class TestUnitParser(unittest.TestCase):
+
+    def setUp(self):
+        self.meter = LengthUnits.METER.value
+        self.second = TimeUnits.SECOND.value
+
+    def test_registered_symbols(self):
+        self.assertIs(parse_unit("m"), self.meter)
+        self.assertIs(parse_unit("km/h"), SpeedUnits.KILOMETER_PER_HOUR.value)
+        self.assertIs(parse_unit("gal (US)"), find_unit_by_symbol("gal (US)"))
+
+    def test_products_and_quotients(self):
+        self.assertEqual(parse_unit("kg*m/s²"), ForceUnits.NEWTON.value)
+        self.assertEqual(parse_unit("kg*m/s^2"), ForceUnits.NEWTON.value)
+        self.assertEqual(parse_unit("N·m"), EnergyUnits.JOULE.value)
+        self.assertEqual(parse_unit("kg/m/s").dimensions, Dimensions({"M": 1, "L": -1, "T": -1}))
+        self.assertEqual(parse_unit("m/(s*A)").dimensions, Dimensions({"L": 1, "T": -1, "I": -1}))
+
+    def test_powers(self):
+        self.assertEqual(parse_unit("m⁴").dimensions, Dimensions({"L": 4}))
+        self.assertEqual(parse_unit("s⁻¹").dimensions, FREQUENCY_DIMENSIONS)
+        self.assertEqual(parse_unit("(m/s)^2").dimensions, Dimensions({"L": 2, "T": -2}))
+        self.assertEqual(parse_unit("m/s^2").dimensions, ACCELERATION_DIMENSIONS)
+        for expression in ("m^1/2", "m^(1/2)", "m^0.5"):
+            self.assertEqual(parse_unit(expression).terms, (("m", Fraction(1, 2)),))
+
+    def test_algebra_symbols_round_trip(self):
+        kilowatt = PowerUnits.KILOWATT.value
+        ampere = ElectricCurrentUnits.AMPERE.value
+        units = [
+            kilowatt * TimeUnits.HOUR.value,
+            self.meter / (self.second * ampere),
+            (self.meter / self.second) ** 2,
+            self.meter ** 0.5,
+            AreaUnits.SQUARE_METER.value * AreaUnits.SQUARE_METER.value,
+            self.meter * self.meter * self.meter,
+        ]
+        for unit in units:
+            parsed = parse_unit(unit.symbol)
+            self.assertEqual(parsed.dimensions, unit.dimensions, unit.symbol)
+            self.assertEqual(parsed.scale, unit.scale, unit.symbol)
+
+    def test_invalid_expressions(self):
+        for expression in ("", "m*", "xyz", "m^", "(m/s", "m)"):
+            with self.assertRaises(ValueError):
+                parse_unit(expression)
+
+    def test_results_are_cached(self):
+        self.assertIs(parse_unit("kg*m/s²"), parse_unit("kg*m/s²"))
+        parse_unit.cache_clear()
+        parse_unit("kW*hour")
+        parse_unit("kW*hour")
+        self.assertEqual(parse_unit.cache_info().hits, 1)
+
+    def test_from_json_string_with_compound_unit(self):
+        energy = EnergyQuantity(2.0, PowerUnits.KILOWATT.value * TimeUnits.HOUR.value)
+        restored = EnergyQuantity.from_json_string(energy.to_json_string())
+        self.assertEqual(restored.value, 2.0)
+        self.assertEqual(restored.unit, energy.unit)
+        self.assertAlmostEqual(restored.convert_to(EnergyUnits.JOULE.value).value, 7.2e6)
+        length = LengthQuantity.from_json_string(LengthQuantity(3.0, LengthUnits.INCH.value).to_json_string())
+        self.assertIs(length.unit, LengthUnits.INCH.value)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -79,6 +79,10 @@ class TestUnits(unittest.TestCase):
     def test_dimensionless_units2(self):
         test_unit1 = AngleUnits.RADIAN.value / AngleUnits.ARC_MINUTE.value
         self.assertTrue(test_unit1.is_dimensionless())
+
+    def test_unique_symbols(self):
+        symbols = [member.value.symbol for enum_class in UNIT_ENUM_BY_QUANTITY.values() for member in enum_class.__members__.values()]
+        self.assertEqual(len(symbols), len(set(symbols)))
     
     
     # def test_div_dimension2(self):